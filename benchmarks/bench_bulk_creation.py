@@ -0,0 +1,60 @@
+"""
+Bulk Creation Benchmark
+
+Times creating N objects with one sentence per object ("draw a red cube at
+[x, 0, z]") versus a single bulk sentence ("draw N red cubes in a grid"),
+both through SentenceInterpreter with a NullRenderer.
+
+Usage:
+    python benchmarks/bench_bulk_creation.py --objects 500
+"""
+
+import argparse
+import math
+import sys
+import time
+
+from engraf.interpreter.sentence_interpreter import SentenceInterpreter
+from engraf.visualizer.renderers.null_renderer import NullRenderer
+
+
+def per_object_sentences(count: int):
+    """Create count cubes with one sentence each; return (seconds, objects in the scene)."""
+    interpreter = SentenceInterpreter(renderer=NullRenderer())
+    columns = math.ceil(math.sqrt(count))
+    sentences = [f"draw a red cube at [{(i % columns) * 2 + 1}, 1, {(i // columns) * 2 + 1}]" for i in range(count)]
+
+    start = time.perf_counter()
+    for sentence in sentences:
+        interpreter.interpret(sentence)
+    elapsed = time.perf_counter() - start
+    return elapsed, len(interpreter.scene.entities)
+
+
+def bulk_sentence(count: int):
+    """Create count cubes with one bulk sentence; return (seconds, objects in the scene)."""
+    interpreter = SentenceInterpreter(renderer=NullRenderer())
+
+    start = time.perf_counter()
+    interpreter.interpret(f"draw {count} red cubes in a grid")
+    elapsed = time.perf_counter() - start
+    return elapsed, len(interpreter.scene.entities)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--objects', type=int, default=500)
+    args = parser.parse_args(argv)
+
+    single, single_count = per_object_sentences(args.objects)
+    bulk, bulk_count = bulk_sentence(args.objects)
+
+    print(f"objects requested:    {args.objects}")
+    print(f"one sentence each:    {single * 1000:9.1f} ms ({single_count} created)")
+    print(f"one bulk sentence:    {bulk * 1000:9.1f} ms ({bulk_count} created)")
+    print(f"speedup:              {single / bulk:9.1f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,82 @@
+"""
+Import Time Benchmark
+
+Measures the cold import time of a module (engraf.interpreter by default) in
+fresh interpreters, lists the slowest imports reported by -X importtime, and
+checks that heavy optional packages (vpython by default) were not loaded.
+Exits 1 if one of them was.
+
+Usage:
+    python benchmarks/bench_import.py --module engraf.interpreter --repeat 5 --top 15
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_python(code: str, *options: str) -> subprocess.CompletedProcess:
+    """Run code in a fresh interpreter with the repository on the path."""
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [REPO_ROOT, env.get('PYTHONPATH')]))
+    return subprocess.run([sys.executable, *options, '-c', code], env=env,
+                          capture_output=True, text=True, check=True)
+
+
+def import_time(module: str) -> float:
+    """Import module in a fresh interpreter and return the seconds it took."""
+    code = (f"import time; start = time.perf_counter(); import {module}; "
+            f"print(time.perf_counter() - start)")
+    return float(run_python(code).stdout.strip())
+
+
+def slowest_imports(module: str, top: int):
+    """Return the top (cumulative_us, name) pairs from -X importtime."""
+    entries = []
+    for line in run_python(f"import {module}", '-X', 'importtime').stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|', 2)
+        entries.append((int(cumulative), name.strip()))
+    return sorted(entries, reverse=True)[:top]
+
+
+def loaded_modules(module: str, candidates):
+    """Return which candidate top-level packages importing module loads."""
+    code = (f"import sys; import {module}; "
+            f"print(','.join(m for m in {list(candidates)!r} if m in sys.modules))")
+    output = run_python(code).stdout.strip()
+    return output.split(',') if output else []
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--module', default='engraf.interpreter')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--top', type=int, default=15)
+    parser.add_argument('--forbid', nargs='*', default=['vpython'],
+                        help="Packages that must not be loaded by the import")
+    args = parser.parse_args(argv)
+
+    times = [import_time(args.module) for _ in range(args.repeat)]
+    print(f"import {args.module}: median {statistics.median(times) * 1000:.1f} ms, "
+          f"min {min(times) * 1000:.1f} ms over {args.repeat} runs")
+
+    print("slowest imports (cumulative):")
+    for cumulative, name in slowest_imports(args.module, args.top):
+        print(f"  {cumulative / 1000:8.1f} ms  {name}")
+
+    loaded = loaded_modules(args.module, args.forbid)
+    if loaded:
+        print(f"FAIL: importing {args.module} loaded {', '.join(loaded)}")
+        return 1
+    print(f"not loaded: {', '.join(args.forbid)}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
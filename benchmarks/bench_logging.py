@@ -0,0 +1,86 @@
+"""
+Logging Overhead Benchmark
+
+Measures bulk object-creation throughput through ObjectCreator with library
+logging quiet (the default) versus enabled at INFO. Enabled output goes to
+os.devnull by default so the numbers measure formatting and handler cost
+rather than terminal speed; pass --stream stderr to include console I/O.
+
+Usage:
+    python benchmarks/bench_logging.py --objects 5000 --repeat 3
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+from engraf.interpreter.handlers.object_creator import ObjectCreator
+from engraf.visualizer.scene.scene_model import SceneModel
+from latn.lexer.vector_space import VectorSpace
+
+
+def create_objects(count: int) -> float:
+    """Create count cubes in a fresh scene and return objects per second."""
+    scene = SceneModel()
+    creator = ObjectCreator(scene, [0])
+    shapes = ['cube', 'sphere', 'cylinder', 'cone']
+
+    start = time.perf_counter()
+    for i in range(count):
+        vector = VectorSpace()
+        vector['red'] = 1.0
+        creator.create_scene_object({
+            'type': shapes[i % len(shapes)],
+            'determiner': 'a',
+            'adjectives': ['red'],
+            'vector_space': vector,
+            'custom_name': None
+        })
+    elapsed = time.perf_counter() - start
+    return count / elapsed if elapsed > 0 else float('inf')
+
+
+def best_of(count: int, repeat: int) -> float:
+    return max(create_objects(count) for _ in range(repeat))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Bulk creation throughput with logging off vs on")
+    parser.add_argument('--objects', type=int, default=5000, help="Objects created per run")
+    parser.add_argument('--repeat', type=int, default=3, help="Runs per configuration (best is reported)")
+    parser.add_argument('--stream', choices=['devnull', 'stderr'], default='devnull',
+                        help="Where enabled logging is written")
+    args = parser.parse_args(argv)
+
+    engraf_logger = logging.getLogger('engraf')
+
+    quiet = best_of(args.objects, args.repeat)
+
+    if args.stream == 'stderr':
+        stream = sys.stderr
+    else:
+        stream = open(os.devnull, 'w')
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
+    previous_level = engraf_logger.level
+    engraf_logger.addHandler(handler)
+    engraf_logger.setLevel(logging.INFO)
+    try:
+        verbose = best_of(args.objects, args.repeat)
+    finally:
+        engraf_logger.removeHandler(handler)
+        engraf_logger.setLevel(previous_level)
+        if stream is not sys.stderr:
+            stream.close()
+
+    print(f"objects per run:      {args.objects}")
+    print(f"logging off:          {quiet:,.0f} objects/sec")
+    print(f"logging on (INFO):    {verbose:,.0f} objects/sec ({args.stream})")
+    print(f"overhead:             {(quiet / verbose - 1.0) * 100.0:.1f}%")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
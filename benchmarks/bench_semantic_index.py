@@ -0,0 +1,86 @@
+"""
+Semantic Search Benchmark
+
+Compares exact and approximate (LSH) find_noun_phrase on a large scene of
+mixed object types, for a query with no exact noun ("the object like a big
+red box"), and reports the approximate search's recall of the exact top 10.
+
+Usage:
+    python benchmarks/bench_semantic_index.py --objects 20000 --tables 8 --bits 12 --probe 1
+"""
+
+import argparse
+import random
+import sys
+import time
+from types import SimpleNamespace
+
+from engraf.visualizer.scene.scene_model import SceneModel
+from engraf.visualizer.scene.scene_object import SceneObject
+from latn.lexer.vector_space import VectorSpace
+
+
+def build_scene(count: int, seed: int = 0) -> SceneModel:
+    """Build a scene of count objects with random types, colors, sizes and positions."""
+    rng = random.Random(seed)
+    scene = SceneModel()
+    for i in range(count):
+        name = rng.choice(['cube', 'sphere', 'cylinder', 'cone'])
+        vector = VectorSpace()
+        vector['noun'] = 1.0
+        vector['red'], vector['green'], vector['blue'] = rng.random(), rng.random(), rng.random()
+        scale = rng.uniform(0.5, 2.5)
+        vector['scaleX'] = vector['scaleY'] = vector['scaleZ'] = scale
+        vector['locX'] = rng.uniform(-10, 10)
+        vector['locY'] = rng.uniform(-10, 10)
+        scene.add_object(SceneObject(name=name, vector=vector, object_id=f'{name}-{i}'))
+    return scene
+
+
+def time_queries(scene: SceneModel, noun_phrase, repeat: int):
+    matches = scene.find_noun_phrase(noun_phrase)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        scene.find_noun_phrase(noun_phrase)
+    return matches, (time.perf_counter() - start) / repeat
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Exact vs approximate semantic search in find_noun_phrase")
+    parser.add_argument('--objects', type=int, default=20000, help="Objects in the scene")
+    parser.add_argument('--repeat', type=int, default=5, help="Queries timed per mode")
+    parser.add_argument('--tables', type=int, default=8, help="LSH hash tables")
+    parser.add_argument('--bits', type=int, default=12, help="Hyperplanes per table")
+    parser.add_argument('--probe', type=int, default=1, choices=[0, 1], help="Multi-probe radius")
+    args = parser.parse_args(argv)
+
+    scene = build_scene(args.objects)
+    query = VectorSpace()
+    query['noun'] = 1.0
+    query['red'] = 1.0
+    query['scaleX'] = query['scaleY'] = query['scaleZ'] = 2.0
+    noun_phrase = SimpleNamespace(noun='object', vector=query, pronoun=None)
+
+    scene.ann_threshold = args.objects + 1
+    exact, exact_time = time_queries(scene, noun_phrase, args.repeat)
+
+    start = time.perf_counter()
+    scene.enable_semantic_index(num_tables=args.tables, num_bits=args.bits, probe_radius=args.probe)
+    build_time = time.perf_counter() - start
+    scene.ann_threshold = 0
+    approximate, approximate_time = time_queries(scene, noun_phrase, args.repeat)
+
+    top = {obj.object_id for _, obj in exact[:10]}
+    found = {obj.object_id for _, obj in approximate}
+    recall = len(top & found) / len(top) if top else 1.0
+
+    print(f"objects:         {args.objects}")
+    print(f"exact:           {exact_time * 1e3:,.1f} ms per query, {len(exact)} matches")
+    print(f"index build:     {build_time * 1e3:,.1f} ms")
+    print(f"approximate:     {approximate_time * 1e3:,.1f} ms per query, {len(approximate)} matches")
+    print(f"recall@10:       {recall:.0%}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
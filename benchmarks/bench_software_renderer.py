@@ -0,0 +1,66 @@
+"""
+Software Renderer Benchmark
+
+Times SoftwareRenderer drawing a grid of N objects of every supported shape,
+optionally writing the snapshot to a PNG file.
+
+Usage:
+    python benchmarks/bench_software_renderer.py --objects 3000 --png /tmp/scene.png
+"""
+
+import argparse
+import math
+import sys
+import time
+
+from engraf.visualizer.renderers.shape_meshes import scene_triangles
+from engraf.visualizer.renderers.software_renderer import SoftwareRenderer
+from engraf.visualizer.scene.scene_object import SceneObject
+from latn.lexer.vector_space import VectorSpace
+
+SHAPES = ["cube", "sphere", "cylinder", "cone", "pyramid", "arch", "table"]
+
+
+def build_renderer(count: int, width: int, height: int) -> SoftwareRenderer:
+    """Create a renderer holding count objects laid out on the ground plane."""
+    renderer = SoftwareRenderer(width=width, height=height)
+    columns = math.ceil(math.sqrt(count))
+    for i in range(count):
+        vector = VectorSpace()
+        vector['locX'] = (i % columns - columns / 2) * 1.5
+        vector['locZ'] = -(i // columns) * 1.5
+        vector['scaleX'] = vector['scaleY'] = vector['scaleZ'] = 1.0
+        vector['red'], vector['green'], vector['blue'] = (i % 7) / 7, 0.5, 1 - (i % 5) / 5
+        vector['rotY'] = i * 7.0
+        renderer.render_object(SceneObject(SHAPES[i % len(SHAPES)], vector, object_id=f"obj-{i}"))
+    renderer.set_camera((0.0, columns, columns), (0.0, 0.0, -columns * 0.75))
+    return renderer
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--objects', type=int, default=3000)
+    parser.add_argument('--width', type=int, default=800)
+    parser.add_argument('--height', type=int, default=600)
+    parser.add_argument('--png', help="Also write the image to this path")
+    args = parser.parse_args(argv)
+
+    renderer = build_renderer(args.objects, args.width, args.height)
+    triangles = len(scene_triangles(list(renderer.objects.values()))[0])
+
+    start = time.perf_counter()
+    if args.png:
+        renderer.save_png(args.png)
+    else:
+        renderer.render_image()
+    elapsed = time.perf_counter() - start
+
+    print(f"objects:     {args.objects}")
+    print(f"triangles:   {triangles}")
+    print(f"image:       {args.width}x{args.height}")
+    print(f"render time: {elapsed * 1000:9.1f} ms")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
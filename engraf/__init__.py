@@ -0,0 +1,8 @@
+"""
+ENGRAF: natural-language construction of 3D scenes.
+"""
+
+import logging
+
+# Library logging is silent unless the application configures a handler
+logging.getLogger(__name__).addHandler(logging.NullHandler())
@@ -0,0 +1,15 @@
+"""
+ENGRAF Diagnostics Package
+
+This package contains opt-in instrumentation for measuring where the time
+goes when interpreting commands: aggregate stage timings and Chrome
+trace-event export.
+"""
+
+from .stage_timer import StageTimer, NullStageTimer, LatencyHistogram
+from .tracing import Tracer, NullTracer, get_tracer, enable_tracing, disable_tracing
+
+__all__ = [
+    'StageTimer', 'NullStageTimer', 'LatencyHistogram',
+    'Tracer', 'NullTracer', 'get_tracer', 'enable_tracing', 'disable_tracing'
+]
@@ -0,0 +1,187 @@
+"""
+Stage Timing for ENGRAF
+
+This module provides high-resolution timing of the named stages a command
+passes through (parse, validate, execute, render, ...). Each command's
+timings are returned as a flat dict of milliseconds per stage, and every
+stage also feeds a rolling latency histogram that can be queried at runtime.
+
+Timing is opt-in. NullStageTimer has the same interface but does nothing, and
+its stage() returns one shared no-op context manager, so instrumented code
+costs a method call per stage when timing is disabled.
+"""
+
+import time
+from collections import deque
+from typing import Dict, Optional
+
+import numpy as np
+
+
+class LatencyHistogram:
+    """
+    Rolling window of latency samples (in milliseconds) with percentile queries.
+    """
+
+    def __init__(self, window: int = 1000):
+        """
+        Initialize the histogram.
+
+        Args:
+            window: Number of most recent samples kept for percentile queries
+        """
+        self.samples = deque(maxlen=window)
+        self.count = 0  # Total samples ever recorded, including evicted ones
+
+    def record(self, value_ms: float) -> None:
+        """Add a latency sample."""
+        self.samples.append(value_ms)
+        self.count += 1
+
+    def percentile(self, p: float) -> Optional[float]:
+        """Get the p-th percentile (0-100) of the current window, or None if empty."""
+        if not self.samples:
+            return None
+        return float(np.percentile(np.fromiter(self.samples, dtype=float), p))
+
+    def summary(self) -> Dict[str, Optional[float]]:
+        """Get count, mean, max and the p50/p90/p99 percentiles of the current window."""
+        if not self.samples:
+            return {'count': self.count, 'mean': None, 'max': None, 'p50': None, 'p90': None, 'p99': None}
+
+        values = np.fromiter(self.samples, dtype=float)
+        p50, p90, p99 = np.percentile(values, [50, 90, 99])
+        return {
+            'count': self.count,
+            'mean': float(values.mean()),
+            'max': float(values.max()),
+            'p50': float(p50),
+            'p90': float(p90),
+            'p99': float(p99)
+        }
+
+
+class _Stage:
+    """Context manager that times one stage into its StageTimer."""
+
+    __slots__ = ('timer', 'name', 'start')
+
+    def __init__(self, timer: 'StageTimer', name: str):
+        self.timer = timer
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.timer.record(self.name, (time.perf_counter() - self.start) * 1000.0)
+        return False
+
+
+class _NullStage:
+    """Shared do-nothing context manager used when timing is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class StageTimer:
+    """
+    Times the stages of one command at a time and aggregates them per stage.
+
+    Usage:
+        timer.begin()
+        with timer.stage('parse'):
+            ...
+        timings = timer.finish()   # {'parse': 1.23, 'total': 1.30}
+    """
+
+    enabled = True
+
+    def __init__(self, window: int = 1000):
+        """
+        Initialize the stage timer.
+
+        Args:
+            window: Number of recent commands each stage histogram keeps
+        """
+        self.window = window
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self._timings: Dict[str, float] = {}
+        self._start = 0.0
+
+    def begin(self) -> None:
+        """Start timing a new command."""
+        self._timings = {}
+        self._start = time.perf_counter()
+
+    def stage(self, name: str) -> _Stage:
+        """Get a context manager that times the named stage of the current command."""
+        return _Stage(self, name)
+
+    def record(self, name: str, elapsed_ms: float) -> None:
+        """Add elapsed time to a stage. Repeated stages within a command accumulate."""
+        self._timings[name] = self._timings.get(name, 0.0) + elapsed_ms
+
+    def finish(self) -> Dict[str, float]:
+        """
+        Finish the current command.
+
+        Returns:
+            Milliseconds per stage for this command, plus a 'total' entry
+        """
+        timings = self._timings
+        timings['total'] = (time.perf_counter() - self._start) * 1000.0
+
+        for name, elapsed_ms in timings.items():
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = LatencyHistogram(self.window)
+            histogram.record(elapsed_ms)
+
+        self._timings = {}
+        return timings
+
+    def report(self) -> Dict[str, Dict[str, Optional[float]]]:
+        """Get the rolling latency summary of every stage seen so far."""
+        return {name: histogram.summary() for name, histogram in self.histograms.items()}
+
+    def reset(self) -> None:
+        """Forget all aggregated latencies."""
+        self.histograms.clear()
+
+
+class NullStageTimer:
+    """
+    StageTimer stand-in that records nothing. Used when timing is disabled.
+    """
+
+    enabled = False
+
+    def begin(self) -> None:
+        pass
+
+    def stage(self, name: str) -> _NullStage:
+        return _NULL_STAGE
+
+    def record(self, name: str, elapsed_ms: float) -> None:
+        pass
+
+    def finish(self) -> None:
+        return None
+
+    def report(self) -> Dict[str, Dict[str, Optional[float]]]:
+        return {}
+
+    def reset(self) -> None:
+        pass
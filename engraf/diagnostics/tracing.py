@@ -0,0 +1,223 @@
+"""
+Trace-Event Export for ENGRAF
+
+This module records nested timing spans in the Chrome trace-event format, so
+a slow interpreter or dataset-generation session can be opened in
+chrome://tracing or Perfetto (ui.perfetto.dev) to see the critical path
+without attaching a profiler.
+
+Spans are kept in a bounded ring buffer (the most recent events win) and are
+written to a local JSON file by flush(). Tracing is process-wide: code asks
+get_tracer() for the active tracer, which is a do-nothing NullTracer until
+enable_tracing() is called.
+
+Usage:
+    from engraf.diagnostics.tracing import enable_tracing, get_tracer
+
+    tracer = enable_tracing("session.trace.json")
+    with get_tracer().span("interpret", sentence="draw a cube") as span:
+        ...
+        span.set("scene_size", 12)
+    tracer.flush()
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+
+class _Span:
+    """Context manager that records one complete ('X') trace event."""
+
+    __slots__ = ('tracer', 'name', 'args', 'start')
+
+    def __init__(self, tracer: 'Tracer', name: str, args: Dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+        self.start = 0
+
+    def set(self, key: str, value: Any) -> None:
+        """Attach an argument discovered while the span is open (e.g. a hypothesis count)."""
+        self.args[key] = value
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        end = time.perf_counter_ns()
+        if exc_type is not None:
+            self.args['error'] = exc_type.__name__
+        self.tracer._add_complete_event(self.name, self.start, end, self.args)
+        return False
+
+
+class _NullSpan:
+    """Shared do-nothing span used when tracing is disabled."""
+
+    __slots__ = ()
+
+    def set(self, key: str, value: Any) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """
+    Records spans into a ring buffer and flushes them as trace-event JSON.
+    """
+
+    enabled = True
+
+    def __init__(self, path: str = "engraf_trace.json", capacity: int = 100000, category: str = "engraf"):
+        """
+        Initialize the tracer.
+
+        Args:
+            path: File written by flush() when no explicit path is given
+            capacity: Maximum number of events kept; older events are dropped
+            category: Trace-event category attached to every span
+        """
+        self.path = path
+        self.category = category
+        self.events = deque(maxlen=capacity)
+        self.dropped = 0
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+
+    def span(self, name: str, **args) -> _Span:
+        """Get a context manager that records a span with the given arguments."""
+        return _Span(self, name, args)
+
+    def instant(self, name: str, **args) -> None:
+        """Record a zero-duration marker event."""
+        event = {
+            'name': name,
+            'cat': self.category,
+            'ph': 'i',
+            's': 't',
+            'ts': time.perf_counter_ns() / 1000.0,
+            'pid': self._pid,
+            'tid': threading.get_ident(),
+            'args': args
+        }
+        self._append(event)
+
+    def _add_complete_event(self, name: str, start_ns: int, end_ns: int, args: Dict[str, Any]) -> None:
+        event = {
+            'name': name,
+            'cat': self.category,
+            'ph': 'X',
+            'ts': start_ns / 1000.0,
+            'dur': (end_ns - start_ns) / 1000.0,
+            'pid': self._pid,
+            'tid': threading.get_ident(),
+            'args': args
+        }
+        self._append(event)
+
+    def _append(self, event: Dict[str, Any]) -> None:
+        with self._lock:
+            if len(self.events) == self.events.maxlen:
+                self.dropped += 1
+            self.events.append(event)
+
+    def to_trace(self) -> Dict[str, Any]:
+        """Get the buffered events as a trace-event JSON object."""
+        with self._lock:
+            events: List[Dict[str, Any]] = list(self.events)
+        return {
+            'traceEvents': events,
+            'displayTimeUnit': 'ms',
+            'otherData': {'dropped_events': self.dropped}
+        }
+
+    def flush(self, path: Optional[str] = None) -> str:
+        """
+        Write the buffered events to a trace file.
+
+        Args:
+            path: Output file. Defaults to the tracer's path.
+
+        Returns:
+            The path written
+        """
+        path = path or self.path
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(self.to_trace(), fh, default=str)
+        return path
+
+    def clear(self) -> None:
+        """Drop all buffered events."""
+        with self._lock:
+            self.events.clear()
+            self.dropped = 0
+
+
+class NullTracer:
+    """
+    Tracer stand-in that records nothing. Active while tracing is disabled.
+    """
+
+    enabled = False
+
+    def span(self, name: str, **args) -> _NullSpan:
+        return _NULL_SPAN
+
+    def instant(self, name: str, **args) -> None:
+        pass
+
+    def flush(self, path: Optional[str] = None) -> Optional[str]:
+        return None
+
+    def clear(self) -> None:
+        pass
+
+
+_NULL_TRACER = NullTracer()
+_active_tracer = _NULL_TRACER
+
+
+def get_tracer():
+    """Get the process-wide tracer (a NullTracer unless tracing is enabled)."""
+    return _active_tracer
+
+
+def enable_tracing(path: str = "engraf_trace.json", capacity: int = 100000,
+                   flush_on_exit: bool = True) -> Tracer:
+    """
+    Start recording spans process-wide.
+
+    Args:
+        path: Trace file written by flush()
+        capacity: Ring-buffer size in events
+        flush_on_exit: If True, flush the trace when the interpreter exits
+
+    Returns:
+        The active Tracer
+    """
+    global _active_tracer
+    tracer = Tracer(path=path, capacity=capacity)
+    if flush_on_exit:
+        atexit.register(tracer.flush)
+    _active_tracer = tracer
+    return tracer
+
+
+def disable_tracing() -> None:
+    """Stop recording spans. Already-recorded events stay on the old tracer."""
+    global _active_tracer
+    _active_tracer = _NULL_TRACER
@@ -0,0 +1,185 @@
+"""
+Headless Batch Runner for ENGRAF
+
+This module runs a file (or stdin) of commands through SentenceInterpreter
+with no display, one command per line, for load tests and regression runs.
+Blank lines and lines starting with '#' are skipped.
+
+Each command's result is written as one JSON line; a summary with throughput,
+latency percentiles and the final scene size follows on stderr (or as JSON).
+
+Usage:
+    engraf-batch commands.txt -o results.jsonl
+    cat commands.txt | engraf-batch --stage-timings --profile batch.prof
+"""
+
+import argparse
+import cProfile
+import json
+import sys
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO
+
+import numpy as np
+
+from engraf.interpreter.execution_history import compact_record
+from engraf.visualizer.renderers.null_renderer import NullRenderer
+
+
+def read_commands(stream: TextIO) -> Iterator[str]:
+    """Yield the commands in a stream, skipping blank lines and '#' comments."""
+    for line in stream:
+        command = line.strip()
+        if command and not command.startswith('#'):
+            yield command
+
+
+class BatchReport:
+    """
+    Throughput and latency of one batch run.
+    """
+
+    def __init__(self):
+        """Initialize an empty report."""
+        self.latencies_ms: List[float] = []
+        self.failures = 0
+        self.elapsed = 0.0
+        self.scene_entities = 0
+        self.scene_objects = 0
+        self.stage_latencies: Optional[Dict[str, Dict[str, Any]]] = None
+
+    def record(self, latency_ms: float, success: bool) -> None:
+        """Add one command's outcome."""
+        self.latencies_ms.append(latency_ms)
+        if not success:
+            self.failures += 1
+
+    def summary(self) -> Dict[str, Any]:
+        """Get the report as a JSON-friendly dict."""
+        commands = len(self.latencies_ms)
+        summary = {
+            'commands': commands,
+            'failures': self.failures,
+            'elapsed_s': self.elapsed,
+            'commands_per_s': commands / self.elapsed if self.elapsed > 0 else None,
+            'latency_ms': {'p50': None, 'p95': None, 'p99': None},
+            'scene_entities': self.scene_entities,
+            'scene_objects': self.scene_objects
+        }
+        if commands:
+            p50, p95, p99 = np.percentile(np.asarray(self.latencies_ms), [50, 95, 99])
+            summary['latency_ms'] = {'p50': float(p50), 'p95': float(p95), 'p99': float(p99)}
+        if self.stage_latencies is not None:
+            summary['stage_latency_ms'] = self.stage_latencies
+        return summary
+
+    def format(self) -> str:
+        """Get the report as human-readable text."""
+        summary = self.summary()
+        latency = summary['latency_ms']
+        lines = [
+            f"commands:        {summary['commands']} ({summary['failures']} failed)",
+            f"elapsed:         {summary['elapsed_s']:.3f} s",
+        ]
+        if summary['commands_per_s'] is not None:
+            lines.append(f"throughput:      {summary['commands_per_s']:,.1f} commands/s")
+        if latency['p50'] is not None:
+            lines.append(f"latency:         p50 {latency['p50']:.2f} ms, p95 {latency['p95']:.2f} ms, "
+                         f"p99 {latency['p99']:.2f} ms")
+        lines.append(f"final scene:     {summary['scene_objects']} objects, {summary['scene_entities']} entities")
+        for stage, stats in (self.stage_latencies or {}).items():
+            if stats.get('p50') is not None:
+                lines.append(f"  {stage:<28} p50 {stats['p50']:.2f} ms, p99 {stats['p99']:.2f} ms")
+        return "\n".join(lines)
+
+
+def run_batch(commands: Iterable[str], results: Optional[TextIO] = None, interpreter=None,
+              collect_timings: bool = False, plan_cache_size: int = 0) -> BatchReport:
+    """
+    Run commands through an interpreter and measure them.
+
+    Args:
+        commands: Sentences to interpret, in order
+        results: Optional text stream for one JSON result line per command
+        interpreter: Interpreter to use; by default a new one with a NullRenderer
+        collect_timings: If True, include per-stage timings in results and the report
+        plan_cache_size: Compiled command plans to cache (0 disables)
+
+    Returns:
+        The BatchReport of the run
+    """
+    if interpreter is None:
+        from engraf.interpreter.sentence_interpreter import SentenceInterpreter
+        interpreter = SentenceInterpreter(renderer=NullRenderer(), collect_timings=collect_timings,
+                                          plan_cache_size=plan_cache_size)
+
+    report = BatchReport()
+    start = time.perf_counter()
+    for index, command in enumerate(commands):
+        command_start = time.perf_counter()
+        result = interpreter.interpret(command)
+        latency_ms = (time.perf_counter() - command_start) * 1000.0
+        success = bool(result.get('success'))
+        report.record(latency_ms, success)
+
+        if results is not None:
+            record = compact_record(result)
+            record.update(index=index, sentence=command, success=success,
+                          message=result.get('message'), latency_ms=latency_ms)
+            results.write(json.dumps(record, default=str) + '\n')
+    report.elapsed = time.perf_counter() - start
+
+    scene = interpreter.scene
+    report.scene_entities = len(scene.entities)
+    report.scene_objects = len(scene.get_all_scene_objects())
+    if collect_timings:
+        report.stage_latencies = interpreter.get_stage_latencies()
+    return report
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='engraf-batch',
+        description="Run ENGRAF commands headlessly, one per line, and report throughput and latency.")
+    parser.add_argument('input', nargs='?', default='-', help="Command file ('-' or omitted for stdin)")
+    parser.add_argument('-o', '--output', default='-', help="JSONL file for per-command results ('-' for stdout)")
+    parser.add_argument('--no-results', action='store_true', help="Do not write per-command results")
+    parser.add_argument('--report-json', metavar='PATH', help="Also write the summary as JSON to PATH")
+    parser.add_argument('--stage-timings', action='store_true', help="Collect and report per-stage latencies")
+    parser.add_argument('--plan-cache', type=int, default=0, metavar='N', help="Cache N compiled command plans")
+    parser.add_argument('--profile', metavar='PATH', help="Write cProfile statistics of the run to PATH")
+    parser.add_argument('--allow-failures', action='store_true', help="Exit 0 even if commands failed")
+    args = parser.parse_args(argv)
+
+    source = sys.stdin if args.input == '-' else open(args.input, encoding='utf-8')
+    results = None
+    if not args.no_results:
+        results = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+
+    profiler = cProfile.Profile() if args.profile else None
+    try:
+        if profiler is not None:
+            profiler.enable()
+        report = run_batch(read_commands(source), results, collect_timings=args.stage_timings,
+                           plan_cache_size=args.plan_cache)
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(args.profile)
+        if source is not sys.stdin:
+            source.close()
+        if results is not None and results is not sys.stdout:
+            results.close()
+
+    print(report.format(), file=sys.stderr)
+    if args.profile:
+        print(f"profile:         {args.profile} (view with python -m pstats or snakeviz)", file=sys.stderr)
+    if args.report_json:
+        with open(args.report_json, 'w', encoding='utf-8') as f:
+            json.dump(report.summary(), f, indent=2)
+
+    return 0 if report.failures == 0 or args.allow_failures else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,242 @@
+"""
+Bulk Creation Commands for ENGRAF
+
+This module recognizes quantity-and-layout creation sentences and turns each
+into a single creation plan:
+
+    draw 500 red cubes in a grid
+    draw ten spheres in a circle of radius 5
+    draw 3 rows of 20 boxes
+    make 12 tall blue cylinders in a row with spacing 3
+
+Only the description ("draw a red cube") goes through LATN, once; positions
+come from NumPy for the whole layout and all objects are added to the scene
+in one batch, so the cost per object is a vector copy instead of a parse.
+
+Sentences that do not match (including ones with no layout), or ask for
+fewer than two objects, are left to the regular interpreter path.
+"""
+
+import math
+import re
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from latn.pos.verb_phrase import VerbPhrase
+
+from engraf.interpreter.command_plan import CommandPlan, sentence_template
+
+
+MAX_BULK_OBJECTS = 100000
+
+_NUMBER_WORDS = {
+    'two': 2, 'three': 3, 'four': 4, 'five': 5, 'six': 6, 'seven': 7, 'eight': 8,
+    'nine': 9, 'ten': 10, 'eleven': 11, 'twelve': 12, 'thirteen': 13, 'fourteen': 14,
+    'fifteen': 15, 'sixteen': 16, 'seventeen': 17, 'eighteen': 18, 'nineteen': 19,
+    'twenty': 20, 'thirty': 30, 'forty': 40, 'fifty': 50, 'sixty': 60, 'seventy': 70,
+    'eighty': 80, 'ninety': 90, 'hundred': 100, 'a hundred': 100, 'one hundred': 100
+}
+_TENS = ('twenty', 'thirty', 'forty', 'fifty', 'sixty', 'seventy', 'eighty', 'ninety')
+_UNITS = {'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5, 'six': 6, 'seven': 7, 'eight': 8, 'nine': 9}
+# Compound counts ("twenty one", "twenty-one") come before the single words they start with
+_COUNT = (r'\d+|(?:' + '|'.join(_TENS) + r')[\s-](?:' + '|'.join(_UNITS) + r')|'
+          + '|'.join(sorted(_NUMBER_WORDS, key=len, reverse=True)))
+_REAL = r'\d+(?:\.\d+)?'
+
+_BULK_RE = re.compile(
+    rf'^(?P<verb>draw|create|make|build|add|place)\s+'
+    rf'(?:(?P<rows>{_COUNT})\s+rows\s+of\s+(?P<per_row>{_COUNT})\s+(?P<row_description>[a-z]+(?:\s+[a-z]+)*?)'
+    rf'|(?P<count>{_COUNT})\s+(?P<description>[a-z]+(?:\s+[a-z]+)*?)'
+    rf'(?:\s+in\s+an?\s+(?P<layout>grid|circle|row|line|column)'
+    rf'(?:\s+of\s+radius\s+(?P<radius>{_REAL}))?))'
+    rf'(?:\s+with\s+spacing\s+(?P<spacing>{_REAL}))?$'
+)
+
+
+# A description is adjectives and a noun; anything else goes to the parser
+_NOT_DESCRIPTIVE = {'a', 'an', 'the', 'and', 'or', 'of', 'at', 'to', 'in', 'on', 'above', 'below',
+                    'under', 'over', 'near', 'behind', 'with', 'named', 'called'}
+
+
+def _count(text: str) -> int:
+    if text.isdigit():
+        return int(text)
+    tens, _, units = text.replace('-', ' ').partition(' ')
+    if tens in _TENS and units in _UNITS:
+        return _NUMBER_WORDS[tens] + _UNITS[units]
+    return _NUMBER_WORDS[text]
+
+
+def singular(noun: str) -> str:
+    """Singular form of a plural object noun ("boxes" -> "box", "cubes" -> "cube")."""
+    if noun.endswith('es') and noun[:-2].endswith(('x', 's', 'sh', 'ch', 'z')):
+        return noun[:-2]
+    if noun.endswith('s') and not noun.endswith('ss'):
+        return noun[:-1]
+    return noun
+
+
+class BulkCommand:
+    """
+    A recognized bulk creation sentence.
+    """
+
+    def __init__(self, verb: str, count: int, layout: str, description: str,
+                 rows: Optional[int] = None, radius: Optional[float] = None, spacing: Optional[float] = None):
+        """
+        Initialize the command.
+
+        Args:
+            verb: The creation verb ("draw")
+            count: Total number of objects
+            layout: 'grid', 'circle', 'row', 'column' or 'rows'
+            description: Singular noun phrase for one object ("red cube")
+            rows: Number of rows for the 'rows' layout
+            radius: Circle radius, or None to fit the objects at their spacing
+            spacing: Distance between neighbours, or None for twice the object size
+        """
+        self.verb = verb
+        self.count = count
+        self.layout = layout
+        self.description = description
+        self.rows = rows
+        self.radius = radius
+        self.spacing = spacing
+
+    @property
+    def description_sentence(self) -> str:
+        """The one-object sentence whose parse describes every object ("draw a red cube")."""
+        return f"{self.verb} a {self.description}"
+
+
+def parse_bulk_command(sentence: str) -> Optional[BulkCommand]:
+    """
+    Recognize a bulk creation sentence.
+
+    Args:
+        sentence: The English sentence
+
+    Returns:
+        The BulkCommand, or None if the sentence is not a bulk creation
+    """
+    match = _BULK_RE.match(' '.join(sentence.lower().split()))
+    if match is None:
+        return None
+
+    if match.group('rows'):
+        rows = _count(match.group('rows'))
+        count = rows * _count(match.group('per_row'))
+        words = match.group('row_description').split()
+        layout = 'rows'
+    else:
+        rows = None
+        count = _count(match.group('count'))
+        words = match.group('description').split()
+        layout = match.group('layout')
+        if layout == 'line':
+            layout = 'row'
+    # A number left at the start of the description means the count was misread
+    if (count < 2 or count > MAX_BULK_OBJECTS or _NOT_DESCRIPTIVE.intersection(words)
+            or words[0] in _NUMBER_WORDS or words[0] in _UNITS):
+        return None
+    words[-1] = singular(words[-1])
+
+    radius = match.group('radius')
+    if radius and layout != 'circle':
+        return None
+    spacing = match.group('spacing')
+    return BulkCommand(match.group('verb'), count, layout, ' '.join(words), rows=rows,
+                       radius=float(radius) if radius else None,
+                       spacing=float(spacing) if spacing else None)
+
+
+def layout_positions(layout: str, count: int, spacing: float, rows: Optional[int] = None,
+                     radius: Optional[float] = None) -> np.ndarray:
+    """
+    Positions for count objects, centered on the origin.
+
+    Grids, rows and circles lie on the ground (x/z) plane; columns stack along y.
+
+    Returns:
+        Array of shape (count, 3)
+    """
+    index = np.arange(count, dtype=float)
+    positions = np.zeros((count, 3))
+
+    if layout == 'circle':
+        if radius is None:
+            radius = max(spacing * count / (2.0 * math.pi), spacing)
+        angle = index * (2.0 * math.pi / count)
+        positions[:, 0] = radius * np.cos(angle)
+        positions[:, 2] = radius * np.sin(angle)
+        return positions
+
+    if layout == 'row':
+        positions[:, 0] = index * spacing
+    elif layout == 'column':
+        positions[:, 1] = index * spacing
+    else:
+        columns = count // rows if layout == 'rows' else math.ceil(math.sqrt(count))
+        positions[:, 0] = (index % columns) * spacing
+        positions[:, 2] = (index // columns) * spacing
+    positions -= (positions.max(axis=0) + positions.min(axis=0)) / 2.0
+    return positions
+
+
+class BulkCreateStep:
+    """Create every object of a bulk command in one batch."""
+
+    __slots__ = ('command', 'obj_info')
+
+    def __init__(self, command: BulkCommand, obj_info: Dict[str, Any]):
+        self.command = command
+        self.obj_info = obj_info  # Description of one object, detached from the parse
+
+    @property
+    def verb(self) -> str:
+        return self.command.verb
+
+    def run(self, interpreter, values, result: Dict[str, Any]) -> None:
+        command = self.command
+        spacing = command.spacing
+        if spacing is None:
+            vector = self.obj_info.get('vector_space')
+            size = max(vector['scaleX'], vector['scaleY'], vector['scaleZ']) if vector is not None else 0.0
+            spacing = 2.0 * (size or 1.0)
+
+        positions = layout_positions(command.layout, command.count, spacing,
+                                     rows=command.rows, radius=command.radius)
+        object_ids = interpreter.object_creator.create_scene_objects(dict(self.obj_info), positions)
+        result['objects_created'].extend(object_ids)
+        if object_ids:
+            interpreter._last_acted_object[0] = object_ids[-1]
+
+
+def compile_bulk_plan(command: BulkCommand, parsed_description, sentence: str, interpreter):
+    """
+    Wrap a bulk command and the parse of its description in a CommandPlan.
+
+    Args:
+        command: The recognized BulkCommand
+        parsed_description: The SentencePhrase LATN produced for command.description_sentence
+        sentence: The original sentence text (the plan's template)
+        interpreter: The SentenceInterpreter, for its object creator
+
+    Returns:
+        The plan, or None if the description is not a single object to create
+    """
+    predicate = getattr(parsed_description, 'predicate', None)
+    if not isinstance(predicate, VerbPhrase) or not predicate.noun_phrase:
+        return None
+    if not (predicate.vector and predicate.vector.isa('create')):
+        return None
+
+    objects = interpreter.object_creator.extract_objects_from_np(predicate.noun_phrase)
+    if len(objects) != 1:
+        return None
+    obj_info = objects[0]
+    obj_info.pop('prepositional_phrases', None)
+
+    template, _ = sentence_template(sentence)
+    return CommandPlan(template, parsed_description, [BulkCreateStep(command, obj_info)], [], [])
@@ -0,0 +1,439 @@
+"""
+Compiled Command Plans for ENGRAF
+
+This module lowers a parsed SentencePhrase into a small executable plan: a
+list of steps that create objects or resolve targets and apply move, rotate,
+scale and style operations with already-extracted numeric operands. All intent
+discovery (vector isa() checks, preposition loops, branch selection) happens
+once, at compile time.
+
+Plans are cached by sentence template. The numbers inside bracketed vector
+literals and the number after "by" become slots, so "move the cube to [1, 2, 3]"
+and "move the cube to [4, 5, 6]" share one plan and only the slot values
+change. Object references stay symbolic: targets are resolved against the live
+scene every time a plan runs.
+
+A sentence is only compiled when every slot in its template is consumed, in
+order, by a plan operand with the same value. Anything else (subjects, "to be"
+sentences, conjunctions, organize verbs, numbers the plan does not use) is left
+to the regular interpreter path.
+"""
+
+import copy
+import logging
+import math
+import re
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from latn.pos.verb_phrase import VerbPhrase
+
+logger = logging.getLogger(__name__)
+
+
+_NUMBER = r'[-+]?\d+(?:\.\d+)?'
+_NUMBER_RE = re.compile(_NUMBER)
+_SLOT_RE = re.compile(
+    rf'\[\s*{_NUMBER}(?:\s*,\s*{_NUMBER})*\s*\]'  # vector literal: [1, 2, 3]
+    rf'|\bby\s+{_NUMBER}(?![\d.])'                 # scalar amount: by 90
+)
+
+
+def sentence_template(sentence: str) -> Tuple[str, List[float]]:
+    """
+    Split a sentence into its template and slot values.
+
+    Args:
+        sentence: The English sentence
+
+    Returns:
+        (template, params), e.g. ("move it to [#, #, #]", [1.0, 2.0, 3.0])
+    """
+    params: List[float] = []
+
+    def to_slots(match) -> str:
+        numbers = _NUMBER_RE.findall(match.group(0))
+        params.extend(float(number) for number in numbers)
+        if match.group(0).startswith('['):
+            return '[' + ', '.join('#' for _ in numbers) + ']'
+        return 'by #'
+
+    template = _SLOT_RE.sub(to_slots, ' '.join(sentence.split()))
+    return template, params
+
+
+class _PlanBuilder:
+    """Collects plan operands while a sentence is being compiled."""
+
+    def __init__(self):
+        self.constants: List[float] = []
+        self.bindable: List[int] = []  # Operand indices that must come from slots, in order
+
+    def operand(self, value: float) -> int:
+        """Register an operand that was written in the sentence (bound to a slot)."""
+        index = self.constant(value)
+        self.bindable.append(index)
+        return index
+
+    def constant(self, value: float) -> int:
+        """Register an operand that never changes between runs of the plan."""
+        self.constants.append(float(value))
+        return len(self.constants) - 1
+
+    def bind(self, params: List[float]) -> Optional[List[Tuple[int, int]]]:
+        """
+        Pair bindable operands with slots positionally.
+
+        Returns:
+            (operand index, slot index) pairs, or None if the sentence's numbers
+            do not line up one-to-one with the plan's operands
+        """
+        if len(self.bindable) != len(params):
+            return None
+        for index, value in zip(self.bindable, params):
+            if not math.isclose(self.constants[index], value, abs_tol=1e-9):
+                return None
+        return [(index, slot) for slot, index in enumerate(self.bindable)]
+
+
+# Operations applied to each resolved target entity
+
+class MoveOp:
+    """Move to explicit coordinates."""
+
+    __slots__ = ('xyz',)
+
+    def __init__(self, xyz: Tuple[int, int, int]):
+        self.xyz = xyz
+
+    def apply(self, modifier, entity, values: List[float]) -> None:
+        x, y, z = self.xyz
+        modifier.move_to_coordinates(entity, values[x], values[y], values[z])
+
+
+class RelativeMoveOp:
+    """Move relative to another object ("above the cube"); the reference is resolved at run time."""
+
+    __slots__ = ('preposition',)
+
+    def __init__(self, preposition):
+        self.preposition = preposition
+
+    def apply(self, modifier, entity, values: List[float]) -> None:
+        modifier._apply_movement(entity, self.preposition)
+
+
+class RotateOp:
+    """Set rotation from a vector literal, or about one axis from a single angle."""
+
+    __slots__ = ('vector_literal', 'xyz', 'angle', 'axis')
+
+    def __init__(self, vector_literal: bool, xyz: Tuple[int, int, int], angle: int, axis: str):
+        self.vector_literal = vector_literal
+        self.xyz = xyz
+        self.angle = angle
+        self.axis = axis
+
+    def apply(self, modifier, entity, values: List[float]) -> None:
+        x, y, z = (values[i] for i in self.xyz)
+        if self.vector_literal and (x != 0.0 or y != 0.0 or z != 0.0):
+            modifier.set_rotation(entity, x, y, z)
+        else:
+            modifier.set_axis_rotation(entity, self.axis, values[self.angle])
+
+
+class ScaleOp:
+    """Set scale factors per axis."""
+
+    __slots__ = ('xyz',)
+
+    def __init__(self, xyz: Tuple[int, int, int]):
+        self.xyz = xyz
+
+    def apply(self, modifier, entity, values: List[float]) -> None:
+        x, y, z = self.xyz
+        modifier.set_scale(entity, values[x], values[y], values[z])
+
+
+class AdjectiveScaleOp:
+    """Scale from adjective complements ("make it bigger")."""
+
+    __slots__ = ('vp',)
+
+    def __init__(self, vp: VerbPhrase):
+        self.vp = vp
+
+    def apply(self, modifier, entity, values: List[float]) -> None:
+        modifier._apply_adjective_scaling(entity, self.vp)
+
+
+# Plan steps
+
+class CreateStep:
+    """Create objects from pre-extracted descriptions."""
+
+    __slots__ = ('verb', 'objects')
+
+    def __init__(self, verb: str, objects: List[Tuple[Dict[str, Any], List[Tuple[int, int, int]]]]):
+        self.verb = verb
+        self.objects = objects  # (obj_info, position operand triples) per object
+
+    def run(self, interpreter, values: List[float], result: Dict[str, Any]) -> None:
+        for template_info, positions in self.objects:
+            obj_info = dict(template_info)
+            # The new SceneObject takes ownership of its vector, so every run needs a fresh copy
+            if obj_info.get('vector_space') is not None:
+                obj_info['vector_space'] = copy.deepcopy(obj_info['vector_space'])
+            obj_info['positions'] = [(values[x], values[y], values[z]) for x, y, z in positions]
+
+            obj_id = interpreter.object_creator.create_scene_object(obj_info)
+            if obj_id:
+                result['objects_created'].append(obj_id)
+                interpreter._last_acted_object[0] = obj_id
+
+
+class ModifyStep:
+    """Resolve target entities, then apply the same operations to each of them."""
+
+    __slots__ = ('vp', 'ops')
+
+    def __init__(self, vp: VerbPhrase, ops: List[Any]):
+        self.vp = vp
+        self.ops = ops
+
+    @property
+    def verb(self) -> str:
+        return self.vp.verb
+
+    def run(self, interpreter, values: List[float], result: Dict[str, Any]) -> None:
+        modifier = interpreter.object_modifier
+        for entity_id in interpreter.object_resolver.resolve_target_objects(self.vp):
+            entity = interpreter.scene.find_entity_by_id(entity_id)
+            if not entity:
+                continue
+            interpreter.scene.touch(entity)
+            try:
+                for op in self.ops:
+                    op.apply(modifier, entity, values)
+                interpreter.scene.refresh_attributes(entity)
+                modifier.update_rendering(entity)
+            except (AttributeError, KeyError, TypeError, ValueError) as e:
+                logger.warning("Failed to modify entity %s: %s", entity_id, e, exc_info=True)
+                continue
+            result['objects_modified'].append(entity_id)
+            interpreter._last_acted_object[0] = entity_id
+
+
+class CommandPlan:
+    """
+    Executable form of one parsed sentence, parameterized by its template slots.
+    """
+
+    def __init__(self, template: str, sentence_parsed, steps: List[Any],
+                 constants: List[float], bindings: List[Tuple[int, int]]):
+        """
+        Initialize the plan.
+
+        Args:
+            template: Sentence template the plan is cached under
+            sentence_parsed: The SentencePhrase the plan was compiled from
+            steps: CreateStep/ModifyStep (or BulkCreateStep) instances, in execution order
+            constants: Operand values as compiled
+            bindings: (operand index, slot index) pairs overwritten on each run
+        """
+        self.template = template
+        self.sentence_parsed = sentence_parsed
+        self.steps = steps
+        self.constants = constants
+        self.bindings = bindings
+
+    def execute(self, interpreter, params: List[float]) -> Dict[str, Any]:
+        """
+        Run the plan against the interpreter's current scene.
+
+        Args:
+            interpreter: The SentenceInterpreter whose handlers and scene are used
+            params: Slot values from sentence_template()
+
+        Returns:
+            Dict with objects_created, objects_modified and actions_performed
+        """
+        values = list(self.constants)
+        for index, slot in self.bindings:
+            values[index] = params[slot]
+
+        result = {
+            'objects_created': [],
+            'objects_modified': [],
+            'actions_performed': []
+        }
+        for step in self.steps:
+            result['actions_performed'].append(step.verb)
+            step.run(interpreter, values, result)
+        return result
+
+
+def compile_plan(parsed_sentence, sentence: str, interpreter) -> Optional[CommandPlan]:
+    """
+    Lower a parsed sentence into a CommandPlan.
+
+    Args:
+        parsed_sentence: The SentencePhrase produced by LATN
+        sentence: The original sentence text (defines the template)
+        interpreter: The SentenceInterpreter, for its object creator and modifier
+
+    Returns:
+        The plan, or None if the sentence cannot be compiled
+    """
+    if getattr(parsed_sentence, 'subject', None) or getattr(parsed_sentence, 'tobe', None):
+        return None
+    predicate = getattr(parsed_sentence, 'predicate', None)
+    if not isinstance(predicate, VerbPhrase):
+        return None
+
+    builder = _PlanBuilder()
+    step = _compile_verb_phrase(predicate, builder, interpreter)
+    if step is None:
+        return None
+
+    template, params = sentence_template(sentence)
+    bindings = builder.bind(params)
+    if bindings is None:
+        return None
+
+    return CommandPlan(template, parsed_sentence, [step], builder.constants, bindings)
+
+
+def _compile_verb_phrase(vp: VerbPhrase, builder: _PlanBuilder, interpreter):
+    """Mirror SentenceInterpreter._execute_verb_phrase, returning a step instead of executing."""
+    if not (hasattr(vp, 'vector') and vp.vector):
+        return None
+
+    # Adjective complements ("make it bigger") take priority over creation, as in the interpreter
+    complement_transform = (hasattr(vp, 'adjective_complement') and vp.adjective_complements and
+                            vp.vector.isa('transform'))
+
+    if not complement_transform and vp.vector.isa('create'):
+        if not vp.noun_phrase:
+            return None
+        objects = []
+        for obj_info in interpreter._extract_creation_objects(vp):
+            positions = []
+            for pp in obj_info.pop('prepositional_phrases', []):
+                if hasattr(pp, 'noun_phrase') and hasattr(pp.noun_phrase, 'vector'):
+                    positions.append(_vector_operands(builder, pp.noun_phrase.vector))
+            # Detach from the parse, which the first execution is about to hand to a SceneObject
+            if obj_info.get('vector_space') is not None:
+                obj_info['vector_space'] = copy.deepcopy(obj_info['vector_space'])
+            objects.append((obj_info, positions))
+        return CreateStep(vp.verb, objects)
+
+    if vp.vector.isa('transform'):
+        return ModifyStep(vp, _compile_transform_ops(vp, builder, interpreter.object_modifier))
+
+    return None
+
+
+def _compile_transform_ops(vp: VerbPhrase, builder: _PlanBuilder, modifier) -> List[Any]:
+    """Mirror the transform branch of ObjectModifier.modify_scene_object."""
+    if not vp.prepositions:
+        if hasattr(vp, 'adjective_complement') and vp.adjective_complements:
+            return [AdjectiveScaleOp(vp)]
+        return []
+
+    ops = []
+    agency_compiled = False
+    for pp in vp.prepositions:
+        if not hasattr(pp, 'vector'):
+            continue
+        if pp.vector.isa('directional_target') or pp.vector.isa('spatial_location'):
+            if pp.vector.isa('spatial_location'):
+                if hasattr(pp, 'noun_phrase') and pp.noun_phrase:
+                    ops.append(RelativeMoveOp(pp))
+            elif hasattr(pp, 'noun_phrase') and hasattr(pp.noun_phrase, 'vector'):
+                ops.append(MoveOp(_vector_operands(builder, pp.noun_phrase.vector)))
+        elif pp.vector.isa('directional_agency') and hasattr(pp.noun_phrase, 'vector'):
+            # Rotation and scaling read every agency phrase at once, so compile them only once
+            if agency_compiled:
+                continue
+            agency_compiled = True
+            if modifier.is_rotation_verb(vp):
+                ops.extend(_compile_rotation_ops(vp, builder, modifier))
+            else:
+                ops.extend(_compile_scaling_ops(vp, builder))
+    return ops
+
+
+def _compile_rotation_ops(vp: VerbPhrase, builder: _PlanBuilder, modifier) -> List[RotateOp]:
+    ops = []
+    axis = modifier.rotation_axis(vp)
+    for pp in vp.prepositions:
+        if hasattr(pp, 'vector') and pp.vector.isa('directional_agency') and hasattr(pp.noun_phrase, 'vector'):
+            vector = pp.noun_phrase.vector
+            if vector.isa('vector'):
+                xyz = _vector_operands(builder, vector)
+                angle = builder.constant(vector['number'])
+                ops.append(RotateOp(True, xyz, angle, axis))
+            else:
+                zero = builder.constant(0.0)
+                ops.append(RotateOp(False, (zero, zero, zero), builder.operand(vector['number']), axis))
+    return ops
+
+
+def _compile_scaling_ops(vp: VerbPhrase, builder: _PlanBuilder) -> List[ScaleOp]:
+    ops = []
+    if vp.noun_phrase and vp.noun_phrase.preps:
+        for pp in vp.noun_phrase.preps:
+            if hasattr(pp, 'vector') and pp.vector.isa('directional_agency') and hasattr(pp.noun_phrase, 'vector'):
+                ops.append(ScaleOp(_vector_operands(builder, pp.noun_phrase.vector)))
+    return ops
+
+
+def _vector_operands(builder: _PlanBuilder, vector) -> Tuple[int, int, int]:
+    return (builder.operand(vector['locX']), builder.operand(vector['locY']), builder.operand(vector['locZ']))
+
+
+class CommandPlanCache:
+    """
+    LRU cache of compiled plans keyed by sentence template.
+    """
+
+    def __init__(self, capacity: int = 256):
+        """
+        Initialize the cache.
+
+        Args:
+            capacity: Maximum number of templates kept
+        """
+        self.capacity = capacity
+        self._plans: 'OrderedDict[str, CommandPlan]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, template: str) -> Optional[CommandPlan]:
+        """Get the plan for a template, or None."""
+        plan = self._plans.get(template)
+        if plan is None:
+            self.misses += 1
+            return None
+        self._plans.move_to_end(template)
+        self.hits += 1
+        return plan
+
+    def put(self, plan: CommandPlan) -> None:
+        """Store a plan under its template, evicting the least recently used one if full."""
+        self._plans[plan.template] = plan
+        self._plans.move_to_end(plan.template)
+        while len(self._plans) > self.capacity:
+            self._plans.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached plans."""
+        self._plans.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Get hit, miss and size counters."""
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._plans)}
+
+    def __len__(self) -> int:
+        return len(self._plans)
@@ -0,0 +1,100 @@
+"""
+Execution History for ENGRAF
+
+This module keeps the interpreter's record of executed commands. Results carry
+the whole LATN parse tree (sentence_parsed) with its vectors, so keeping them
+forever leaks memory in long sessions. ExecutionHistory instead keeps a bounded
+ring buffer of compact records (sentence, outcome, actions, touched IDs and
+timings) and can stream the full records to a JSON Lines sink.
+"""
+
+import json
+import time
+from collections import deque
+from typing import Any, Dict, Iterator, Optional, TextIO, Union
+
+
+# Result keys copied into the compact in-memory record
+COMPACT_KEYS = ('sentence', 'success', 'actions_performed', 'objects_created',
+                'objects_modified', 'assemblies_created', 'plan_cache_hit', 'timings')
+
+
+def compact_record(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Get the parts of an execution result worth keeping in memory."""
+    record = {key: result[key] for key in COMPACT_KEYS if key in result}
+    record['time'] = time.time()
+    return record
+
+
+class ExecutionHistory:
+    """
+    Bounded history of executed commands, optionally streamed to a JSONL file.
+    """
+
+    def __init__(self, capacity: int = 1000, sink: Optional[Union[str, TextIO]] = None):
+        """
+        Initialize the history.
+
+        Args:
+            capacity: Number of compact records kept in memory (oldest are dropped first)
+            sink: Optional path or text stream that receives every full result as one
+                  JSON line. Values that are not JSON (e.g. the parse tree) are written
+                  as their str() form.
+        """
+        if capacity < 1:
+            raise ValueError(f"capacity must be at least 1, got {capacity}")
+        self._records = deque(maxlen=capacity)
+        self.total = 0  # Commands recorded since the last clear, including dropped ones
+
+        self._owns_sink = isinstance(sink, str)
+        self._sink = open(sink, 'a', encoding='utf-8') if self._owns_sink else sink
+
+    @property
+    def capacity(self) -> int:
+        return self._records.maxlen
+
+    def append(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Record an execution result.
+
+        Returns:
+            The compact record kept in memory
+        """
+        record = compact_record(result)
+        self._records.append(record)
+        self.total += 1
+
+        if self._sink is not None:
+            full = dict(result)
+            full['time'] = record['time']
+            self._sink.write(json.dumps(full, default=str) + '\n')
+            self._sink.flush()
+        return record
+
+    @property
+    def last(self) -> Optional[Dict[str, Any]]:
+        """The most recent record, or None."""
+        return self._records[-1] if self._records else None
+
+    def clear(self) -> None:
+        """Forget all records (the sink keeps what it was sent)."""
+        self._records.clear()
+        self.total = 0
+
+    def close(self) -> None:
+        """Close the sink if this history opened it."""
+        if self._owns_sink and self._sink is not None:
+            self._sink.close()
+        self._sink = None
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self._records)
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        return self._records[index]
+
+    def __bool__(self) -> bool:
+        return bool(self._records)
@@ -5,6 +5,7 @@ This module handles the creation of SceneAssemblies from existing scene objects
 through grouping operations like "group them as an 'arch'".
 """
 
+import logging
 from typing import List, Dict, Any, Optional
 from latn.pos.verb_phrase import VerbPhrase
 from engraf.visualizer.scene.scene_assembly import SceneAssembly
@@ -12,6 +13,8 @@ from engraf.visualizer.scene.scene_object import SceneObject
 from latn.lexer.vector_space import VectorSpace
 from latn.An_N_Space_Model.vector_dimensions import VECTOR_DIMENSIONS
 
+logger = logging.getLogger(__name__)
+
 
 class AssemblyCreator:
     """
@@ -47,7 +50,7 @@ class AssemblyCreator:
             # Step 1: Resolve target objects to group
             target_objects = self._resolve_grouping_targets(vp)
             if not target_objects:
-                print("⚠️  No objects found to group")
+                logger.warning("⚠️  No objects found to group")
                 return None
             
             # Step 2: Extract assembly name from verb phrase
@@ -64,7 +67,7 @@ class AssemblyCreator:
             return assembly_id
             
         except Exception as e:
-            print(f"❌ Error creating assembly: {e}")
+            logger.warning("❌ Error creating assembly: %s", e)
             return None
     
     def _resolve_grouping_targets(self, vp: VerbPhrase) -> List[SceneObject]:
@@ -118,7 +121,7 @@ class AssemblyCreator:
         # Add assembly to scene
         self.scene.add_assembly(assembly)
         
-        print(f"📦 Created assembly '{assembly_id}' with {len(objects)} objects")
+        logger.info("📦 Created assembly '%s' with %d objects", assembly_id, len(objects))
         return assembly_id
     
     def _move_objects_to_assembly(self, objects: List[SceneObject], assembly_id: str):
@@ -128,8 +131,8 @@ class AssemblyCreator:
                 # Use scene's move_object_to_assembly method
                 success = self.scene.move_object_to_assembly(obj.object_id, assembly_id)
                 if success:
-                    print(f"  ↳ Moved {obj.object_id} to assembly")
+                    logger.debug("  ↳ Moved %s to assembly", obj.object_id)
                 else:
-                    print(f"  ⚠️  Failed to move {obj.object_id} to assembly")
+                    logger.warning("  ⚠️  Failed to move %s to assembly", obj.object_id)
             except Exception as e:
-                print(f"  ❌ Error moving {obj.object_id}: {e}")
+                logger.warning("  ❌ Error moving %s: %s", obj.object_id, e)
@@ -5,12 +5,16 @@ This module handles the creation of new scene objects from parsed noun phrases.
 It extracts object information, generates descriptive IDs, and applies default properties.
 """
 
+import copy
+import logging
 from typing import Optional, List, Dict, Any, Union
 from latn.pos.noun_phrase import NounPhrase
 from latn.pos.conjunction_phrase import ConjunctionPhrase
 from engraf.visualizer.scene.scene_object import SceneObject
 from latn.lexer.vector_space import VectorSpace
 
+logger = logging.getLogger(__name__)
+
 
 class ObjectCreator:
     """
@@ -86,15 +90,44 @@ class ObjectCreator:
                 for prep_phrase in obj_info['prepositional_phrases']:
                     self._apply_movement(scene_object, prep_phrase)
             
+            # Apply already-extracted coordinates (used by compiled command plans)
+            for x, y, z in obj_info.get('positions', []):
+                self._apply_position(scene_object, x, y, z)
+            
             self.scene.add_object(scene_object)
             
-            print(f"✅ Created object: {obj_id}")
+            logger.info("✅ Created object: %s", obj_id)
             return obj_id
             
         except Exception as e:
-            print(f"❌ Failed to create object: {e}")
+            logger.warning("❌ Failed to create object: %s", e)
             return None
     
+    def create_scene_objects(self, obj_info: Dict[str, Any], positions) -> List[str]:
+        """
+        Create one object per row of an (N, 3) array of positions, in a single batch.
+        
+        Every object gets a copy of the description's vector (with default
+        properties applied once) and an ID from the object counter.
+        """
+        template = obj_info.get('vector_space') or VectorSpace()
+        self._apply_default_properties(template, obj_info)
+        base_type = obj_info['type']
+        first = self.object_counter_ref[0] + 1
+        
+        objects = []
+        for offset, (x, y, z) in enumerate(positions.tolist()):
+            vector_space = copy.deepcopy(template)
+            vector_space['locX'] = x
+            vector_space['locY'] = y
+            vector_space['locZ'] = z
+            objects.append(SceneObject(name=base_type, vector=vector_space, object_id=f"{base_type}-{first + offset}"))
+        
+        self.scene.add_objects(objects)
+        self.object_counter_ref[0] += len(objects)
+        logger.info("✅ Created %d %s objects", len(objects), base_type)
+        return [obj.object_id for obj in objects]
+    
     def _check_name_conflict(self, name: str) -> bool:
         """Check if an object ID already exists in the scene."""
         # Check objects
@@ -174,9 +207,13 @@ class ObjectCreator:
         # For now, simple implementation
         if hasattr(preposition, 'noun_phrase') and hasattr(preposition.noun_phrase, 'vector'):
             vector = preposition.noun_phrase.vector
-            if vector['locX'] != 0.0:
-                scene_obj.vector['locX'] = vector['locX']
-            if vector['locY'] != 0.0:
-                scene_obj.vector['locY'] = vector['locY']
-            if vector['locZ'] != 0.0:
-                scene_obj.vector['locZ'] = vector['locZ']
+            self._apply_position(scene_obj, vector['locX'], vector['locY'], vector['locZ'])
+    
+    def _apply_position(self, scene_obj: SceneObject, x: float, y: float, z: float):
+        """Place an object at coordinates. Zero components leave that axis unchanged."""
+        if x != 0.0:
+            scene_obj.vector['locX'] = x
+        if y != 0.0:
+            scene_obj.vector['locY'] = y
+        if z != 0.0:
+            scene_obj.vector['locZ'] = z
@@ -42,6 +42,9 @@ class ObjectModifier:
                 debug_print(f"🔧 Scene entity not found: {entity_id}")
                 return False
             
+            # Save the entity's fields so an open scene transaction can roll them back
+            self.scene.touch(scene_entity)
+            
             verb = vp.verb
             debug_print(f"🔧 Processing verb: {verb}")
             debug_print(f"🔧 Entity type: {type(scene_entity).__name__}")
@@ -71,7 +74,7 @@ class ObjectModifier:
                                     vector = pp.noun_phrase.vector
                                     
                                     # Check if this is a rotation verb context
-                                    if vp.verb in ['rotate', 'xrotate', 'yrotate', 'zrotate'] or (hasattr(vp, 'vector') and vp.vector and (vp.vector.isa('rotX') or vp.vector.isa('rotY') or vp.vector.isa('rotZ'))):
+                                    if self.is_rotation_verb(vp):
                                         debug_print(f"🔧 Calling _apply_rotation for {vp.verb}")
                                         self._apply_rotation(scene_entity, vp, vp.verb)
                                     # If the vector has a 'number' field, it's likely scaling
@@ -115,14 +118,11 @@ class ObjectModifier:
             else:
                 debug_print(f"⚠️  No vector space information for verb: {verb}")
             
+            # Keep the scene's attribute index in step with the vector writes above
+            self.scene.refresh_attributes(scene_entity)
+            
             # Update the visual representation
-            if isinstance(scene_entity, SceneAssembly):
-                # For assemblies, update each constituent object
-                for obj in scene_entity.objects:
-                    self.renderer.update_object(obj)
-            else:
-                # For individual objects, update directly
-                self.renderer.update_object(scene_entity)
+            self.update_rendering(scene_entity)
             
             debug_print(f"✅ Modified entity: {entity_id}")
             return True
@@ -131,6 +131,63 @@ class ObjectModifier:
             debug_print(f"❌ Failed to modify entity {entity_id}: {e}")
             return False
     
+    def update_rendering(self, scene_entity: Union[SceneObject, SceneAssembly]):
+        """Push an entity's current transform to the renderer."""
+        if isinstance(scene_entity, SceneAssembly):
+            # For assemblies, update each constituent object
+            for obj in scene_entity.objects:
+                self.renderer.update_object(obj)
+        else:
+            # For individual objects, update directly
+            self.renderer.update_object(scene_entity)
+    
+    def move_to_coordinates(self, scene_entity: Union[SceneObject, SceneAssembly], x: float, y: float, z: float):
+        """
+        Move an entity to explicit coordinates.
+        
+        Assemblies move as a unit. For objects, zero components leave that axis unchanged.
+        """
+        if isinstance(scene_entity, SceneAssembly):
+            # Use assembly's move_to method which updates all constituent objects
+            scene_entity.move_to(x, y, z)
+            debug_print(f"🔧 Updated assembly transformation properties: position={scene_entity.position}")
+        else:
+            if x != 0.0:
+                scene_entity.vector['locX'] = x
+            if y != 0.0:
+                scene_entity.vector['locY'] = y
+            if z != 0.0:
+                scene_entity.vector['locZ'] = z
+            
+            # Update transformation properties from vector (critical for renderer)
+            scene_entity.update_transformations()
+            debug_print(f"🔧 Updated transformation properties: position={scene_entity.position}")
+    
+    def set_scale(self, scene_obj: SceneObject, x: float, y: float, z: float):
+        """Set an object's scale. Zero components leave that axis unchanged."""
+        if x != 0.0:
+            scene_obj.vector['scaleX'] = x
+        if y != 0.0:
+            scene_obj.vector['scaleY'] = y
+        if z != 0.0:
+            scene_obj.vector['scaleZ'] = z
+        
+        # Update transformation properties from vector (critical for renderer)
+        scene_obj.update_transformations()
+        debug_print(f"🔧 Updated transformation properties: scale={scene_obj.scale}")
+    
+    def set_rotation(self, scene_obj: SceneObject, x: float, y: float, z: float):
+        """Set all three rotation angles of an object."""
+        scene_obj.vector['rotX'] = x
+        scene_obj.vector['rotY'] = y
+        scene_obj.vector['rotZ'] = z
+        scene_obj.update_transformations()
+    
+    def set_axis_rotation(self, scene_obj: SceneObject, axis: str, angle: float):
+        """Set the rotation angle about one axis ('rotX', 'rotY' or 'rotZ')."""
+        scene_obj.vector[axis] = angle
+        scene_obj.update_transformations()
+    
     def _apply_movement(self, scene_entity: Union[SceneObject, SceneAssembly], preposition):
         """Apply movement to an object or assembly based on prepositional phrase."""
         debug_print(f"🔧 _apply_movement called for {scene_entity.name}")
@@ -151,11 +208,7 @@ class ObjectModifier:
                     ref_obj_id = ref_object_ids[0]  # Use the first match
                     
                     # Get the actual SceneObject from the scene
-                    ref_obj = None
-                    for obj in self.scene.objects:
-                        if obj.object_id == ref_obj_id:
-                            ref_obj = obj
-                            break
+                    ref_obj = self.object_resolver.find_object(ref_obj_id)
                     
                     if ref_obj:
                         debug_print(f"🔧 Found reference object: {ref_obj.name}")
@@ -191,24 +244,7 @@ class ObjectModifier:
         if hasattr(preposition, 'noun_phrase') and hasattr(preposition.noun_phrase, 'vector'):
             vector = preposition.noun_phrase.vector
             debug_print(f"🔧 Direct coordinate movement: [{vector['locX']}, {vector['locY']}, {vector['locZ']}]")
-            
-            # Check if this is an assembly
-            if isinstance(scene_entity, SceneAssembly):
-                # Use assembly's move_to method which updates all constituent objects
-                scene_entity.move_to(vector['locX'], vector['locY'], vector['locZ'])
-                debug_print(f"🔧 Updated assembly transformation properties: position={scene_entity.position}")
-            else:
-                # Original SceneObject logic
-                if vector['locX'] != 0.0:
-                    scene_entity.vector['locX'] = vector['locX']
-                if vector['locY'] != 0.0:
-                    scene_entity.vector['locY'] = vector['locY']
-                if vector['locZ'] != 0.0:
-                    scene_entity.vector['locZ'] = vector['locZ']
-                
-                # Update transformation properties from vector (critical for renderer)
-                scene_entity.update_transformations()
-                debug_print(f"🔧 Updated transformation properties: position={scene_entity.position}")
+            self.move_to_coordinates(scene_entity, vector['locX'], vector['locY'], vector['locZ'])
             return
 
     def _calculate_spatial_position(self, moving_obj: SceneObject, ref_obj: SceneObject, preposition: str, preposition_vector):
@@ -252,18 +288,9 @@ class ObjectModifier:
                     debug_print(f"🔧 Before scaling: scaleX={scene_obj.vector['scaleX']}, scaleY={scene_obj.vector['scaleY']}, scaleZ={scene_obj.vector['scaleZ']}")
                     
                     # Scale values come from the location vector components
-                    if vector['locX'] != 0.0:
-                        scene_obj.vector['scaleX'] = vector['locX']
-                    if vector['locY'] != 0.0:
-                        scene_obj.vector['scaleY'] = vector['locY']
-                    if vector['locZ'] != 0.0:
-                        scene_obj.vector['scaleZ'] = vector['locZ']
+                    self.set_scale(scene_obj, vector['locX'], vector['locY'], vector['locZ'])
                     
                     debug_print(f"🔧 After scaling: scaleX={scene_obj.vector['scaleX']}, scaleY={scene_obj.vector['scaleY']}, scaleZ={scene_obj.vector['scaleZ']}")
-                    
-                    # Update transformation properties from vector (critical for renderer)
-                    scene_obj.update_transformations()
-                    debug_print(f"🔧 Updated transformation properties: scale={scene_obj.scale}")
         else:
             debug_print(f"🔧 No prepositional phrases found in noun phrase")
         
@@ -311,6 +338,21 @@ class ObjectModifier:
         scene_obj.update_transformations()
         debug_print(f"🔧 Updated transformation properties: scale={scene_obj.scale}")
     
+    def rotation_axis(self, vp: VerbPhrase) -> str:
+        """Get the rotation dimension a verb acts on ('rotX', 'rotY' or 'rotZ')."""
+        # Use semantic rotation axis dimensions instead of hardcoded verb strings
+        if hasattr(vp, 'vector') and vp.vector:
+            if vp.vector.isa('rotX'):
+                return 'rotX'
+            elif vp.vector.isa('rotY'):
+                return 'rotY'
+        # Default to Z-axis rotation for generic 'rotate' verb (or no vector information)
+        return 'rotZ'
+    
+    def is_rotation_verb(self, vp: VerbPhrase) -> bool:
+        """Check whether a transform verb phrase rotates rather than scales."""
+        return vp.verb in ['rotate', 'xrotate', 'yrotate', 'zrotate'] or (hasattr(vp, 'vector') and vp.vector and (vp.vector.isa('rotX') or vp.vector.isa('rotY') or vp.vector.isa('rotZ')))
+    
     def _apply_rotation(self, scene_obj: SceneObject, vp: VerbPhrase, verb: str):
         """Apply rotation to an object based on verb phrase and rotation verb."""
         debug_print(f"🔧 _apply_rotation called with scene_obj: {scene_obj.name}, verb: {verb}")
@@ -331,32 +373,13 @@ class ObjectModifier:
                     # Check if we have a vector literal with X,Y,Z coordinates
                     if vector.isa('vector') and (vector['locX'] != 0.0 or vector['locY'] != 0.0 or vector['locZ'] != 0.0):
                         # Multi-axis rotation from vector coordinates [x,y,z]
-                        scene_obj.vector['rotX'] = vector['locX']  # X rotation from locX
-                        scene_obj.vector['rotY'] = vector['locY']  # Y rotation from locY
-                        scene_obj.vector['rotZ'] = vector['locZ']  # Z rotation from locZ
+                        self.set_rotation(scene_obj, vector['locX'], vector['locY'], vector['locZ'])
                         debug_print(f"🔧 Applied multi-axis rotation from vector [{vector['locX']}, {vector['locY']}, {vector['locZ']}]")
                     else:
                         # Single-axis rotation - check for single angle value
                         angle = vector['number'] if hasattr(vector, '__getitem__') else 0.0
                         debug_print(f"🔧 Extracted single angle: {angle}")
-                        
-                        # Use semantic rotation axis dimensions instead of hardcoded verb strings
-                        if hasattr(vp, 'vector') and vp.vector:
-                            if vp.vector.isa('rotX'):
-                                scene_obj.vector['rotX'] = angle
-                            elif vp.vector.isa('rotY'):
-                                scene_obj.vector['rotY'] = angle
-                            elif vp.vector.isa('rotZ'):
-                                scene_obj.vector['rotZ'] = angle
-                            else:
-                                # Default to Z-axis rotation for generic 'rotate' verb
-                                scene_obj.vector['rotZ'] = angle
-                        else:
-                            # Fallback to Z-axis rotation if no vector information
-                            scene_obj.vector['rotZ'] = angle
-                    
-                    # Update the SceneObject's transformation properties from the vector
-                    scene_obj.update_transformations()
+                        self.set_axis_rotation(scene_obj, self.rotation_axis(vp), angle)
                     
                     debug_print(f"🔧 After rotation: rotX={scene_obj.vector['rotX']}, rotY={scene_obj.vector['rotY']}, rotZ={scene_obj.vector['rotZ']}")
                     debug_print(f"🔧 SceneObject rotation: {scene_obj.rotation}")
@@ -5,11 +5,13 @@ This module handles finding and resolving references to scene objects,
 including pronoun resolution and semantic matching.
 """
 
-from typing import List, Tuple
+import numpy
+from typing import List, Optional, Tuple
 from latn.pos.verb_phrase import VerbPhrase
 from latn.pos.noun_phrase import NounPhrase
 from engraf.visualizer.scene.scene_object import SceneObject
 from latn.lexer.vector_space import VectorSpace
+from latn.An_N_Space_Model.vector_dimensions import VECTOR_DIMENSIONS
 
 
 class ObjectResolver:
@@ -17,16 +19,20 @@ class ObjectResolver:
     Handles finding and resolving references to scene objects.
     """
     
-    def __init__(self, scene, last_acted_object_ref):
+    def __init__(self, scene, last_acted_object_ref, resolution_context_ref=None):
         """
         Initialize the object resolver.
         
         Args:
             scene: The scene model containing objects
             last_acted_object_ref: Reference to the last acted upon object (list with single string)
+            resolution_context_ref: Reference to the current command's ResolutionContext
+                                    (list with single context or None). When a context is
+                                    open, matches are computed once per noun phrase.
         """
         self.scene = scene
         self.last_acted_object_ref = last_acted_object_ref
+        self.resolution_context_ref = resolution_context_ref or [None]
     
     def resolve_target_objects(self, vp: VerbPhrase) -> List[str]:
         """Resolve target entities for modification verbs."""
@@ -37,7 +43,11 @@ class ObjectResolver:
         # Check for pronouns (e.g., "move it")
         if vp.noun_phrase and vp.noun_phrase.pronoun:
             # Use the proper pronoun resolution from scene_model
-            resolved_entities = resolve_pronoun(vp.noun_phrase.pronoun, self.scene)
+            context = self.resolution_context_ref[0]
+            if context is not None:
+                resolved_entities = context.pronoun(vp.noun_phrase.pronoun)
+            else:
+                resolved_entities = resolve_pronoun(vp.noun_phrase.pronoun, self.scene)
             target_objects.extend([entity.entity_id for entity in resolved_entities])
         
         # Check for specific noun phrases
@@ -50,146 +60,120 @@ class ObjectResolver:
     
     def find_objects_by_description(self, np: NounPhrase) -> List[str]:
         """Find objects in the scene that match a noun phrase description using vector distance."""
-        # Get all objects with their match scores
-        object_scores = []
-        
-        for scene_obj in self.scene.objects:
-            if self._object_matches_description(scene_obj, np):
-                # Calculate distance for ranking (lower is better)
-                distance = 0.0
-                if hasattr(np, 'vector') and np.vector:
-                    distance = self._calculate_vector_distance(scene_obj.vector, np.vector)
-                
-                object_scores.append((scene_obj.object_id, distance))
-        
-        # Sort by distance (best matches first) and return object IDs
-        object_scores.sort(key=lambda x: x[1])
-        return [obj_id for obj_id, _ in object_scores]
+        context = self.resolution_context_ref[0]
+        if context is not None:
+            return context.ranked(np, lambda candidates: self._rank_candidates(candidates, np))
+        return self._rank_candidates(self.scene.objects, np)
     
-    def _object_matches_description(self, scene_obj: SceneObject, np: NounPhrase) -> bool:
-        """Check if a scene object matches a noun phrase description using two-pass approach."""
+    def find_object(self, object_id: str) -> Optional[SceneObject]:
+        """Find a standalone scene object by ID."""
+        context = self.resolution_context_ref[0]
+        if context is not None:
+            return context.find_object(object_id)
+        for obj in self.scene.objects:
+            if obj.object_id == object_id:
+                return obj
+        return None
+    
+    def _rank_candidates(self, candidates: List[SceneObject], np: NounPhrase) -> List[str]:
+        """Filter candidate objects against a noun phrase and rank them by vector distance."""
         # First check if basic noun type matches
-        if np.noun and np.noun != scene_obj.name:
-            return False
+        typed = [obj for obj in candidates if not (np.noun and np.noun != obj.name)]
+        if not typed:
+            return []
         
         # If no vector information in the noun phrase, just match by type
         if not hasattr(np, 'vector') or not np.vector:
-            return True
-        
-        # Check for clear feature mismatches (e.g., "red cube" vs blue cube)
-        if self._has_feature_mismatch(scene_obj.vector, np.vector):
-            return False
-        
-        # If we get here, the noun matches and there's no clear feature conflict
-        # This is a valid candidate - the find_objects_by_description method will
-        # use vector distance to rank multiple candidates
-        return True
+            return [obj.object_id for obj in typed]
+        
+        # Score every candidate at once: drop clear feature conflicts, then sort by distance
+        objects = _feature_matrix([obj.vector for obj in typed])
+        query = _feature_row(np.vector)
+        keep = numpy.flatnonzero(~_feature_mismatch_mask(objects, query))
+        distances = _weighted_distances(objects[keep], query)
+        return [typed[i].object_id for i in keep[numpy.argsort(distances, kind='stable')]]
     
     def _has_feature_mismatch(self, obj_vector: VectorSpace, query_vector: VectorSpace) -> bool:
         """Check if there's a clear feature mismatch (e.g., color conflict)."""
-        # Check for color mismatches - reject if query specifies a color that conflicts with object's color
-        color_features = ['red', 'green', 'blue']
-        
-        for color in color_features:
-            try:
-                obj_value = obj_vector[color]
-                query_value = query_vector[color]
-                
-                # If query strongly specifies this color (>0.5) but object doesn't have it (<=0.5)
-                if query_value > 0.5 and obj_value <= 0.5:
-                    return True
-                    
-            except (ValueError, IndexError):
-                # Feature not found in vector, skip it
-                continue
-        
-        # Also check for conflicting colors: if object has a strong color and query has a different strong color
-        try:
-            obj_colors = []
-            query_colors = []
-            
-            # Find which colors the object has
-            for color in color_features:
-                if obj_vector[color] > 0.5:
-                    obj_colors.append(color)
-                if query_vector[color] > 0.5:
-                    query_colors.append(color)
-            
-            # If both have colors and none overlap, it's a mismatch
-            if obj_colors and query_colors and not any(c in obj_colors for c in query_colors):
-                return True
-                
-        except (ValueError, IndexError):
-            pass
-        
-        return False
+        return bool(_feature_mismatch_mask(_feature_matrix([obj_vector]), _feature_row(query_vector))[0])
     
     def _calculate_vector_distance(self, obj_vector: VectorSpace, query_vector: VectorSpace) -> float:
         """Calculate sophisticated vector distance between object and query."""
-        # Define feature categories with different weights - ONLY semantic features, not POS features
-        feature_weights = {
-            # Color features (high weight - very specific)
-            'red': 2.0, 'green': 2.0, 'blue': 2.0,
-            # Size features (medium weight)
-            'scaleX': 1.5, 'scaleY': 1.5, 'scaleZ': 1.5,
-            # Position features (low weight - less relevant for matching)
-            'locX': 0.5, 'locY': 0.5, 'locZ': 0.5,
-            # Other semantic features
-            'texture': 1.0, 'transparency': 1.0
-        }
-        
-        total_distance = 0.0
-        total_weight = 0.0
-        
-        # Calculate weighted distance for each feature
-        for feature, weight in feature_weights.items():
-            try:
-                obj_value = obj_vector[feature]
-                query_value = query_vector[feature]
-                
-                # Special handling for binary features (colors)
-                if feature in ['red', 'green', 'blue']:
-                    # For colors, check if both are "on" (>0.5) or both are "off" (<0.5)
-                    obj_on = obj_value > 0.5
-                    query_on = query_value > 0.5
-                    
-                    if obj_on == query_on:
-                        # Perfect match for this color
-                        distance = 0.0
-                    else:
-                        # Mismatch - one has color, other doesn't
-                        distance = 1.0
-                
-                # Handle scale features
-                elif feature.startswith('scale'):
-                    # For scale, check if both indicate same size category
-                    obj_size = self._categorize_scale(obj_value)
-                    query_size = self._categorize_scale(query_value)
-                    
-                    if obj_size == query_size:
-                        distance = 0.0
-                    else:
-                        distance = abs(obj_value - query_value)
-                
-                # Handle other features with simple distance
-                else:
-                    distance = abs(obj_value - query_value)
-                
-                total_distance += distance * weight
-                total_weight += weight
-                
-            except (ValueError, IndexError):
-                # Feature not found in vector, skip it
-                continue
-        
-        # Return normalized distance (0.0 = perfect match, 1.0 = completely different)
-        return total_distance / total_weight if total_weight > 0 else 1.0
+        return float(_weighted_distances(_feature_matrix([obj_vector]), _feature_row(query_vector))[0])
     
     def _categorize_scale(self, scale_value: float) -> str:
         """Categorize a scale value into size categories."""
-        if scale_value >= 1.5:
-            return 'large'
-        elif scale_value <= 0.75:
-            return 'small' 
-        else:
-            return 'normal'
+        return ('small', 'normal', 'large')[int(_scale_categories(numpy.asarray(scale_value)))]
+
+
+# Define feature categories with different weights - ONLY semantic features, not POS features
+_FEATURE_WEIGHTS = {
+    # Color features (high weight - very specific)
+    'red': 2.0, 'green': 2.0, 'blue': 2.0,
+    # Size features (medium weight)
+    'scaleX': 1.5, 'scaleY': 1.5, 'scaleZ': 1.5,
+    # Position features (low weight - less relevant for matching)
+    'locX': 0.5, 'locY': 0.5, 'locZ': 0.5,
+    # Other semantic features
+    'texture': 1.0, 'transparency': 1.0
+}
+_COLOR_FEATURES = ['red', 'green', 'blue']
+
+# Positions of the matching features in the semantic vector, resolved once.
+# Features the vector space does not define are skipped, as before.
+_FEATURE_NAMES = [feature for feature in _FEATURE_WEIGHTS if feature in VECTOR_DIMENSIONS]
+_FEATURE_INDEX = numpy.array([VECTOR_DIMENSIONS.index(feature) for feature in _FEATURE_NAMES], dtype=int)
+_FEATURE_WEIGHT_VECTOR = numpy.array([_FEATURE_WEIGHTS[feature] for feature in _FEATURE_NAMES])
+_COLOR_MASK = numpy.array([feature in _COLOR_FEATURES for feature in _FEATURE_NAMES], dtype=bool)
+_SCALE_MASK = numpy.array([feature.startswith('scale') for feature in _FEATURE_NAMES], dtype=bool)
+_COLOR_COLUMNS = numpy.flatnonzero(_COLOR_MASK)
+
+
+def _feature_row(vector: VectorSpace):
+    """Get the matching features of one vector as a 1-D array."""
+    return vector.as_numpy_array()[_FEATURE_INDEX]
+
+
+def _feature_matrix(vectors: List[VectorSpace]):
+    """Get the matching features of several vectors as a candidates x features matrix."""
+    if not vectors:
+        return numpy.zeros((0, len(_FEATURE_NAMES)))
+    return numpy.stack([vector.as_numpy_array() for vector in vectors])[:, _FEATURE_INDEX]
+
+
+def _feature_mismatch_mask(objects, query):
+    """
+    Flag candidates with a clear color conflict with the query.
+    
+    A candidate conflicts if the query strongly specifies a color (>0.5) the
+    candidate lacks, or if both have strong colors and none overlap.
+    """
+    obj_on = objects[:, _COLOR_COLUMNS] > 0.5
+    query_on = query[_COLOR_COLUMNS] > 0.5
+    missing = (query_on & ~obj_on).any(axis=1)
+    disjoint = obj_on.any(axis=1) & query_on.any() & ~(obj_on & query_on).any(axis=1)
+    return missing | disjoint
+
+
+def _scale_categories(values):
+    """Categorize scale values: 0 small (<=0.75), 1 normal, 2 large (>=1.5)."""
+    return numpy.where(values >= 1.5, 2, numpy.where(values <= 0.75, 0, 1))
+
+
+def _weighted_distances(objects, query):
+    """
+    Weighted feature distance of every candidate to the query
+    (0.0 = perfect match, 1.0 = completely different).
+    """
+    total_weight = _FEATURE_WEIGHT_VECTOR.sum()
+    if total_weight <= 0:
+        return numpy.ones(len(objects))
+    
+    difference = numpy.abs(objects - query)
+    # For colors, check if both are "on" (>0.5) or both are "off"
+    color_distance = ((objects > 0.5) != (query > 0.5)).astype(float)
+    # For scale, values in the same size category count as a match
+    scale_distance = numpy.where(_scale_categories(objects) == _scale_categories(query), 0.0, difference)
+    
+    per_feature = numpy.where(_COLOR_MASK, color_distance, numpy.where(_SCALE_MASK, scale_distance, difference))
+    return per_feature @ _FEATURE_WEIGHT_VECTOR / total_weight
@@ -5,6 +5,7 @@ This module handles scene-level operations and utilities,
 including scene summary, clearing, and result formatting.
 """
 
+import logging
 from typing import Dict, Any, Union
 from latn.pos.sentence_phrase import SentencePhrase
 from latn.pos.noun_phrase import NounPhrase
@@ -12,6 +13,8 @@ from latn.pos.conjunction_phrase import ConjunctionPhrase
 from latn.lexer.vector_space import VectorSpace
 from engraf.visualizer.scene.scene_object import SceneObject
 
+logger = logging.getLogger(__name__)
+
 
 class SceneManager:
     """
@@ -25,7 +28,7 @@ class SceneManager:
         Args:
             scene: The scene model
             renderer: The renderer for visual updates
-            execution_history_ref: Reference to execution history (list)
+            execution_history_ref: Reference to the execution history (ExecutionHistory)
             object_counter_ref: Reference to object counter (list with single int)
             object_resolver: The object resolver for finding objects
         """
@@ -41,8 +44,8 @@ class SceneManager:
             'total_objects': len(self.scene.objects),
             'object_types': list(set(obj.name for obj in self.scene.objects)),
             'object_ids': [obj.object_id for obj in self.scene.objects],
-            'execution_history': len(self.execution_history_ref),
-            'last_action': self.execution_history_ref[-1] if self.execution_history_ref else None
+            'execution_history': self.execution_history_ref.total,
+            'last_action': self.execution_history_ref.last
         }
     
     def clear_scene(self):
@@ -51,7 +54,7 @@ class SceneManager:
         self.renderer.clear_scene()
         self.object_counter_ref[0] = 0
         self.execution_history_ref.clear()
-        print("✅ Scene cleared")
+        logger.info("✅ Scene cleared")
     
     def create_result(self, success: bool, message: str, sentence: str) -> Dict[str, Any]:
         """Create a standardized result dictionary."""
@@ -103,6 +106,8 @@ class SceneManager:
     
     def _apply_sentence_vector(self, scene_obj: SceneObject, sentence_vector: VectorSpace):
         """Apply sentence vector properties to a scene object."""
+        self.scene.touch(scene_obj)
+        
         # Apply color properties
         if 'red' in sentence_vector:
             scene_obj.vector['red'] = sentence_vector['red']
@@ -118,3 +123,5 @@ class SceneManager:
             scene_obj.vector['scaleY'] = sentence_vector['scaleY']
         if 'scaleZ' in sentence_vector:
             scene_obj.vector['scaleZ'] = sentence_vector['scaleZ']
+        
+        self.scene.refresh_attributes(scene_obj)
@@ -0,0 +1,159 @@
+"""
+Hypothesis Evaluation for ENGRAF
+
+LATN returns a ranked list of parse hypotheses, but the interpreter normally
+executes only the top-ranked one. This module dry-runs the top-k hypotheses
+so that a lower-ranked hypothesis that grounds and executes can win when the
+top one fails.
+
+Each hypothesis is validated and executed against the live scene inside a
+scene transaction that is always rolled back, so a dry run costs the entities
+it touches instead of a copy of the whole scene. Validation and execution are
+pure-Python work that threads could not overlap under the GIL, so hypotheses
+run one after another in rank order until the latency cap is spent. The
+caller commits the winning hypothesis afterwards.
+"""
+
+import copy
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+from engraf.diagnostics.stage_timer import NullStageTimer
+from engraf.interpreter.resolution_context import ResolutionContext
+from engraf.visualizer.renderers.null_renderer import NullRenderer
+
+
+class HypothesisEvaluator:
+    """
+    Evaluates competing parse hypotheses in rolled-back scene transactions.
+    """
+
+    def __init__(self, interpreter, max_hypotheses: int = 3, latency_cap: Optional[float] = None):
+        """
+        Initialize the hypothesis evaluator.
+
+        Args:
+            interpreter: The SentenceInterpreter whose live scene hypotheses are dry-run on
+            max_hypotheses: Number of top-ranked hypotheses to evaluate (k)
+            latency_cap: Wall-clock budget in seconds for the whole evaluation.
+                         Hypotheses not started when it expires are reported
+                         as timed out and cannot be selected. None means no cap.
+        """
+        self.interpreter = interpreter
+        self.max_hypotheses = max_hypotheses
+        self.latency_cap = latency_cap
+
+    def evaluate(self, hypotheses, sentence: str) -> List[Dict[str, Any]]:
+        """
+        Validate and dry-run the top-k hypotheses in rank order.
+
+        Args:
+            hypotheses: Ranked LATN hypotheses (best first)
+            sentence: The original sentence text
+
+        Returns:
+            One evaluation dict per considered hypothesis, in rank order, with
+            keys 'rank', 'status', 'success', 'message', 'elapsed_ms',
+            'has_effect' and 'sentence_parsed'.
+        """
+        evaluations = []
+        deadline = None if self.latency_cap is None else time.perf_counter() + self.latency_cap
+
+        for rank, hypothesis in enumerate(hypotheses[:self.max_hypotheses]):
+            if deadline is not None and time.perf_counter() >= deadline:
+                evaluation = self._evaluation(rank, 'timed_out', False, "Exceeded hypothesis latency cap", None)
+            elif len(hypothesis.tokens) != 1:
+                evaluation = self._evaluation(rank, 'unparsed', False,
+                                              "Hypothesis did not reduce to a sentence", 0.0)
+            else:
+                phrase = hypothesis.tokens[0].phrase
+                evaluation = self._dry_run(phrase, sentence)
+                evaluation['rank'] = rank
+                evaluation['sentence_parsed'] = phrase
+            evaluations.append(evaluation)
+
+        return evaluations
+
+    def select_best(self, evaluations: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Pick the evaluation to commit.
+
+        Successful hypotheses that actually changed the scene beat successful
+        no-ops; ties are broken by LATN rank (lower is better).
+        """
+        successful = [evaluation for evaluation in evaluations if evaluation['success']]
+        if not successful:
+            return None
+        return min(successful, key=lambda evaluation: (not evaluation['has_effect'], evaluation['rank']))
+
+    def _dry_run(self, phrase, sentence: str) -> Dict[str, Any]:
+        """Validate and execute one hypothesis on the live scene, then roll it back."""
+        start = time.perf_counter()
+        try:
+            # Handlers write parse-tree vectors into scene objects, so keep the
+            # phrase that may be committed later out of the dry run
+            phrase = copy.deepcopy(phrase)
+            with self._rolled_back(phrase):
+                is_valid, error_msg = self.interpreter.semantic_validator.validate_command(phrase, sentence)
+                if not is_valid:
+                    return self._evaluation(None, 'invalid', False, error_msg or "Validation failed",
+                                            self._elapsed_ms(start))
+
+                result = self.interpreter._execute_sentence(phrase, sentence)
+
+            has_effect = bool(result.get('objects_created') or result.get('objects_modified')
+                              or result.get('assemblies_created'))
+            evaluation = self._evaluation(None, 'executed', result['success'], result['message'],
+                                          self._elapsed_ms(start))
+            evaluation['has_effect'] = has_effect
+            return evaluation
+
+        except Exception as e:
+            return self._evaluation(None, 'error', False, f"Error evaluating hypothesis: {str(e)}",
+                                    self._elapsed_ms(start))
+
+    @contextmanager
+    def _rolled_back(self, phrase):
+        """
+        Run a block executing phrase against the live interpreter and undo
+        everything it did.
+
+        The scene changes are rolled back through a transaction; counters and the
+        last acted object are put back by hand. The renderer and stage timer are
+        swapped out meanwhile so dry runs are neither drawn nor timed as commands.
+        """
+        live = self.interpreter
+        counters = (live.object_counter, live._assembly_counter[0], live.last_acted_object)
+        renderers = (live.object_modifier.renderer, live.scene_manager.renderer)
+        timer = live.timer
+        live.object_modifier.renderer = live.scene_manager.renderer = NullRenderer()
+        live.timer = NullStageTimer()
+        live._current_sentence_parsed = phrase
+        live._resolution_context[0] = ResolutionContext(live._scene_handle, use_grounding=True)
+        live.scene.begin_transaction()
+        try:
+            yield
+        finally:
+            live.scene.rollback_transaction()
+            live._resolution_context[0] = None
+            live._current_sentence_parsed = None
+            live.timer = timer
+            live.object_modifier.renderer, live.scene_manager.renderer = renderers
+            live.object_counter, live._assembly_counter[0], live.last_acted_object = counters
+
+    def _evaluation(self, rank, status: str, success: bool, message: str,
+                    elapsed_ms: Optional[float]) -> Dict[str, Any]:
+        """Create a standardized evaluation record."""
+        return {
+            'rank': rank,
+            'status': status,
+            'success': success,
+            'message': message,
+            'elapsed_ms': elapsed_ms,
+            'has_effect': False,
+            'sentence_parsed': None
+        }
+
+    def _elapsed_ms(self, start: float) -> float:
+        return (time.perf_counter() - start) * 1000.0
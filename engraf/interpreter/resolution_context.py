@@ -0,0 +1,148 @@
+"""
+Per-Command Resolution Context for ENGRAF
+
+This module shares noun-phrase-to-scene matching between the stages of one
+command. Without it the semantic validator counts matches with one scan of the
+scene, the object resolver scans and scores every object again, and the object
+modifier scans a third time to find each spatial reference object.
+
+A ResolutionContext gathers the type-matched candidates of each noun phrase
+once, reusing the LATN parse-time grounding (np.grounding) when it is present,
+and memoizes the resolver's ranking and pronoun resolution. The interpreter
+opens a context per command and invalidates it whenever a clause has changed
+the scene, so later clauses of a conjunction see the effects of earlier ones.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from engraf.visualizer.scene.scene_object import SceneObject
+
+
+class ResolutionContext:
+    """
+    Memoized noun phrase and pronoun resolution against one scene state.
+    """
+
+    def __init__(self, scene, use_grounding: bool = True):
+        """
+        Initialize the resolution context.
+
+        Args:
+            scene: The scene model (or scene handle) being resolved against
+            use_grounding: If True, take candidates from parse-time grounding when a
+                           noun phrase has it. Disable for phrases parsed against an
+                           older scene (e.g. cached command plans).
+        """
+        self.scene = scene
+        self.use_grounding = use_grounding
+        self._objects: Optional[List[SceneObject]] = None
+        self._object_index: Dict[str, int] = {}
+        self._candidates: Dict[int, Tuple[Any, List[SceneObject]]] = {}
+        self._rankings: Dict[int, Tuple[Any, List[str]]] = {}
+        self._pronouns: Dict[str, list] = {}
+
+    def invalidate(self) -> None:
+        """Forget everything computed so far (call after the scene changes)."""
+        self._objects = None
+        self._object_index = {}
+        self._candidates.clear()
+        self._rankings.clear()
+        self._pronouns.clear()
+
+    def objects(self) -> List[SceneObject]:
+        """Get the scene's standalone objects, indexed once per scene state."""
+        if self._objects is None:
+            self._objects = self.scene.objects
+            self._object_index = {obj.object_id: i for i, obj in enumerate(self._objects)}
+        return self._objects
+
+    def find_object(self, object_id: str) -> Optional[SceneObject]:
+        """Find a standalone scene object by ID without scanning the scene."""
+        objects = self.objects()
+        index = self._object_index.get(object_id)
+        return objects[index] if index is not None else None
+
+    def candidates(self, np) -> List[SceneObject]:
+        """
+        Get the scene objects whose type matches a noun phrase, in scene order.
+
+        A noun phrase without a noun matches every object. Only the type is
+        checked here; attribute filtering and ranking stay with the callers.
+        """
+        cached = self._candidates.get(id(np))
+        if cached is not None:
+            return cached[1]
+
+        candidates = self.grounded_candidates(np)
+        if candidates is None:
+            candidates = self._typed_candidates(np.noun)
+
+        self._candidates[id(np)] = (np, candidates)  # Keep np alive so its id stays unique
+        return candidates
+
+    def ranked(self, np, rank: Callable[[List[SceneObject]], List[str]]) -> List[str]:
+        """
+        Get a noun phrase's ranked object IDs, computing them with rank(candidates) once.
+        """
+        cached = self._rankings.get(id(np))
+        if cached is not None:
+            return cached[1]
+        ranking = rank(self.candidates(np))
+        self._rankings[id(np)] = (np, ranking)
+        return ranking
+
+    def pronoun(self, word: str) -> list:
+        """Resolve a pronoun against the scene once per scene state."""
+        from engraf.visualizer.scene.scene_model import resolve_pronoun
+
+        word = word.lower()
+        resolved = self._pronouns.get(word)
+        if resolved is None:
+            resolved = self._pronouns[word] = resolve_pronoun(word, self.scene)
+        return resolved
+
+    def grounded_candidates(self, np) -> Optional[List[SceneObject]]:
+        """
+        Map a noun phrase's parse-time grounding onto the current scene.
+        
+        Returns:
+            Grounded type-matched objects in scene order, or None if grounding is
+            disabled, absent or refers to nothing in this scene
+        """
+        if not self.use_grounding:
+            return None
+        grounding = getattr(np, 'grounding', None)
+        if not isinstance(grounding, dict):
+            return None
+        if grounding.get('scene_objects'):
+            grounded = grounding['scene_objects']
+        elif grounding.get('scene_object') is not None:
+            grounded = [grounding['scene_object']]
+        else:
+            return None
+
+        self.objects()
+        indices = set()
+        for entry in grounded:
+            # Entries may be bare entities or (similarity, entity) pairs
+            entity = entry[-1] if isinstance(entry, tuple) else entry
+            index = self._object_index.get(getattr(entity, 'entity_id', None))
+            if index is not None:
+                indices.add(index)
+
+        if not indices:
+            # Grounded against entities this scene does not have (e.g. assemblies only)
+            return None
+
+        noun = np.noun
+        return [self._objects[i] for i in sorted(indices) if not noun or self._objects[i].name == noun]
+
+    def _typed_candidates(self, noun: Optional[str]) -> List[SceneObject]:
+        """Get the standalone objects of a type, from the scene's attribute index when it has one."""
+        objects = self.objects()
+        index = getattr(self.scene, 'attribute_index', None)
+        if index is None:
+            return [obj for obj in objects if not noun or obj.name == noun]
+
+        positions = (self._object_index.get(object_id) for object_id in index.ids(index.select(noun=noun, in_assembly=False)))
+        return [objects[i] for i in sorted(i for i in positions if i is not None)]
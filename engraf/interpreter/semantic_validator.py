@@ -7,14 +7,17 @@ allowed when there are at least 3 circles in the scene.
 """
 
 from engraf.visualizer.scene.scene_model import SceneModel
+from engraf.visualizer.scene.attribute_index import COLOR_CHANNELS
 from latn.pos.conjunction_phrase import ConjunctionPhrase
 
 
 class SemanticAgreementValidator:
     """Validates semantic agreement between commands and scene state."""
     
-    def __init__(self, scene_model: SceneModel):
+    def __init__(self, scene_model: SceneModel, resolution_context_ref=None):
         self.scene = scene_model
+        # Shared with the ObjectResolver so one command matches each noun phrase once
+        self.resolution_context_ref = resolution_context_ref or [None]
     
     def validate_command(self, sentence, original_text=None):
         """
@@ -108,7 +111,11 @@ class SemanticAgreementValidator:
                 return None, None  # Unknown pronoun type
             
             try:
-                resolved_objects = resolve_pronoun(pronoun_word, self.scene)
+                context = self.resolution_context_ref[0]
+                if context is not None:
+                    resolved_objects = context.pronoun(pronoun_word)
+                else:
+                    resolved_objects = resolve_pronoun(pronoun_word, self.scene)
                 available_count = len(resolved_objects)
                 
                 # For semantic validation, we always expect the resolved count
@@ -156,11 +163,16 @@ class SemanticAgreementValidator:
         if not noun_phrase or not noun_phrase.noun:
             return 0
             
-        count = 0
-        for obj in self.scene.objects:
-            if self._object_matches_noun_phrase(obj, noun_phrase):
-                count += 1
-        return count
+        # Grounded noun phrases only need their (few) grounded objects checked
+        context = self.resolution_context_ref[0]
+        grounded = context.grounded_candidates(noun_phrase) if context is not None else None
+        if grounded is not None:
+            return sum(1 for obj in grounded if self._object_matches_noun_phrase(obj, noun_phrase))
+        
+        # Otherwise count standalone objects of this type having every requested color (> 0)
+        colors = [color for color in COLOR_CHANNELS if noun_phrase.vector and noun_phrase.vector[color] > 0]
+        index = self.scene.attribute_index
+        return index.count(index.select(noun=noun_phrase.noun, colors_present=colors, in_assembly=False))
     
     def _object_matches_noun_phrase(self, obj, noun_phrase):
         """Check if an object matches all attributes specified in the noun phrase."""
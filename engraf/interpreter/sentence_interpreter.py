@@ -8,6 +8,7 @@ for different aspects of sentence interpretation.
 Refactored for better maintainability and separation of concerns.
 """
 
+import logging
 from typing import Dict, Any, Union, Optional
 from latn.lexer.latn_layer_executor import LATNLayerExecutor
 from latn.lexer.token_stream import TokenStream, tokenize
@@ -17,6 +18,8 @@ from latn.pos.verb_phrase import VerbPhrase
 from latn.pos.conjunction_phrase import ConjunctionPhrase
 from engraf.visualizer.scene.scene_model import SceneModel
 from engraf.visualizer.scene.temporal_scenes import TemporalScenes
+from engraf.visualizer.scene.scene_handle import SceneHandle
+from engraf.visualizer.scene.scene_diff import diff_scenes
 from latn.utils.debug import debug_print
 # VPython renderer will be imported conditionally to avoid hanging
 
@@ -26,6 +29,30 @@ from .handlers import ObjectCreator, ObjectModifier, ObjectResolver, SceneManage
 # Import semantic agreement validation
 from .semantic_validator import SemanticAgreementValidator
 
+# Import dry-run evaluation of competing parse hypotheses
+from .hypothesis_evaluator import HypothesisEvaluator
+
+# Import per-command sharing of noun phrase matches
+from .resolution_context import ResolutionContext
+
+# Import compiled command plans for repeated sentence shapes
+from .command_plan import CommandPlanCache, compile_plan, sentence_template
+
+# Import batch creation for quantity-and-layout sentences
+from .bulk_creation import compile_bulk_plan, parse_bulk_command
+
+# Import the bounded record of executed commands
+from .execution_history import ExecutionHistory
+
+# Import the do-nothing renderer used when none is given
+from engraf.visualizer.renderers.null_renderer import NullRenderer
+
+# Import optional per-stage latency instrumentation
+from engraf.diagnostics.stage_timer import StageTimer, NullStageTimer
+from engraf.diagnostics.tracing import get_tracer
+
+logger = logging.getLogger(__name__)
+
 
 class SentenceInterpreter:
     """
@@ -33,36 +60,56 @@ class SentenceInterpreter:
     using specialized handlers for different aspects of interpretation.
     """
     
-    def __init__(self, renderer=None):
+    def __init__(self, renderer=None, scene: Optional[SceneModel] = None,
+                 parallel_hypotheses: int = 1, hypothesis_latency_cap: Optional[float] = None,
+                 collect_timings: bool = False, plan_cache_size: int = 0,
+                 history_size: int = 1000, history_sink=None):
         """
         Initialize the sentence interpreter with specialized handlers.
         
         Args:
-            renderer: The renderer to use for visualization (e.g., VPythonRenderer, MockRenderer)
+            renderer: The renderer to use for visualization (e.g., VPythonRenderer, MockRenderer).
+                      If None, a NullRenderer is used and nothing is drawn.
+            scene: Initial scene state. If None, starts with an empty scene.
+            parallel_hypotheses: Number of top-ranked parse hypotheses to dry-run
+                                 before committing one. 1 (default) executes only the best one.
+            hypothesis_latency_cap: Wall-clock budget in seconds for dry-running
+                                    hypotheses. None means no cap.
+            collect_timings: If True, time every interpretation stage, return the
+                             timings under a 'timings' key and aggregate them into
+                             rolling per-stage latency histograms.
+            plan_cache_size: Number of compiled command plans to cache by sentence
+                             template. Sentences matching a cached template skip
+                             parsing and run the plan directly. 0 (default) disables.
+            history_size: Number of compact execution records kept in memory.
+            history_sink: Optional path or text stream to append every full
+                          execution result to, one JSON object per line.
         """
         if renderer is None:
-            # Import VPython renderer only when needed
-            from engraf.visualizer.renderers.vpython_renderer import VPythonRenderer
-            renderer = VPythonRenderer(headless=True)
+            # Headless by default; VPython is only loaded when a caller asks for it
+            renderer = NullRenderer()
         
         # Core components
         self.renderer = renderer
-        self.temporal_scenes = TemporalScenes()
-        self.scene = self.temporal_scenes.get_current_scene()  # For backward compatibility
+        self.temporal_scenes = TemporalScenes(scene)
+        # Shared indirection to the current scene; handlers read through it so
+        # temporal navigation only has to swap what it points to
+        self._scene_handle = SceneHandle(self.temporal_scenes.get_current_scene())
         
         # State tracking using references for handlers
         self._object_counter = [0]  # Use list for mutable reference
-        self._execution_history = []  # Use underscore for consistency
+        self._execution_history = ExecutionHistory(history_size, history_sink)  # Bounded, compact records
         self._last_acted_object: list[Optional[str]] = [None]  # Use list for mutable reference
         self._assembly_counter = [0]  # Assembly counter for unique IDs
+        self._resolution_context: list[Optional[ResolutionContext]] = [None]  # Open only while a command runs
         
         # Initialize specialized handlers
-        self.object_resolver = ObjectResolver(self.scene, self._last_acted_object)
-        self.object_creator = ObjectCreator(self.scene, self._object_counter)
-        self.object_modifier = ObjectModifier(self.scene, self.renderer, self.object_resolver)
-        self.assembly_creator = AssemblyCreator(self.scene, self._assembly_counter, self.object_resolver)
+        self.object_resolver = ObjectResolver(self._scene_handle, self._last_acted_object, self._resolution_context)
+        self.object_creator = ObjectCreator(self._scene_handle, self._object_counter)
+        self.object_modifier = ObjectModifier(self._scene_handle, self.renderer, self.object_resolver)
+        self.assembly_creator = AssemblyCreator(self._scene_handle, self._assembly_counter, self.object_resolver)
         self.scene_manager = SceneManager(
-            self.scene, 
+            self._scene_handle, 
             self.renderer, 
             self._execution_history, 
             self._object_counter,
@@ -70,7 +117,20 @@ class SentenceInterpreter:
         )
         
         # Initialize semantic agreement validator
-        self.semantic_validator = SemanticAgreementValidator(self.scene)
+        self.semantic_validator = SemanticAgreementValidator(self._scene_handle, self._resolution_context)
+        
+        # Per-stage latency instrumentation (no-op unless enabled)
+        self.timer = StageTimer() if collect_timings else NullStageTimer()
+        
+        # Compiled plans for previously seen sentence templates (None when disabled)
+        self.plan_cache = CommandPlanCache(plan_cache_size) if plan_cache_size > 0 else None
+        
+        # Hypothesis evaluation (only used when k > 1)
+        self.hypothesis_evaluator = HypothesisEvaluator(
+            self,
+            max_hypotheses=parallel_hypotheses,
+            latency_cap=hypothesis_latency_cap
+        )
         
     def interpret(self, sentence: str) -> Dict[str, Any]:
         """
@@ -80,18 +140,62 @@ class SentenceInterpreter:
             sentence: The English sentence to interpret
             
         Returns:
-            Dict containing execution results and metadata
+            Dict containing execution results and metadata (plus per-stage
+            'timings' in milliseconds when timing collection is enabled)
         """
+        self.timer.begin()
+        with get_tracer().span('interpret', sentence=sentence, scene_size=len(self.scene.entities)) as span:
+            result = self._interpret(sentence)
+            span.set('success', result.get('success'))
+        timings = self.timer.finish()
+        if timings is not None:
+            result['timings'] = timings
+        # Record commands that got as far as execution (not parse/validation failures)
+        if result.get('sentence_parsed') is not None:
+            self._execution_history.append(result)
+        return result
+    
+    def _interpret(self, sentence: str) -> Dict[str, Any]:
+        """Run the interpretation stages for one sentence."""
+        timer = self.timer
         try:
             # Step 1: Check for temporal navigation commands
-            sentence_lower = sentence.lower().strip()
-            if "go back in time" in sentence_lower:
+            with timer.stage('temporal_check'):
+                sentence_lower = sentence.lower().strip()
+                go_back = "go back in time" in sentence_lower
+                go_forward = not go_back and "go forward in time" in sentence_lower
+            if go_back:
                 return self.go_back_in_time()
-            elif "go forward in time" in sentence_lower:
+            elif go_forward:
                 return self.go_forward_in_time()
             
+            # Reuse a compiled plan if this sentence shape has been executed before
+            if self.plan_cache is not None:
+                with timer.stage('plan_lookup'):
+                    template, params = sentence_template(sentence)
+                    plan = self.plan_cache.get(template)
+                if plan is not None:
+                    return self._commit_plan(plan, params, sentence)
+            
+            # Quantity-and-layout creation ("draw 500 red cubes in a grid") runs as one batch
+            bulk = parse_bulk_command(sentence)
+            if bulk is not None:
+                plan = self._compile_bulk_command(bulk, sentence)
+                if plan is not None:
+                    result = self._commit_plan(plan, [], sentence, cached=False)
+                    if self.plan_cache is not None and result['success']:
+                        self.plan_cache.put(plan)
+                    return result
+            
             # Step 2: Parse the sentence using LATN (with scene for pronoun resolution)
-            result = LATNLayerExecutor(self.scene).execute_layer5(sentence)
+            with timer.stage('parse'), get_tracer().span('parse', sentence=sentence) as span:
+                result = LATNLayerExecutor(self.scene).execute_layer5(sentence)
+                span.set('hypotheses', len(result.hypotheses) if result.hypotheses else 0)
+            
+            # Optionally evaluate several competing hypotheses instead of just the best one
+            if self.hypothesis_evaluator.max_hypotheses > 1 and result.success and len(result.hypotheses) > 1:
+                return self._interpret_hypotheses(result.hypotheses, sentence)
+            
             best_hypothesis = None
             if result.success and result.hypotheses:
                 best_hypothesis = result.hypotheses[0]
@@ -99,35 +203,151 @@ class SentenceInterpreter:
             if best_hypothesis is None or len(best_hypothesis.tokens)!=1 :
                 return self.scene_manager.create_result(False, "Failed to parse sentence", sentence)
             
-            # Store the parsed sentence for access in transform methods
-            self._current_sentence_parsed = best_hypothesis.tokens[0].phrase
+            return self._commit_parsed_sentence(best_hypothesis.tokens[0].phrase, sentence)
             
+        except Exception as e:
+            logger.exception("🚨 Exception caught in interpret: %s: %s", type(e).__name__, e)
+            return self.scene_manager.create_result(False, f"Error interpreting sentence: {str(e)}", sentence)
+    
+    def _commit_parsed_sentence(self, parsed_sentence: SentencePhrase, sentence: str) -> Dict[str, Any]:
+        """Validate and execute a parsed sentence against the live scene, then snapshot and render."""
+        # Store the parsed sentence for access in transform methods
+        self._current_sentence_parsed = parsed_sentence
+        
+        # Match noun phrases once for validation and execution, starting from parse-time grounding
+        self._resolution_context[0] = ResolutionContext(self._scene_handle, use_grounding=True)
+        try:
             # Step 3: Validate semantic agreement with scene state
-            is_valid, error_msg = self.semantic_validator.validate_command(self._current_sentence_parsed, sentence)
+            with self.timer.stage('validate'), get_tracer().span('validate'):
+                is_valid, error_msg = self.semantic_validator.validate_command(self._current_sentence_parsed, sentence)
             if not is_valid:
                 return self.scene_manager.create_result(False, error_msg or "Validation failed", sentence)
             
-            # Step 4: Execute the parsed sentence (already validated non-None above)
-            assert self._current_sentence_parsed is not None
-            result = self._execute_sentence(self._current_sentence_parsed, sentence)
+            # Compile before executing: execution hands parsed vectors to new scene objects
+            plan = None
+            if self.plan_cache is not None:
+                with self.timer.stage('compile'):
+                    plan = compile_plan(self._current_sentence_parsed, sentence, self)
             
-            # Step 5: Update the visual scene
-            if result['success']:
-                # Take a snapshot after successful operations that modify the scene
-                if result.get('objects_created') or result.get('objects_modified'):
-                    self.temporal_scenes.add_scene_snapshot(self.scene)
-                self.renderer.render_scene(self.scene)
+            # Step 4: Execute the parsed sentence (all or nothing)
+            with self.timer.stage('execute'), get_tracer().span('execute'):
+                result = self._execute_atomically(
+                    lambda: self._execute_sentence(self._current_sentence_parsed, sentence))
+        finally:
+            self._resolution_context[0] = None
+            self._current_sentence_parsed = None  # Release the parse tree
+        
+        if plan is not None and result['success']:
+            self.plan_cache.put(plan)
+        
+        return self._update_visual_scene(result)
+    
+    def _compile_bulk_command(self, bulk, sentence: str):
+        """Parse a bulk command's one-object description and compile the batch plan, or return None."""
+        with self.timer.stage('parse'), get_tracer().span('parse', sentence=bulk.description_sentence):
+            result = LATNLayerExecutor(self.scene).execute_layer5(bulk.description_sentence)
+        if not (result.success and result.hypotheses) or len(result.hypotheses[0].tokens) != 1:
+            return None
+        with self.timer.stage('compile'):
+            return compile_bulk_plan(bulk, result.hypotheses[0].tokens[0].phrase, sentence, self)
+    
+    def _commit_plan(self, plan, params, sentence: str, cached: bool = True) -> Dict[str, Any]:
+        """Validate and run a command plan against the live scene, then snapshot and render."""
+        self._current_sentence_parsed = plan.sentence_parsed
+        
+        # The cached parse was grounded against an older scene, so match from scratch
+        self._resolution_context[0] = ResolutionContext(self._scene_handle, use_grounding=False)
+        try:
+            # Validation only depends on the referenced objects, which the template fixes
+            with self.timer.stage('validate'), get_tracer().span('validate'):
+                is_valid, error_msg = self.semantic_validator.validate_command(plan.sentence_parsed, sentence)
+            if not is_valid:
+                return self.scene_manager.create_result(False, error_msg or "Validation failed", sentence)
             
+            with self.timer.stage('execute'), get_tracer().span('execute', plan=plan.template):
+                result = self._execute_atomically(lambda: self._execute_plan(plan, params, sentence, cached))
+        finally:
+            self._resolution_context[0] = None
+            self._current_sentence_parsed = None
+        
+        return self._update_visual_scene(result)
+    
+    def _execute_plan(self, plan, params, sentence: str, cached: bool = True) -> Dict[str, Any]:
+        """Run a command plan's steps."""
+        try:
+            result = {
+                'success': True,
+                'message': f"Successfully executed: {sentence}",
+                'sentence': sentence,
+                'sentence_parsed': plan.sentence_parsed,
+                'plan_cache_hit': cached
+            }
+            result.update(plan.execute(self, params))
             return result
-            
         except Exception as e:
-            import traceback
-            print(f"🚨 Exception caught in interpret:")
-            print(f"🚨 Exception type: {type(e)}")
-            print(f"🚨 Exception message: {str(e)}")
-            print(f"🚨 Traceback:")
-            traceback.print_exc()
-            return self.scene_manager.create_result(False, f"Error interpreting sentence: {str(e)}", sentence)
+            return self.scene_manager.create_result(False, f"Error executing sentence: {str(e)}", sentence)
+    
+    def _execute_atomically(self, execute) -> Dict[str, Any]:
+        """
+        Run one command in a scene transaction. If it fails, the scene (and the
+        last acted object) are rolled back to how they were before it started.
+        """
+        last_acted_object = self._last_acted_object[0]
+        self.scene.begin_transaction()
+        try:
+            result = execute()
+        except BaseException:
+            self._roll_back(last_acted_object)
+            raise
+        
+        if result['success']:
+            self.scene.commit_transaction()
+        else:
+            self._roll_back(last_acted_object)
+        return result
+    
+    def _roll_back(self, last_acted_object: Optional[str]):
+        """Roll back the open command transaction and redraw what it had changed."""
+        diff = self.scene.rollback_transaction().diff()
+        self._last_acted_object[0] = last_acted_object
+        if diff.is_empty():
+            return
+        logger.info("↩️  Rolled back failed command: %s", diff)
+        if hasattr(self.renderer, 'apply_scene_diff'):
+            self.renderer.apply_scene_diff(self.scene, diff)
+        else:
+            self.renderer.render_scene(self.scene)
+    
+    def _update_visual_scene(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Snapshot and render after a command executed against the live scene."""
+        # Step 5: Update the visual scene
+        if result['success']:
+            # Take a snapshot after successful operations that modify the scene
+            if result.get('objects_created') or result.get('objects_modified'):
+                with self.timer.stage('snapshot'), get_tracer().span('snapshot', scene_size=len(self.scene.entities)):
+                    self.temporal_scenes.add_scene_snapshot(self.scene)
+            with self.timer.stage('render'), get_tracer().span('render', scene_size=len(self.scene.entities)):
+                self.renderer.render_scene(self.scene)
+        
+        return result
+    
+    def _interpret_hypotheses(self, hypotheses, sentence: str) -> Dict[str, Any]:
+        """Dry-run the top-k hypotheses and commit the best successful one."""
+        with self.timer.stage('hypotheses'), get_tracer().span('hypotheses', candidates=len(hypotheses)):
+            evaluations = self.hypothesis_evaluator.evaluate(hypotheses, sentence)
+        best = self.hypothesis_evaluator.select_best(evaluations)
+        
+        if best is None:
+            result = self.scene_manager.create_result(False, "No parse hypothesis could be executed", sentence)
+        else:
+            result = self._commit_parsed_sentence(best['sentence_parsed'], sentence)
+            result['selected_hypothesis'] = best['rank']
+        
+        result['hypothesis_evaluations'] = [
+            {key: value for key, value in evaluation.items() if key != 'sentence_parsed'}
+            for evaluation in evaluations
+        ]
+        return result
     
     def _execute_sentence(self, parsed_sentence: SentencePhrase, original_sentence: str) -> Dict[str, Any]:
         """Execute a parsed sentence in the 3D scene using specialized handlers."""
@@ -149,26 +369,41 @@ class SentenceInterpreter:
             
             # Handle subject if present
             if hasattr(parsed_sentence, 'subject') and parsed_sentence.subject:
-                subject_result = self.scene_manager.execute_subject(parsed_sentence.subject)
+                with self.timer.stage('execute.scene_manager'):
+                    subject_result = self.scene_manager.execute_subject(parsed_sentence.subject)
                 result.update(subject_result)
             
             # Handle tobe sentences (e.g., "the cube is red")
             if hasattr(parsed_sentence, 'tobe') and parsed_sentence.tobe:
-                tobe_result = self.scene_manager.execute_tobe_sentence(parsed_sentence)
+                with self.timer.stage('execute.scene_manager'):
+                    tobe_result = self.scene_manager.execute_tobe_sentence(parsed_sentence)
                 result.update(tobe_result)
             
-            self._execution_history.append(result)
             return result
             
         except Exception as e:
             return self.scene_manager.create_result(False, f"Error executing sentence: {str(e)}", original_sentence)
     
     def _execute_single_predicate(self, predicate: VerbPhrase, result) -> bool:
-            phrase_result = self._execute_verb_phrase(predicate)
-            result['objects_created'].extend(phrase_result.get('objects_created', []))
-            result['objects_modified'].extend(phrase_result.get('objects_modified', []))
-            result['actions_performed'].extend(phrase_result.get('actions_performed', []))
+            # Each clause runs in a nested transaction, so a failed clause leaves nothing
+            # behind (and the alternative in a disjunction starts from a clean scene)
+            self.scene.begin_transaction()
+            try:
+                phrase_result = self._execute_verb_phrase(predicate)
+            except BaseException:
+                self.scene.rollback_transaction()
+                raise
             success = phrase_result.get('success', True)
+            if success:
+                self.scene.commit_transaction()
+                result['objects_created'].extend(phrase_result.get('objects_created', []))
+                result['objects_modified'].extend(phrase_result.get('objects_modified', []))
+            else:
+                self.scene.rollback_transaction()
+            # Later clauses must see this clause's effects on the scene
+            if self._resolution_context[0] is not None:
+                self._resolution_context[0].invalidate()
+            result['actions_performed'].extend(phrase_result.get('actions_performed', []))
             result['success'] = result['success'] and success
             return success
 
@@ -230,13 +465,13 @@ class SentenceInterpreter:
             
             # Handle other vector space intents
             elif vp.vector.isa('edit') or vp.vector.isa('select'):
-                print(f"⚠️  Unsupported verb intent for: {verb}")
+                logger.warning("⚠️  Unsupported verb intent for: %s", verb)
             
             else:
-                print(f"⚠️  No recognized intent vector for: {verb}")
+                logger.warning("⚠️  No recognized intent vector for: %s", verb)
         
         else:
-            print(f"⚠️  No vector space information for verb: {verb}")
+            logger.warning("⚠️  No vector space information for verb: %s", verb)
         
         return result
     
@@ -245,19 +480,12 @@ class SentenceInterpreter:
         created_objects = []
         
         if vp.noun_phrase:
-            objects = self.object_creator.extract_objects_from_np(vp.noun_phrase)
+            with self.timer.stage('execute.object_creator'):
+                objects = self._extract_creation_objects(vp)
             
             for obj_info in objects:
-                if vp.noun_phrase and vp.prepositions:
-                    for prep in vp.prepositions:
-                        obj_info['prepositional_phrases'] = []
-                        if prep.vector.isa('spatial_proximity'): 
-                            obj_info['prepositional_phrases'].append(prep)
-                            break  
-                        else:
-                            continue
-
-                obj_id = self.object_creator.create_scene_object(obj_info)
+                with self.timer.stage('execute.object_creator'), get_tracer().span('create', type=obj_info['type']):
+                    obj_id = self.object_creator.create_scene_object(obj_info)
                 if obj_id:
                     created_objects.append(obj_id)
                     # Update the most recently acted upon object
@@ -265,12 +493,29 @@ class SentenceInterpreter:
         
         return created_objects
     
+    def _extract_creation_objects(self, vp: VerbPhrase) -> list[Dict[str, Any]]:
+        """Get the object descriptions a creation verb phrase asks for, with their positioning phrases."""
+        objects = self.object_creator.extract_objects_from_np(vp.noun_phrase)
+        
+        for obj_info in objects:
+            if vp.noun_phrase and vp.prepositions:
+                for prep in vp.prepositions:
+                    obj_info['prepositional_phrases'] = []
+                    if prep.vector.isa('spatial_proximity'): 
+                        obj_info['prepositional_phrases'].append(prep)
+                        break  
+                    else:
+                        continue
+        
+        return objects
+    
     def _handle_organize_verb(self, vp: VerbPhrase) -> Optional[str]:
         """Handle organize verbs like 'group' using the AssemblyCreator."""
         if vp.verb == 'group':
-            return self.assembly_creator.create_assembly_from_verb_phrase(vp)
+            with self.timer.stage('execute.assembly_creator'):
+                return self.assembly_creator.create_assembly_from_verb_phrase(vp)
         else:
-            print(f"⚠️  Unsupported organize verb: {vp.verb}")
+            logger.warning("⚠️  Unsupported organize verb: %s", vp.verb)
             return None
     
     def _handle_modification_verb(self, vp: VerbPhrase) -> list[str]:
@@ -285,10 +530,14 @@ class SentenceInterpreter:
         modified_objects = []
         
         # Find target objects using the ObjectResolver
-        target_objects = self.object_resolver.resolve_target_objects(vp)
+        with self.timer.stage('execute.object_resolver'), get_tracer().span('resolve', verb=vp.verb) as span:
+            target_objects = self.object_resolver.resolve_target_objects(vp)
+            span.set('targets', len(target_objects))
         
         for obj_id in target_objects:
-            if self.object_modifier.modify_scene_object(obj_id, vp):
+            with self.timer.stage('execute.object_modifier'), get_tracer().span('modify', verb=vp.verb, entity_id=obj_id):
+                modified = self.object_modifier.modify_scene_object(obj_id, vp)
+            if modified:
                 modified_objects.append(obj_id)
                 # Update the most recently acted upon object
                 self._last_acted_object[0] = obj_id
@@ -301,10 +550,7 @@ class SentenceInterpreter:
         if self.temporal_scenes.can_go_back():
             success = self.temporal_scenes.go_back()
             if success:
-                self.scene = self.temporal_scenes.get_current_scene()
-                # Update all handlers to use the new scene reference
-                self._update_handlers_scene_reference()
-                self.renderer.render_scene(self.scene)
+                self._switch_to_current_scene()
                 return {
                     'success': True,
                     'message': 'Traveled back in time',
@@ -321,10 +567,7 @@ class SentenceInterpreter:
         if self.temporal_scenes.can_go_forward():
             success = self.temporal_scenes.go_forward()
             if success:
-                self.scene = self.temporal_scenes.get_current_scene()
-                # Update all handlers to use the new scene reference
-                self._update_handlers_scene_reference()
-                self.renderer.render_scene(self.scene)
+                self._switch_to_current_scene()
                 return {
                     'success': True,
                     'message': 'Traveled forward in time',
@@ -345,21 +588,23 @@ class SentenceInterpreter:
             'can_go_forward': self.temporal_scenes.can_go_forward()
         }
     
-    def _update_handlers_scene_reference(self):
-        """Update all handlers to reference the current scene."""
-        # Update the handlers to use the new scene reference
-        self.object_resolver = ObjectResolver(self.scene, self._last_acted_object)
-        self.object_creator = ObjectCreator(self.scene, self._object_counter)
-        self.object_modifier = ObjectModifier(self.scene, self.renderer, self.object_resolver)
-        self.scene_manager = SceneManager(
-            self.scene, 
-            self.renderer, 
-            self._execution_history,
-            self._object_counter,
-            self.object_resolver
-        )
-        self.semantic_validator = SemanticAgreementValidator(self.scene)
+    def _switch_to_current_scene(self):
+        """Swap the scene handle to the temporal cursor and render only what changed."""
+        old_scene = self._scene_handle.swap(self.temporal_scenes.get_current_scene())
+        
+        with self.timer.stage('render'), get_tracer().span('render', scene_size=len(self.scene.entities)):
+            if hasattr(self.renderer, 'apply_scene_diff'):
+                self.renderer.apply_scene_diff(self.scene, diff_scenes(old_scene, self.scene))
+            else:
+                self.renderer.render_scene(self.scene)
 
+    def get_stage_latencies(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get rolling latency percentiles (p50/p90/p99, in milliseconds) per
+        interpretation stage. Empty unless the interpreter collects timings.
+        """
+        return self.timer.report()
+    
     # Public interface methods delegating to SceneManager
     def get_scene_summary(self) -> Dict[str, Any]:
         """Get a summary of the current scene state."""
@@ -374,9 +619,19 @@ class SentenceInterpreter:
         self.renderer = renderer
         self.object_modifier.renderer = renderer  # Update modifier's renderer reference
         self.scene_manager.renderer = renderer    # Update scene manager's renderer reference
-        print("✅ Renderer updated")
+        logger.info("✅ Renderer updated")
     
     # Property accessors for backward compatibility
+    @property
+    def scene(self) -> SceneModel:
+        """The current scene (the one all handlers read through the scene handle)."""
+        return self._scene_handle.scene
+    
+    @scene.setter
+    def scene(self, scene: SceneModel):
+        """Point the interpreter and all handlers at a different scene."""
+        self._scene_handle.swap(scene)
+    
     @property 
     def object_counter(self):
         """Get the current object counter value."""
@@ -12,6 +12,8 @@ Functions
 from typing import Any, Dict, List, Optional
 import json
 
+from engraf.diagnostics.tracing import get_tracer
+
 
 def create_training_pair_from_hyp(final_hyp: Any, answer: str) -> Dict[str, Any]:
     """Create a training example from a Layer-6 final hypothesis.
@@ -25,39 +27,40 @@ def create_training_pair_from_hyp(final_hyp: Any, answer: str) -> Dict[str, Any]
         dict suitable for JSON serialization containing structural tokens,
         latent vectors (as lists), scene refs (as object IDs), and input/target strings.
     """
-    tokens, vectors, scene_refs = final_hyp.l6.tokens, final_hyp.l6.vectors, final_hyp.l6.scene_refs
-
-    # Convert numpy arrays to lists if necessary
-    conv_vecs: List[List[float]] = []
-    for v in vectors:
-        try:
-            conv_vecs.append(v.tolist())
-        except Exception:
-            # Already a list
-            conv_vecs.append(list(v))
-
-    # Convert scene object references to object IDs (JSON serializable)
-    conv_refs: List[Optional[str]] = []
-    for ref in scene_refs:
-        if ref is None:
-            conv_refs.append(None)
-        elif hasattr(ref, 'object_id'):
-            conv_refs.append(ref.object_id)
-        elif hasattr(ref, 'entity_id'):
-            conv_refs.append(ref.entity_id)
-        else:
-            conv_refs.append(str(ref))
-
-    input_string = final_hyp.l6.to_string() + " <SEP>"
-    target_string = "<BOS> " + answer + " <EOS>"
-
-    return {
-        "structural_tokens": tokens,
-        "semantic_vectors": conv_vecs,
-        "scene_grounding": conv_refs,
-        "input_string": input_string,
-        "target_string": target_string,
-    }
+    with get_tracer().span('create_training_pair_from_hyp', structural_tokens=len(final_hyp.l6.tokens)):
+        tokens, vectors, scene_refs = final_hyp.l6.tokens, final_hyp.l6.vectors, final_hyp.l6.scene_refs
+
+        # Convert numpy arrays to lists if necessary
+        conv_vecs: List[List[float]] = []
+        for v in vectors:
+            try:
+                conv_vecs.append(v.tolist())
+            except Exception:
+                # Already a list
+                conv_vecs.append(list(v))
+
+        # Convert scene object references to object IDs (JSON serializable)
+        conv_refs: List[Optional[str]] = []
+        for ref in scene_refs:
+            if ref is None:
+                conv_refs.append(None)
+            elif hasattr(ref, 'object_id'):
+                conv_refs.append(ref.object_id)
+            elif hasattr(ref, 'entity_id'):
+                conv_refs.append(ref.entity_id)
+            else:
+                conv_refs.append(str(ref))
+
+        input_string = final_hyp.l6.to_string() + " <SEP>"
+        target_string = "<BOS> " + answer + " <EOS>"
+
+        return {
+            "structural_tokens": tokens,
+            "semantic_vectors": conv_vecs,
+            "scene_grounding": conv_refs,
+            "input_string": input_string,
+            "target_string": target_string,
+        }
 
 
 def write_jsonl(path: str, examples: List[Dict[str, Any]]) -> None:
@@ -25,6 +25,7 @@ from engraf.visualizer.scene.scene_object import SceneObject
 from latn.lexer.vector_space import vector_from_features, VECTOR_LENGTH
 from engraf.llm_layer6.dataset_extractor import create_training_pair_from_hyp, write_jsonl
 from engraf.llm_layer6.structure import Layer6Structure
+from engraf.diagnostics.tracing import get_tracer
 
 # Semantic vector dimension
 SEMANTIC_VECTOR_DIM = VECTOR_LENGTH  # Currently 69
@@ -477,25 +478,28 @@ def process_through_layer5(executor, sentence: str, scene: SceneModel):
     Returns:
         TokenizationHypothesis with Layer-6 populated, or None if failed
     """
-    try:
-        result = executor.execute_layer5(sentence, report=False)
-        
-        if not result.success or not result.hypotheses:
-            return None
-        
-        hyp = result.hypotheses[0]
-        
-        # Extract the SentencePhrase from the final token
-        if hyp.tokens and hasattr(hyp.tokens[0], 'phrase'):
-            sentence_phrase = hyp.tokens[0].phrase
-            populate_layer6_from_sentence_phrase(hyp, sentence_phrase)
+    with get_tracer().span('process_through_layer5', sentence=sentence,
+                           scene_size=len(scene.entities)) as span:
+        try:
+            result = executor.execute_layer5(sentence, report=False)
             
-            if hyp.l6.tokens:
-                return hyp
-        
-        return None
-    except Exception as e:
-        return None
+            if not result.success or not result.hypotheses:
+                return None
+            
+            span.set('hypotheses', len(result.hypotheses))
+            hyp = result.hypotheses[0]
+            
+            # Extract the SentencePhrase from the final token
+            if hyp.tokens and hasattr(hyp.tokens[0], 'phrase'):
+                sentence_phrase = hyp.tokens[0].phrase
+                populate_layer6_from_sentence_phrase(hyp, sentence_phrase)
+                
+                if hyp.l6.tokens:
+                    return hyp
+            
+            return None
+        except Exception as e:
+            return None
 
 
 # =============================================================================
@@ -0,0 +1 @@
+# ENGRAF Visualizer export package
@@ -0,0 +1,251 @@
+"""
+Scene export to glTF, OBJ and STL
+
+Exporters walk a SceneModel group by group: the standalone objects first,
+then each assembly as a named group. Objects are processed in batches of
+arrays (see shape_meshes), and every batch is written to the file before the
+next is built, so memory stays bounded by the batch size, not the scene.
+
+- glTF 2.0 binary (.glb): each shape's unit mesh is stored once in the binary
+  buffer; objects are nodes that instance it through translation, rotation and
+  scale. Assemblies become named parent nodes.
+- OBJ (.obj): one "o" per object, one "g" per assembly, with vertex colors.
+- STL (.stl): binary triangles; STL has no groups or colors.
+"""
+
+import json
+import os
+import struct
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from engraf.visualizer.renderers.shape_meshes import (object_colors, object_transforms, place_meshes,
+                                                      scene_triangles, shape_of, unit_mesh)
+from engraf.visualizer.scene.scene_model import SceneModel
+from engraf.visualizer.scene.scene_object import SceneObject
+
+# Objects turned into arrays and written per batch
+EXPORT_BATCH = 1024
+
+_STL_TRIANGLE = np.dtype([('normal', '<f4', 3), ('vertices', '<f4', (3, 3)), ('attribute', '<u2')])
+
+_GLTF_FLOAT = 5126
+_GLTF_ARRAY_BUFFER = 34962
+_GLTF_TRIANGLES = 4
+
+
+def export_scene(scene: SceneModel, path: str, batch_size: int = EXPORT_BATCH) -> int:
+    """
+    Export a scene in the format named by the file extension (.glb, .obj or .stl).
+
+    Returns:
+        Number of objects written
+    """
+    extension = os.path.splitext(path)[1].lower()
+    exporters = {'.glb': export_gltf, '.obj': export_obj, '.stl': export_stl}
+    if extension not in exporters:
+        raise ValueError(f"Unsupported export format '{extension}'; expected one of {sorted(exporters)}")
+    return exporters[extension](scene, path, batch_size=batch_size)
+
+
+def scene_groups(scene: SceneModel) -> List[Tuple[Optional[str], List[SceneObject]]]:
+    """Get (group name, objects) for the standalone objects (name None) and each assembly."""
+    groups = [(None, scene.objects)]
+    for assembly in scene.assemblies:
+        groups.append((assembly.assembly_id, assembly.objects))
+    return groups
+
+
+def _batches(objects: Sequence[SceneObject], batch_size: int) -> Iterator[Sequence[SceneObject]]:
+    for start in range(0, len(objects), batch_size):
+        yield objects[start:start + batch_size]
+
+
+def export_stl(scene: SceneModel, path: str, batch_size: int = EXPORT_BATCH) -> int:
+    """Write every object's triangles as binary STL. Returns the number of objects written."""
+    count = objects = 0
+    with open(path, 'wb') as f:
+        f.write(b'ENGRAF scene'.ljust(80, b' '))
+        f.write(struct.pack('<I', 0))  # Triangle count, filled in at the end
+        for _, group in scene_groups(scene):
+            for batch in _batches(group, batch_size):
+                triangles = scene_triangles(batch)[0]
+                normals = np.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+                lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+                records = np.zeros(len(triangles), dtype=_STL_TRIANGLE)
+                records['normal'] = np.divide(normals, lengths, out=np.zeros_like(normals), where=lengths > 0)
+                records['vertices'] = triangles
+                f.write(records.tobytes())
+                count += len(triangles)
+                objects += len(batch)
+        f.seek(80)
+        f.write(struct.pack('<I', count))
+    return objects
+
+
+def export_obj(scene: SceneModel, path: str, batch_size: int = EXPORT_BATCH) -> int:
+    """Write every object as a Wavefront OBJ object with vertex colors. Returns the number of objects written."""
+    formats: Dict[str, Tuple[str, str]] = {}  # shape -> (vertex lines, face lines) format strings
+    offset = objects = 0
+    with open(path, 'w') as f:
+        f.write("# ENGRAF scene\n")
+        for group_name, group in scene_groups(scene):
+            if group_name is not None:
+                f.write(f"g {group_name}\n")
+            for batch in _batches(group, batch_size):
+                by_shape: Dict[str, List[int]] = {}
+                for index, obj in enumerate(batch):
+                    by_shape.setdefault(shape_of(obj), []).append(index)
+                for shape_name, indices in by_shape.items():
+                    members = [batch[i] for i in indices]
+                    vertices, faces = unit_mesh(shape_name)
+                    vertex_count = len(vertices)
+                    if shape_name not in formats:
+                        formats[shape_name] = ("v %.6g %.6g %.6g %.4g %.4g %.4g\n" * vertex_count,
+                                               "f %d %d %d\n" * len(faces))
+                    vertex_format, face_format = formats[shape_name]
+
+                    world = place_meshes(shape_name, members)
+                    colors = np.broadcast_to(object_colors(members)[:, None], world.shape)
+                    rows = np.concatenate([world, colors], axis=2).reshape(len(members), -1)
+                    for obj, row in zip(members, rows):
+                        f.write(f"o {obj.object_id}\n")
+                        f.write(vertex_format % tuple(row.tolist()))
+                        f.write(face_format % tuple((faces + offset + 1).ravel().tolist()))
+                        offset += vertex_count
+                objects += len(batch)
+    return objects
+
+
+def quaternions(degrees: np.ndarray) -> np.ndarray:
+    """Get (N, 4) x, y, z, w quaternions for rotations about X, then Y, then Z by (N, 3) angles in degrees."""
+    half = np.radians(degrees) / 2
+    cx, cy, cz = np.cos(half).T
+    sx, sy, sz = np.sin(half).T
+    return np.stack([
+        sx * cy * cz - cx * sy * sz,
+        cx * sy * cz + sx * cy * sz,
+        cx * cy * sz - sx * sy * cz,
+        cx * cy * cz + sx * sy * sz,
+    ], axis=-1)
+
+
+def export_gltf(scene: SceneModel, path: str, batch_size: int = EXPORT_BATCH) -> int:
+    """
+    Write the scene as binary glTF 2.0 (.glb).
+
+    Each shape's flat-shaded unit mesh goes into the binary buffer once; each
+    distinct (shape, color) pair is a mesh using it with its own material, and
+    each object is a node instancing that mesh. The node list is streamed into
+    the JSON chunk, whose length is filled in at the end.
+
+    Returns:
+        Number of objects written
+    """
+    shapes: Dict[str, int] = {}  # shape -> order its vertex data goes into the buffer
+    materials: Dict[Tuple[float, float, float], int] = {}
+    meshes: Dict[Tuple[str, int], int] = {}
+    group_nodes: List[Tuple[str, int, int]] = []  # (name, first child, end)
+    node = 0
+
+    with open(path, 'wb') as f:
+        f.write(b'glTF' + struct.pack('<II', 2, 0))  # Total length, filled in at the end
+        f.write(struct.pack('<I', 0) + b'JSON')  # JSON chunk length, filled in at the end
+        json_start = f.tell()
+        f.write(b'{"asset":{"version":"2.0","generator":"ENGRAF"},"scene":0,"nodes":[')
+
+        standalone = 0
+        for group_name, group in scene_groups(scene):
+            first = node
+            for batch in _batches(group, batch_size):
+                positions, scales, angles = object_transforms(batch)
+                rotations = quaternions(angles)
+                colors = np.round(object_colors(batch), 4)
+                parts = []
+                for i, obj in enumerate(batch):
+                    shape_name = shape_of(obj)
+                    shapes.setdefault(shape_name, len(shapes))
+                    material = materials.setdefault(tuple(colors[i].tolist()), len(materials))
+                    mesh = meshes.setdefault((shape_name, material), len(meshes))
+                    parts.append('%s{"name":%s,"mesh":%d,"translation":[%.6g,%.6g,%.6g],'
+                                 '"rotation":[%.6g,%.6g,%.6g,%.6g],"scale":[%.6g,%.6g,%.6g]}' % (
+                                     ',' if node + i else '', json.dumps(obj.object_id), mesh,
+                                     *positions[i], *rotations[i], *scales[i]))
+                f.write(''.join(parts).encode())
+                node += len(batch)
+            if group_name is None:
+                standalone = node
+            else:
+                group_nodes.append((group_name, first, node))
+
+        objects = node
+        for name, first, end in group_nodes:
+            f.write(('%s{"name":%s,"children":[' % (',' if node else '', json.dumps(name))).encode())
+            _write_indices(f, first, end)
+            f.write(b']}')
+            node += 1
+
+        f.write(b'],"scenes":[{"nodes":[')
+        _write_indices(f, 0, standalone)
+        if group_nodes:
+            f.write(b',' if standalone else b'')
+            _write_indices(f, objects, node)
+        f.write(b']}],')
+
+        binary, accessors, views = _gltf_buffers(list(shapes))
+        by_color = sorted(materials, key=materials.get)
+        f.write(json.dumps({
+            "meshes": [{"primitives": [{"attributes": {"POSITION": 2 * shapes[shape_name],
+                                                        "NORMAL": 2 * shapes[shape_name] + 1},
+                                         "material": material, "mode": _GLTF_TRIANGLES}]}
+                       for shape_name, material in sorted(meshes, key=meshes.get)],
+            "materials": [{"pbrMetallicRoughness": {"baseColorFactor": [*color, 1.0],
+                                                    "metallicFactor": 0.0, "roughnessFactor": 1.0}}
+                          for color in by_color],
+            "accessors": accessors,
+            "bufferViews": views,
+            "buffers": [{"byteLength": len(binary)}] if binary else [],
+        }, separators=(',', ':'))[1:].encode())
+        json_length = f.tell() - json_start
+        f.write(b' ' * (-json_length % 4))
+        json_length += -json_length % 4
+
+        if binary:
+            f.write(struct.pack('<I', len(binary)) + b'BIN\x00')
+            f.write(binary)
+        total = f.tell()
+        f.seek(8)
+        f.write(struct.pack('<I', total))
+        f.seek(12)
+        f.write(struct.pack('<I', json_length))
+    return objects
+
+
+def _write_indices(f, start: int, stop: int, chunk: int = 65536) -> None:
+    """Write a comma-separated range of node indices without building it all at once."""
+    for first in range(start, stop, chunk):
+        text = ','.join(map(str, range(first, min(first + chunk, stop))))
+        f.write(((',' if first > start else '') + text).encode())
+
+
+def _gltf_buffers(shape_names: List[str]) -> Tuple[bytes, List[dict], List[dict]]:
+    """Build the binary buffer with each shape's unwelded positions and flat normals, in order."""
+    chunks, accessors, views, offset = [], [], [], 0
+    for shape_name in shape_names:
+        vertices, faces = unit_mesh(shape_name)
+        corners = vertices[faces]
+        normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+        normals /= np.linalg.norm(normals, axis=1, keepdims=True)
+        for is_position, data in ((True, corners.reshape(-1, 3)), (False, np.repeat(normals, 3, axis=0))):
+            data = data.astype('<f4')
+            accessor = {"bufferView": len(views), "componentType": _GLTF_FLOAT, "count": len(data), "type": "VEC3"}
+            if is_position:
+                # POSITION accessors require bounds
+                accessor["min"] = data.min(axis=0).tolist()
+                accessor["max"] = data.max(axis=0).tolist()
+            views.append({"buffer": 0, "byteOffset": offset, "byteLength": data.nbytes, "target": _GLTF_ARRAY_BUFFER})
+            accessors.append(accessor)
+            chunks.append(data.tobytes())
+            offset += data.nbytes
+    return b''.join(chunks), accessors, views
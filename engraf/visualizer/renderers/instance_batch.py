@@ -0,0 +1,108 @@
+"""
+Per-shape instance arrays for instanced rendering
+
+An InstanceBatch holds the transform and color of every object of one shape
+as rows of NumPy arrays (position, size, color and rotation in degrees), so a
+renderer can draw many identical primitives from arrays instead of from one
+scene object at a time. Rows are grouped into fixed-size chunks; changing an
+object only marks its chunk dirty, so a renderer redraws just that chunk.
+"""
+
+from typing import Dict, List, Optional, Set
+
+import numpy as np
+
+from engraf.visualizer.scene.scene_object import SceneObject
+
+
+class InstanceBatch:
+    """
+    Transform and color arrays for all objects of one shape.
+    """
+
+    def __init__(self, shape_name: str, chunk_size: int = 1024, capacity: int = 64):
+        """
+        Initialize an empty batch.
+
+        Args:
+            shape_name: The shape every instance is drawn as
+            chunk_size: Rows per chunk (the unit a renderer redraws)
+            capacity: Initial number of rows allocated
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+        self.shape_name = shape_name
+        self.chunk_size = chunk_size
+        self.positions = np.zeros((capacity, 3))
+        self.sizes = np.ones((capacity, 3))
+        self.colors = np.ones((capacity, 3))
+        self.rotations = np.zeros((capacity, 3))
+        self.ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._dirty: Set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, object_id: str) -> bool:
+        return object_id in self._rows
+
+    def row(self, object_id: str) -> Optional[int]:
+        """Get an object's row, or None."""
+        return self._rows.get(object_id)
+
+    @property
+    def num_chunks(self) -> int:
+        return -(-len(self.ids) // self.chunk_size)
+
+    def chunk_rows(self, chunk: int) -> range:
+        """Rows currently in a chunk (empty once the batch has shrunk below it)."""
+        start = chunk * self.chunk_size
+        return range(start, min(start + self.chunk_size, len(self.ids)))
+
+    def set(self, obj: SceneObject) -> int:
+        """Add an object or overwrite its row with its current transform and color; returns the row."""
+        row = self._rows.get(obj.object_id)
+        if row is None:
+            row = len(self.ids)
+            if row == len(self.positions):
+                self._grow()
+            self.ids.append(obj.object_id)
+            self._rows[obj.object_id] = row
+
+        self.positions[row] = (obj.position['x'], obj.position['y'], obj.position['z'])
+        self.sizes[row] = (abs(obj.scale['x']), abs(obj.scale['y']), abs(obj.scale['z']))
+        self.colors[row] = (obj.color['r'], obj.color['g'], obj.color['b'])
+        self.rotations[row] = (obj.rotation['x'], obj.rotation['y'], obj.rotation['z'])
+        self._dirty.add(row // self.chunk_size)
+        return row
+
+    def remove(self, object_id: str) -> bool:
+        """Remove an object by moving the last row into its place. Returns False if absent."""
+        row = self._rows.pop(object_id, None)
+        if row is None:
+            return False
+        last = len(self.ids) - 1
+        if row != last:
+            moved = self.ids[last]
+            self.ids[row] = moved
+            self._rows[moved] = row
+            for array in (self.positions, self.sizes, self.colors, self.rotations):
+                array[row] = array[last]
+        self.ids.pop()
+        self._dirty.add(row // self.chunk_size)
+        self._dirty.add(last // self.chunk_size)
+        return True
+
+    def take_dirty(self) -> List[int]:
+        """Get the chunks changed since the last call, in order, and mark them clean."""
+        dirty, self._dirty = sorted(self._dirty), set()
+        return dirty
+
+    def _grow(self) -> None:
+        capacity = 2 * len(self.positions)
+        for name, fill in (('positions', 0.0), ('sizes', 1.0), ('colors', 1.0), ('rotations', 0.0)):
+            old = getattr(self, name)
+            new = np.full((capacity, 3), fill)
+            new[:len(old)] = old
+            setattr(self, name, new)
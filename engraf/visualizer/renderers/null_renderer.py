@@ -0,0 +1,34 @@
+"""
+Null renderer for headless use
+
+NullRenderer accepts every renderer call and does nothing. Unlike MockRenderer
+it keeps no record of the scene, so it costs nothing per command; use it for
+batch runs, servers and benchmarks where nothing is displayed.
+"""
+
+
+class NullRenderer:
+    """Renderer that draws nothing."""
+
+    headless = True
+
+    def render_scene(self, scene) -> None:
+        pass
+
+    def render_object(self, obj) -> None:
+        pass
+
+    def update_object(self, obj) -> None:
+        pass
+
+    def remove_object(self, object_id: str) -> None:
+        pass
+
+    def apply_scene_diff(self, scene, diff) -> None:
+        pass
+
+    def clear_scene(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
@@ -0,0 +1,433 @@
+"""
+Out-of-process rendering over shared memory
+
+ProcessRenderer stands in for a renderer inside the interpreter process and
+runs the real one (any create_renderer backend) in a separate process, so
+drawing never adds to command latency.
+
+Object state crosses the process boundary through a TransformBuffer:
+
+- a shared table with one row per object slot (position, rotation, scale and
+  color), which the interpreter overwrites in place;
+- a shared ring of published frames, each listing the slots that changed;
+- a control queue for the rare structural messages: slot creation (with the
+  object's ID and shape), deletion, and calls such as set_camera.
+
+The interpreter never waits on the renderer. A renderer process that falls
+behind draws all frames it has missed as one update (only the latest row of
+each slot matters), and one that has been lapped by the ring redraws every
+live slot from the table instead of replaying frames.
+"""
+
+import itertools
+import multiprocessing
+import queue
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from engraf.visualizer.renderers.render_scheduler import RenderScheduler
+from engraf.visualizer.renderers.vpython_renderer import RendererBase
+from engraf.visualizer.scene.scene_model import SceneModel
+from engraf.visualizer.scene.scene_object import SceneObject
+
+# Row layout: position xyz, rotation xyz (degrees), scale xyz, color rgb
+ROW_FIELDS = 12
+_ROW_KEYS = ('locX', 'locY', 'locZ', 'rotX', 'rotY', 'rotZ', 'scaleX', 'scaleY', 'scaleZ', 'red', 'green', 'blue')
+
+# Frame row count meaning "too many changes to list: every slot changed"
+_ALL_SLOTS = -1
+
+
+def object_row(obj: SceneObject) -> Tuple[float, ...]:
+    """Get an object's transform and color as one row."""
+    return (obj.position['x'], obj.position['y'], obj.position['z'],
+            obj.rotation['x'], obj.rotation['y'], obj.rotation['z'],
+            obj.scale['x'], obj.scale['y'], obj.scale['z'],
+            obj.color['r'], obj.color['g'], obj.color['b'])
+
+
+class TransformBuffer:
+    """
+    Shared object-row table plus a ring of published change sets.
+
+    The creating side writes rows and publishes frames; a side attached with
+    attach() reads them. Frames carry a sequence number written last, so a
+    reader can tell a frame overwritten mid-read from a complete one.
+    """
+
+    def __init__(self, capacity: int = 4096, frames: int = 64, frame_rows: int = 4096):
+        """
+        Create the shared memory segments.
+
+        Args:
+            capacity: Object slots in the table (grown on demand with grow())
+            frames: Published frames the ring holds before the oldest is overwritten
+            frame_rows: Most slots one frame lists; larger change sets are
+                        published as "every slot changed"
+        """
+        self.frames = frames
+        self.frame_rows = frame_rows
+        self._owner = True
+        self._ring = shared_memory.SharedMemory(create=True, size=self._ring_size(frames, frame_rows))
+        self._table: Optional[shared_memory.SharedMemory] = None
+        self._retired: List[shared_memory.SharedMemory] = []
+        self._map_ring()
+        self._ring_view[:] = 0
+        self._create_table(capacity)
+
+    @classmethod
+    def attach(cls, spec: Dict[str, Any]) -> 'TransformBuffer':
+        """Attach to a buffer created in another process, from its spec."""
+        buffer = cls.__new__(cls)
+        buffer.frames = spec['frames']
+        buffer.frame_rows = spec['frame_rows']
+        buffer._owner = False
+        buffer._ring = shared_memory.SharedMemory(name=spec['ring'])
+        buffer._table = None
+        buffer._retired = []
+        buffer._map_ring()
+        buffer.remap(spec['table'], spec['capacity'])
+        return buffer
+
+    @property
+    def spec(self) -> Dict[str, Any]:
+        """Everything another process needs to attach."""
+        return {'ring': self._ring.name, 'table': self._table.name, 'capacity': self.capacity,
+                'frames': self.frames, 'frame_rows': self.frame_rows}
+
+    @property
+    def latest(self) -> int:
+        """Sequence number of the last published frame (0 before the first)."""
+        return int(self._write_seq[0])
+
+    @staticmethod
+    def _ring_size(frames: int, frame_rows: int) -> int:
+        return 8 + frames * 16 + frames * frame_rows * 4
+
+    def _map_ring(self) -> None:
+        buf = self._ring.buf
+        frames, frame_rows = self.frames, self.frame_rows
+        self._ring_view = np.ndarray((self._ring_size(frames, frame_rows),), dtype=np.uint8, buffer=buf)
+        self._write_seq = np.ndarray((1,), dtype=np.uint64, buffer=buf)
+        self._frame_seqs = np.ndarray((frames,), dtype=np.uint64, buffer=buf, offset=8)
+        self._frame_counts = np.ndarray((frames,), dtype=np.int64, buffer=buf, offset=8 + frames * 8)
+        self._frame_slots = np.ndarray((frames, frame_rows), dtype=np.int32, buffer=buf, offset=8 + frames * 16)
+
+    def _create_table(self, capacity: int) -> None:
+        self._table = shared_memory.SharedMemory(create=True, size=capacity * ROW_FIELDS * 8)
+        self.capacity = capacity
+        self.rows = np.ndarray((capacity, ROW_FIELDS), dtype=np.float64, buffer=self._table.buf)
+
+    def grow(self, capacity: int) -> None:
+        """
+        Move the table to a larger segment (creating side); readers must remap() to the new spec.
+
+        Old segments stay allocated until close(), so a reader still attaching
+        to one that has since been outgrown does not fail.
+        """
+        old, old_rows = self._table, self.rows
+        self._create_table(capacity)
+        self.rows[:len(old_rows)] = old_rows
+        del old_rows
+        old.close()
+        self._retired.append(old)
+
+    def remap(self, table_name: str, capacity: int) -> None:
+        """Attach to a (grown) table segment (reading side)."""
+        if self._table is not None:
+            self.rows = None
+            self._table.close()
+        self._table = shared_memory.SharedMemory(name=table_name)
+        self.capacity = capacity
+        self.rows = np.ndarray((capacity, ROW_FIELDS), dtype=np.float64, buffer=self._table.buf)
+
+    def publish(self, slots) -> int:
+        """Publish one frame listing the slots whose rows changed; returns its sequence number."""
+        seq = self.latest + 1
+        index = seq % self.frames
+        slots = np.asarray(slots, dtype=np.int32)
+        self._frame_seqs[index] = 0  # Mark the frame as being rewritten
+        if len(slots) > self.frame_rows:
+            self._frame_counts[index] = _ALL_SLOTS
+        else:
+            self._frame_counts[index] = len(slots)
+            self._frame_slots[index, :len(slots)] = slots
+        self._frame_seqs[index] = seq
+        self._write_seq[0] = seq
+        return seq
+
+    def read_since(self, seq: int) -> Tuple[int, Optional[Set[int]]]:
+        """
+        Collect the slots changed in frames published after seq.
+
+        Returns:
+            (latest sequence number read, changed slots), where changed slots
+            is None if frames were lost (lapped or overwritten mid-read) or a
+            frame listed every slot, meaning every live slot must be redrawn
+        """
+        latest = self.latest
+        if latest - seq >= self.frames:
+            return latest, None
+        changed: Set[int] = set()
+        for frame in range(seq + 1, latest + 1):
+            index = frame % self.frames
+            count = int(self._frame_counts[index])
+            if int(self._frame_seqs[index]) != frame or count == _ALL_SLOTS:
+                return latest, None
+            slots = self._frame_slots[index, :count].tolist()
+            if int(self._frame_seqs[index]) != frame:
+                return latest, None
+            changed.update(slots)
+        return latest, changed
+
+    def close(self) -> None:
+        """Detach, and free the segments if this side created them."""
+        self.rows = None
+        self._ring_view = self._write_seq = self._frame_seqs = self._frame_counts = self._frame_slots = None
+        for segment in (self._table, self._ring):
+            segment.close()
+        if self._owner:
+            for segment in [self._table, self._ring] + self._retired:
+                segment.unlink()
+
+
+class ProcessRenderer(RendererBase):
+    """
+    Renderer proxy that draws with a renderer running in another process.
+
+    Changes are queued per object and published as one frame at most fps times
+    per second (or on render_scene, apply_scene_diff and flush); publishing
+    never waits for the renderer process.
+    """
+
+    def __init__(self, backend: str = "vpython", fps: float = 30.0, capacity: int = 4096, frames: int = 64,
+                 frame_rows: int = 4096, start_method: str = "spawn", **renderer_kwargs):
+        """
+        Start the renderer process.
+
+        Args:
+            backend: create_renderer backend run in the renderer process
+            fps: Most frames published per second
+            capacity: Initial object slots in the shared table (grown as needed)
+            frames: Frames the shared ring holds
+            frame_rows: Most slots listed per frame
+            start_method: multiprocessing start method for the renderer process
+            **renderer_kwargs: Passed to create_renderer in the renderer process
+        """
+        self.headless = renderer_kwargs.get('headless', False)
+        self.buffer = TransformBuffer(capacity=capacity, frames=frames, frame_rows=frame_rows)
+        context = multiprocessing.get_context(start_method)
+        self._control = context.Queue()
+        self._replies = context.Queue()
+        self._tokens = itertools.count(1)
+        self.process = context.Process(target=_render_worker, name="engraf-renderer", daemon=True,
+                                       args=(backend, renderer_kwargs, self.buffer.spec, self._control,
+                                             self._replies, fps))
+        self.process.start()
+
+        self._slots: Dict[str, int] = {}
+        self._free: List[int] = []
+        self._changed: Set[int] = set()
+        self.scheduler = RenderScheduler(self._write_row, self._delete, fps=fps,
+                                         wait=lambda seconds: None, after_flush=self._publish)
+
+    def render_scene(self, scene: SceneModel) -> None:
+        """Send every object not seen yet, then publish."""
+        for obj in scene.objects:
+            if obj.object_id not in self._slots:
+                self.scheduler.mark_dirty(obj)
+        self.flush()
+
+    def render_object(self, obj: SceneObject) -> None:
+        """Queue an object to be drawn with the next frame."""
+        self.scheduler.mark_dirty(obj)
+        self.scheduler.poll()
+
+    def update_object(self, obj: SceneObject) -> None:
+        """Queue an object's new state for the next frame."""
+        self.scheduler.mark_dirty(obj)
+        self.scheduler.poll()
+
+    def remove_object(self, object_id: str) -> None:
+        """Queue an object's removal for the next frame."""
+        self.scheduler.mark_removed(object_id)
+        self.scheduler.poll()
+
+    def apply_scene_diff(self, scene: SceneModel, diff) -> None:
+        """Send the objects in a SceneDiff, then publish."""
+        for object_id in diff.removed:
+            self.scheduler.mark_removed(object_id)
+        for object_id in diff.added + diff.changed:
+            obj = scene.find_object_by_id(object_id)
+            if obj is not None:
+                self.scheduler.mark_dirty(obj)
+        self.flush()
+
+    def flush(self) -> None:
+        """Publish everything queued now, without waiting for the frame interval."""
+        self.scheduler.flush()
+
+    def clear_scene(self) -> None:
+        """Drop every object here and in the renderer process."""
+        self.scheduler.clear()
+        self._slots.clear()
+        self._free.clear()
+        self._changed.clear()
+        self._control.put(('clear',))
+
+    def set_camera(self, position: Tuple[float, float, float], target: Tuple[float, float, float]) -> None:
+        """Set the camera in the renderer process."""
+        self._control.put(('call', None, 'set_camera', (position, target)))
+
+    def set_background_color(self, color: Tuple[float, float, float]) -> None:
+        """Set the background color in the renderer process."""
+        self._control.put(('call', None, 'set_background_color', (color,)))
+
+    def call(self, method: str, *args, timeout: float = 10.0) -> Any:
+        """
+        Publish pending changes, then call a method of the real renderer once
+        the renderer process has drawn them, and return its (picklable) result.
+        """
+        self.flush()
+        token = next(self._tokens)
+        self._control.put(('call', token, method, args))
+        while True:
+            reply_token, ok, value = self._replies.get(timeout=timeout)
+            if reply_token == token:
+                if not ok:
+                    raise RuntimeError(f"Renderer process failed in {method}: {value}")
+                return value
+
+    def get_object_info(self, obj_name: str) -> Optional[Dict[str, Any]]:
+        """Get information about an object from the renderer process."""
+        return self.call('get_object_info', obj_name)
+
+    def stats(self, timeout: float = 10.0) -> Dict[str, int]:
+        """Frame counters of the renderer process (frames drawn, skipped, resyncs)."""
+        return self.call('__stats__', timeout=timeout)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Stop the renderer process and free the shared memory."""
+        if self.process.is_alive():
+            self._control.put(('close',))
+            self.process.join(timeout)
+            if self.process.is_alive():
+                self.process.terminate()
+                self.process.join()
+        self._control.close()
+        self._replies.close()
+        self.buffer.close()
+
+    def _write_row(self, obj: SceneObject) -> None:
+        slot = self._slots.get(obj.object_id)
+        if slot is None:
+            slot = self._allocate_slot()
+            self._slots[obj.object_id] = slot
+            self.buffer.rows[slot] = object_row(obj)
+            self._control.put(('create', slot, obj.object_id, obj.name))
+        else:
+            self.buffer.rows[slot] = object_row(obj)
+        self._changed.add(slot)
+
+    def _allocate_slot(self) -> int:
+        if self._free:
+            return self._free.pop()
+        slot = len(self._slots)
+        if slot >= self.buffer.capacity:
+            self.buffer.grow(2 * self.buffer.capacity)
+            self._control.put(('remap', self.buffer.spec['table'], self.buffer.capacity))
+        return slot
+
+    def _delete(self, object_id: str) -> None:
+        slot = self._slots.pop(object_id, None)
+        if slot is not None:
+            self._changed.discard(slot)
+            self._free.append(slot)
+            self._control.put(('delete', slot))
+
+    def _publish(self) -> None:
+        if self._changed:
+            self.buffer.publish(sorted(self._changed))
+            self._changed.clear()
+
+
+def _render_worker(backend: str, renderer_kwargs: Dict[str, Any], spec: Dict[str, Any],
+                   control, replies, fps: float) -> None:
+    """Renderer process main loop: apply control messages, then draw the frames published since the last pass."""
+    from engraf.visualizer.renderers.vpython_renderer import create_renderer
+    from latn.lexer.vector_space import VectorSpace
+
+    renderer = create_renderer(backend, **renderer_kwargs)
+    buffer = TransformBuffer.attach(spec)
+    objects: Dict[int, SceneObject] = {}
+    stats = {'frames_drawn': 0, 'frames_skipped': 0, 'resyncs': 0}
+    read_seq = 0
+
+    def draw(slots) -> None:
+        for slot in slots:
+            obj = objects.get(slot)
+            if obj is None or slot >= buffer.capacity:
+                continue  # Created or remapped by a control message not received yet
+            for key, value in zip(_ROW_KEYS, buffer.rows[slot].tolist()):
+                obj.vector[key] = value
+            renderer.update_object(obj)
+
+    def draw_frames() -> None:
+        nonlocal read_seq
+        latest, changed = buffer.read_since(read_seq)
+        if latest == read_seq:
+            return
+        if changed is None:
+            stats['resyncs'] += 1
+            changed = set(objects)
+        stats['frames_drawn'] += 1
+        stats['frames_skipped'] += latest - read_seq - 1
+        read_seq = latest
+        draw(sorted(changed))
+        if hasattr(renderer, 'flush'):
+            renderer.flush()
+
+    running = True
+    while running:
+        try:
+            messages = [control.get(timeout=1.0 / fps)]
+            while True:
+                messages.append(control.get_nowait())
+        except queue.Empty:
+            pass
+
+        for message in messages:
+            kind = message[0]
+            if kind == 'create':
+                _, slot, object_id, name = message
+                objects[slot] = SceneObject(name, VectorSpace(), object_id=object_id)
+                draw([slot])
+            elif kind == 'delete':
+                obj = objects.pop(message[1], None)
+                if obj is not None:
+                    renderer.remove_object(obj.object_id)
+            elif kind == 'remap':
+                buffer.remap(message[1], message[2])
+            elif kind == 'clear':
+                objects.clear()
+                renderer.clear_scene()
+            elif kind == 'call':
+                _, token, method, args = message
+                draw_frames()
+                try:
+                    result = dict(stats) if method == '__stats__' else getattr(renderer, method)(*args)
+                    if token is not None:
+                        replies.put((token, True, result))
+                except Exception as e:
+                    if token is not None:
+                        replies.put((token, False, repr(e)))
+            elif kind == 'close':
+                running = False
+
+        draw_frames()
+
+    if hasattr(renderer, 'close'):
+        renderer.close()
+    buffer.close()
@@ -0,0 +1,114 @@
+"""
+Frame-coalesced render scheduling
+
+RenderScheduler sits between the code that changes scene objects and a
+renderer's per-object update and removal calls. Changes are queued by object
+ID, so an object touched many times in one command is drawn once, and queued
+changes are pushed to the display at most once per frame.
+
+A grouped transform of thousands of members therefore produces one update
+burst at the end of the command (or one per elapsed frame, for long-running
+commands) instead of thousands of individual redraws.
+"""
+
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+class RenderScheduler:
+    """
+    Queue of dirty and removed object IDs, flushed at most once per frame.
+    """
+
+    def __init__(self, update: Callable[[Any], None], remove: Callable[[str], None], fps: float = 30.0,
+                 wait: Optional[Callable[[float], None]] = None, after_flush: Optional[Callable[[], None]] = None,
+                 clock: Callable[[], float] = time.perf_counter):
+        """
+        Initialize the scheduler.
+
+        Args:
+            update: Draws one object's current state (the renderer's immediate update)
+            remove: Removes one object from the display by ID
+            fps: Maximum number of flushes per second
+            wait: Called with the seconds left in the current frame before a
+                  flush that comes too soon; defaults to time.sleep
+            after_flush: Called after each flush, e.g. to wait for the draw to complete
+            clock: Monotonic time source in seconds
+        """
+        if fps <= 0:
+            raise ValueError(f"fps must be positive, got {fps}")
+        self.fps = fps
+        self._update = update
+        self._remove = remove
+        self._wait = wait or time.sleep
+        self._after_flush = after_flush
+        self._clock = clock
+        self._dirty: Dict[str, Any] = {}  # object_id -> object, first-touched order
+        self._removed: Dict[str, None] = {}
+        self._last_flush: Optional[float] = None
+        self.flushes = 0
+        self.updates = 0
+
+    @property
+    def frame_interval(self) -> float:
+        return 1.0 / self.fps
+
+    @property
+    def pending(self) -> int:
+        """Number of objects waiting to be drawn or removed."""
+        return len(self._dirty) + len(self._removed)
+
+    def mark_dirty(self, obj) -> None:
+        """Queue an object to be redrawn; repeated calls before a flush draw it once."""
+        self._removed.pop(obj.object_id, None)
+        self._dirty[obj.object_id] = obj
+
+    def mark_removed(self, object_id: str) -> None:
+        """Queue an object to be removed from the display."""
+        self._dirty.pop(object_id, None)
+        self._removed[object_id] = None
+
+    def due(self) -> bool:
+        """Whether a full frame has passed since the last flush."""
+        return self._last_flush is None or self._clock() - self._last_flush >= self.frame_interval
+
+    def poll(self) -> int:
+        """Flush if a frame has passed since the last flush; never waits. Returns objects drawn or removed."""
+        if self.pending and self.due():
+            return self._flush()
+        return 0
+
+    def flush(self) -> int:
+        """
+        Draw everything queued, waiting for the current frame to end first if
+        the last flush was less than a frame ago.
+
+        Returns:
+            Number of objects drawn or removed
+        """
+        if not self.pending:
+            return 0
+        if self._last_flush is not None:
+            remaining = self.frame_interval - (self._clock() - self._last_flush)
+            if remaining > 0:
+                self._wait(remaining)
+        return self._flush()
+
+    def clear(self) -> None:
+        """Drop everything queued without drawing it."""
+        self._dirty.clear()
+        self._removed.clear()
+
+    def _flush(self) -> int:
+        removed, self._removed = self._removed, {}
+        dirty, self._dirty = self._dirty, {}
+        for object_id in removed:
+            self._remove(object_id)
+        for obj in dirty.values():
+            self._update(obj)
+        self._last_flush = self._clock()
+        self.flushes += 1
+        self.updates += len(removed) + len(dirty)
+        if self._after_flush is not None:
+            self._after_flush()
+        return len(removed) + len(dirty)
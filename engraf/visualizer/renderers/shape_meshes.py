@@ -0,0 +1,225 @@
+"""
+Triangle meshes for the scene's shapes
+
+Each supported shape has a unit mesh sized to the box [-0.5, 0.5]^3 (the
+extent SceneAssembly uses for bounding boxes), built once and cached. Parts
+mirror the VPython renderer's, overhang included: an arch is two pillars
+under a cylinder, a table is a top on four legs. Every part is convex and its
+faces are wound counter-clockwise seen from outside, so normals point outwards.
+
+scene_triangles() places the unit meshes of many objects at once, scaling,
+rotating (about X, then Y, then Z, as the VPython renderer orients
+primitives) and translating every object of a shape in one NumPy step.
+"""
+
+import math
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from engraf.visualizer.scene.scene_object import SceneObject
+
+Mesh = Tuple[np.ndarray, np.ndarray]  # (V, 3) float vertices, (F, 3) int vertex indices
+
+SPHERE_SEGMENTS = 16
+SPHERE_RINGS = 8
+ROUND_SEGMENTS = 16
+
+# Shapes drawn with another shape's mesh; anything unknown is drawn as a cube
+_SHAPE_ALIASES = {"box": "cube", "ellipsoid": "sphere"}
+
+_unit_meshes: Dict[str, Mesh] = {}
+
+
+def shape_of(obj: SceneObject) -> str:
+    """Get the mesh an object is drawn with (from names like "cube_1", "sphere_2", etc.)."""
+    name = obj.name.split('_')[0].lower() if '_' in obj.name else obj.name.lower()
+    name = _SHAPE_ALIASES.get(name, name)
+    return name if name in _BUILDERS else "cube"
+
+
+def unit_mesh(shape_name: str) -> Mesh:
+    """Get the cached unit mesh of a shape."""
+    mesh = _unit_meshes.get(shape_name)
+    if mesh is None:
+        mesh = _unit_meshes[shape_name] = _merge(_BUILDERS[shape_name]())
+    return mesh
+
+
+def rotation_matrices(degrees: np.ndarray) -> np.ndarray:
+    """Get the (N, 3, 3) matrices rotating about X, then Y, then Z by (N, 3) angles in degrees."""
+    x, y, z = np.radians(degrees).T
+    cx, sx, cy, sy, cz, sz = np.cos(x), np.sin(x), np.cos(y), np.sin(y), np.cos(z), np.sin(z)
+    # Rz @ Ry @ Rx, written out
+    return np.stack([
+        np.stack([cz * cy, cz * sy * sx - sz * cx, cz * sy * cx + sz * sx], axis=-1),
+        np.stack([sz * cy, sz * sy * sx + cz * cx, sz * sy * cx - cz * sx], axis=-1),
+        np.stack([-sy, cy * sx, cy * cx], axis=-1),
+    ], axis=-2)
+
+
+def object_transforms(objects: Sequence[SceneObject]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Get the objects' (N, 3) positions, absolute scales and rotation angles in degrees."""
+    positions = np.array([(o.position['x'], o.position['y'], o.position['z']) for o in objects], dtype=np.float64)
+    scales = np.abs(np.array([(o.scale['x'], o.scale['y'], o.scale['z']) for o in objects], dtype=np.float64))
+    angles = np.array([(o.rotation['x'], o.rotation['y'], o.rotation['z']) for o in objects], dtype=np.float64)
+    return positions.reshape(-1, 3), scales.reshape(-1, 3), angles.reshape(-1, 3)
+
+
+def object_colors(objects: Sequence[SceneObject]) -> np.ndarray:
+    """Get the objects' (N, 3) RGB colors."""
+    return np.array([(o.color['r'], o.color['g'], o.color['b']) for o in objects], dtype=np.float64).reshape(-1, 3)
+
+
+def place_meshes(shape_name: str, objects: Sequence[SceneObject]) -> np.ndarray:
+    """Get the (N, V, 3) world-space vertices of a shape's unit mesh placed at each object."""
+    vertices = unit_mesh(shape_name)[0]
+    positions, scales, angles = object_transforms(objects)
+    rotations = rotation_matrices(angles)
+    return np.einsum('nij,nvj->nvi', rotations, vertices[None] * scales[:, None]) + positions[:, None]
+
+
+def scene_triangles(objects: Sequence[SceneObject]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Place every object's mesh in world space.
+
+    Args:
+        objects: Scene objects with up-to-date transformation properties
+
+    Returns:
+        (T, 3, 3) triangle vertices, (T, 3) RGB colors, and the (T,) index in
+        objects of the object each triangle belongs to
+    """
+    groups: Dict[str, List[int]] = {}
+    for index, obj in enumerate(objects):
+        groups.setdefault(shape_of(obj), []).append(index)
+
+    triangles, colors, owners = [], [], []
+    for shape_name, indices in groups.items():
+        faces = unit_mesh(shape_name)[1]
+        group = [objects[i] for i in indices]
+        world = place_meshes(shape_name, group)
+        triangles.append(world[:, faces].reshape(-1, 3, 3))
+        colors.append(np.repeat(object_colors(group), len(faces), axis=0))
+        owners.append(np.repeat(np.array(indices), len(faces)))
+
+    if not triangles:
+        return np.zeros((0, 3, 3)), np.zeros((0, 3)), np.zeros(0, dtype=int)
+    return np.concatenate(triangles), np.concatenate(colors), np.concatenate(owners)
+
+
+def _box(center=(0.0, 0.0, 0.0), size=(1.0, 1.0, 1.0)) -> Mesh:
+    corners = np.array([(x, y, z) for x in (-0.5, 0.5) for y in (-0.5, 0.5) for z in (-0.5, 0.5)])
+    vertices = corners * size + center
+    faces = np.array([
+        (0, 1, 3), (0, 3, 2), (4, 6, 7), (4, 7, 5),  # -x, +x
+        (0, 4, 5), (0, 5, 1), (2, 3, 7), (2, 7, 6),  # -y, +y
+        (0, 2, 6), (0, 6, 4), (1, 5, 7), (1, 7, 3),  # -z, +z
+    ])
+    return _orient_outward(vertices, faces)
+
+
+def _round_solid(base_center, axis, base_radius: float, top_radius: float,
+                 segments: int = ROUND_SEGMENTS) -> Mesh:
+    """A cylinder (equal radii) or cone (top_radius 0) from base_center along axis."""
+    base_center, axis = np.asarray(base_center, dtype=np.float64), np.asarray(axis, dtype=np.float64)
+    direction = axis / np.linalg.norm(axis)
+    u = np.cross(direction, (1.0, 0.0, 0.0) if abs(direction[0]) < 0.9 else (0.0, 1.0, 0.0))
+    u /= np.linalg.norm(u)
+    v = np.cross(direction, u)
+    angles = np.linspace(0.0, 2 * math.pi, segments, endpoint=False)
+    ring = np.cos(angles)[:, None] * u + np.sin(angles)[:, None] * v
+
+    bottom = base_center + base_radius * ring
+    if top_radius > 0:
+        top = base_center + axis + top_radius * ring
+    else:
+        top = (base_center + axis)[None]
+    vertices = np.vstack([bottom, top, base_center, base_center + axis])
+    bottom_center, top_center = len(vertices) - 2, len(vertices) - 1
+
+    faces = []
+    for i in range(segments):
+        j = (i + 1) % segments
+        faces.append((bottom_center, j, i))
+        if top_radius > 0:
+            faces.append((i, j, segments + j))
+            faces.append((i, segments + j, segments + i))
+            faces.append((top_center, segments + i, segments + j))
+        else:
+            faces.append((i, j, segments))
+    if top_radius <= 0:
+        vertices = vertices[:-1]  # The apex is the top; no top cap
+    return _orient_outward(vertices, np.array(faces))
+
+
+def _sphere(segments: int = SPHERE_SEGMENTS, rings: int = SPHERE_RINGS) -> Mesh:
+    polar = np.linspace(0.0, math.pi, rings + 1)[1:-1]
+    azimuth = np.linspace(0.0, 2 * math.pi, segments, endpoint=False)
+    sin_p, cos_p = np.sin(polar)[:, None], np.cos(polar)[:, None]
+    bands = np.stack([sin_p * np.cos(azimuth), np.repeat(cos_p, segments, axis=1), sin_p * np.sin(azimuth)], axis=-1)
+    vertices = np.vstack([[(0.0, 1.0, 0.0)], bands.reshape(-1, 3), [(0.0, -1.0, 0.0)]]) * 0.5
+    north, south = 0, len(vertices) - 1
+
+    faces = []
+    for i in range(segments):
+        j = (i + 1) % segments
+        faces.append((north, 1 + i, 1 + j))
+        last = 1 + (rings - 2) * segments
+        faces.append((south, last + j, last + i))
+        for band in range(rings - 2):
+            a, b = 1 + band * segments, 1 + (band + 1) * segments
+            faces.append((a + i, b + i, b + j))
+            faces.append((a + i, b + j, a + j))
+    return _orient_outward(vertices, np.array(faces))
+
+
+def _pyramid() -> Mesh:
+    vertices = np.array([(-0.5, -0.5, -0.5), (0.5, -0.5, -0.5), (0.5, -0.5, 0.5), (-0.5, -0.5, 0.5), (0.0, 0.5, 0.0)])
+    faces = np.array([(0, 1, 2), (0, 2, 3), (0, 1, 4), (1, 2, 4), (2, 3, 4), (3, 0, 4)])
+    return _orient_outward(vertices, faces)
+
+
+def _arch() -> List[Mesh]:
+    return [
+        _box((-0.5, 0.0, 0.0), (0.25, 1.0, 1.0)),
+        _box((0.5, 0.0, 0.0), (0.25, 1.0, 1.0)),
+        _round_solid((-0.5, 0.5, 0.0), (1.0, 0.0, 0.0), 0.25, 0.25),
+    ]
+
+
+def _table() -> List[Mesh]:
+    legs = [_box((x, 0.0, z), (0.05, 1.0, 0.05)) for x in (-0.4, 0.4) for z in (-0.4, 0.4)]
+    return [_box((0.0, 0.5, 0.0), (1.0, 0.1, 1.0))] + legs
+
+
+def _orient_outward(vertices: np.ndarray, faces: np.ndarray) -> Mesh:
+    """Flip any face of a convex part whose normal points towards the part's center."""
+    corners = vertices[faces]
+    normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    inward = np.einsum('ij,ij->i', normals, corners.mean(axis=1) - vertices.mean(axis=0)) < 0
+    faces = faces.copy()
+    faces[inward] = faces[inward][:, ::-1]
+    return vertices, faces
+
+
+def _merge(parts) -> Mesh:
+    if isinstance(parts, tuple):
+        return parts
+    vertices, faces, offset = [], [], 0
+    for part_vertices, part_faces in parts:
+        vertices.append(part_vertices)
+        faces.append(part_faces + offset)
+        offset += len(part_vertices)
+    return np.vstack(vertices), np.vstack(faces)
+
+
+_BUILDERS = {
+    "cube": _box,
+    "sphere": _sphere,
+    "cylinder": lambda: _round_solid((0.0, -0.5, 0.0), (0.0, 1.0, 0.0), 0.5, 0.5),
+    "cone": lambda: _round_solid((0.0, -0.5, 0.0), (0.0, 1.0, 0.0), 0.5, 0.0),
+    "pyramid": _pyramid,
+    "arch": _arch,
+    "table": _table,
+}
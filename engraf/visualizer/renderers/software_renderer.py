@@ -0,0 +1,241 @@
+"""
+Offscreen software renderer
+
+SoftwareRenderer draws scenes without a browser or GPU: every object is
+triangulated (see shape_meshes), and the triangles are rasterized with a
+z-buffer and flat shading entirely in NumPy. Snapshots are written as PNG
+files using only zlib, for CI runs and headless servers.
+
+Rasterization is vectorized over (triangle, pixel) pairs: each triangle's
+screen bounding box is expanded into candidate pixels, inside-tests and
+depths are computed for all candidates at once, and the nearest candidate
+per pixel wins. Candidates are processed in bounded batches so a triangle
+filling the screen does not exhaust memory.
+"""
+
+import math
+import struct
+import zlib
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from engraf.visualizer.renderers.shape_meshes import scene_triangles
+from engraf.visualizer.renderers.vpython_renderer import RendererBase
+from engraf.visualizer.scene.scene_model import SceneModel
+from engraf.visualizer.scene.scene_object import SceneObject
+
+# Candidate (triangle, pixel) pairs rasterized per batch
+PIXEL_BATCH = 1 << 19
+
+
+def write_png(path: str, image: np.ndarray) -> None:
+    """Write an (H, W, 3) uint8 RGB image as a PNG file."""
+    height, width, _ = image.shape
+    rows = np.concatenate([np.zeros((height, 1), dtype=np.uint8), image.reshape(height, width * 3)], axis=1)
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data) & 0xffffffff)
+
+    with open(path, 'wb') as f:
+        f.write(b'\x89PNG\r\n\x1a\n')
+        f.write(chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)))
+        f.write(chunk(b'IDAT', zlib.compress(rows.tobytes(), 6)))
+        f.write(chunk(b'IEND', b''))
+
+
+class SoftwareRenderer(RendererBase):
+    """
+    Pure-NumPy offscreen renderer producing images and PNG snapshots.
+
+    Scene changes only update the renderer's record of objects; drawing
+    happens when render_image() or save_png() is called.
+    """
+
+    def __init__(self, width: int = 800, height: int = 600, fov_degrees: float = 60.0,
+                 background: Tuple[float, float, float] = (0.2, 0.2, 0.2), headless: bool = True):
+        """
+        Initialize the software renderer.
+
+        Args:
+            width: Image width in pixels
+            height: Image height in pixels
+            fov_degrees: Vertical field of view
+            background: Background color (RGB, 0-1)
+            headless: Always effectively True; accepted for create_renderer compatibility
+        """
+        self.width = width
+        self.height = height
+        self.fov_degrees = fov_degrees
+        self.background = background
+        self.headless = True
+        self.near = 0.05
+        self.objects: Dict[str, SceneObject] = {}
+
+        # Same default view as the VPython canvas: looking down -z at a range of 10
+        distance = 10.0 / math.tan(math.radians(fov_degrees) / 2)
+        self.set_camera((0.0, 0.0, distance), (0.0, 0.0, 0.0))
+
+    def render_scene(self, scene: SceneModel) -> None:
+        """Record every object in the scene."""
+        for obj in scene.objects:
+            self.render_object(obj)
+
+    def render_object(self, obj: SceneObject) -> None:
+        """Record (or refresh) a single object."""
+        obj.update_transformations()
+        self.objects[obj.object_id] = obj
+
+    def update_object(self, obj: SceneObject) -> None:
+        """Refresh an object's recorded state."""
+        self.render_object(obj)
+
+    def remove_object(self, object_id: str) -> None:
+        """Forget an object."""
+        self.objects.pop(object_id, None)
+
+    def apply_scene_diff(self, scene: SceneModel, diff) -> None:
+        """Bring the record in line with a new scene state using a SceneDiff."""
+        for object_id in diff.removed:
+            self.remove_object(object_id)
+        for object_id in diff.added + diff.changed:
+            obj = scene.find_object_by_id(object_id)
+            if obj is not None:
+                self.update_object(obj)
+
+    def clear_scene(self) -> None:
+        """Forget all objects."""
+        self.objects.clear()
+
+    def get_object_info(self, obj_name: str) -> Optional[Dict[str, Any]]:
+        """Get information about a recorded object."""
+        obj = self.objects.get(obj_name)
+        if obj is None:
+            return None
+        return {
+            "name": obj_name,
+            "position": list(obj.get_position()),
+            "size": [abs(s) for s in obj.get_scale()],
+            "visible": True,
+            "color": [obj.color['r'], obj.color['g'], obj.color['b']]
+        }
+
+    def set_camera(self, position: Tuple[float, float, float], target: Tuple[float, float, float]) -> None:
+        """Set the camera position and target."""
+        position = np.asarray(position, dtype=np.float64)
+        forward = np.asarray(target, dtype=np.float64) - position
+        if not np.any(forward):
+            raise ValueError("camera position and target must differ")
+        forward /= np.linalg.norm(forward)
+        right = np.cross(forward, (0.0, 1.0, 0.0))
+        if not np.any(right):
+            right = np.array([1.0, 0.0, 0.0])
+        right /= np.linalg.norm(right)
+        self.camera_position = position
+        self._view = np.stack([right, np.cross(right, forward), forward])  # rows: right, up, forward
+
+        # Light from over the viewer's shoulder
+        light = -forward + 0.6 * self._view[1] - 0.4 * right
+        self._light = light / np.linalg.norm(light)
+
+    def set_background_color(self, color: Tuple[float, float, float]) -> None:
+        """Set the background color."""
+        self.background = color
+
+    def render_image(self) -> np.ndarray:
+        """Draw the recorded objects; returns an (height, width, 3) uint8 RGB image."""
+        triangles, colors, _ = scene_triangles(list(self.objects.values()))
+
+        # Flat shading; outward normals facing away from the camera are back faces
+        normals = np.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+        lengths = np.linalg.norm(normals, axis=1)
+        front = (lengths > 0) & (np.einsum('ij,ij->i', normals, triangles[:, 0] - self.camera_position) < 0)
+        normals = normals[front] / lengths[front, None]
+        shade = 0.35 + 0.65 * np.clip(normals @ self._light, 0.0, 1.0)
+        colors = np.clip(colors[front] * shade[:, None], 0.0, 1.0)
+
+        view = np.einsum('kj,tvj->tvk', self._view, triangles[front] - self.camera_position)
+        pixel_triangles = self._rasterize(view)
+
+        image = np.empty((self.height * self.width, 3), dtype=np.float64)
+        image[:] = self.background
+        drawn = pixel_triangles >= 0
+        image[drawn] = colors[pixel_triangles[drawn]]
+        return np.round(image * 255).astype(np.uint8).reshape(self.height, self.width, 3)
+
+    def save_png(self, path: str) -> np.ndarray:
+        """Draw the recorded objects and write them to a PNG file; returns the image."""
+        image = self.render_image()
+        write_png(path, image)
+        return image
+
+    def _rasterize(self, view: np.ndarray) -> np.ndarray:
+        """
+        Z-buffer triangles given in camera coordinates (x right, y up, z depth).
+
+        Returns:
+            For each pixel (row-major), the index of the nearest triangle
+            covering its center, or -1
+        """
+        width, height = self.width, self.height
+        nearest = np.full(width * height, -1, dtype=np.int64)
+        inverse_depth = np.zeros(width * height)  # 1/z of the nearest triangle; 0 is infinitely far
+
+        # Triangles crossing the near plane are dropped rather than clipped
+        keep = np.flatnonzero(np.all(view[:, :, 2] > self.near, axis=1))
+        if not len(keep):
+            return nearest
+        view = view[keep]
+        inv_z = 1.0 / view[:, :, 2]
+        focal = (height / 2) / math.tan(math.radians(self.fov_degrees) / 2)
+        sx = width / 2 + view[:, :, 0] * focal * inv_z
+        sy = height / 2 - view[:, :, 1] * focal * inv_z
+
+        # Pixel centers (i + 0.5) covered by each triangle's bounding box
+        x0 = np.clip(np.ceil(sx.min(axis=1) - 0.5), 0, width).astype(np.int64)
+        x1 = np.clip(np.floor(sx.max(axis=1) - 0.5), -1, width - 1).astype(np.int64)
+        y0 = np.clip(np.ceil(sy.min(axis=1) - 0.5), 0, height).astype(np.int64)
+        y1 = np.clip(np.floor(sy.max(axis=1) - 0.5), -1, height - 1).astype(np.int64)
+        box_w = np.maximum(x1 - x0 + 1, 0)
+        counts = box_w * np.maximum(y1 - y0 + 1, 0)
+        area = (sx[:, 1] - sx[:, 0]) * (sy[:, 2] - sy[:, 0]) - (sx[:, 2] - sx[:, 0]) * (sy[:, 1] - sy[:, 0])
+        candidates = np.flatnonzero((counts > 0) & (np.abs(area) > 1e-12))
+
+        start = 0
+        ends = np.cumsum(counts[candidates])
+        while start < len(candidates):
+            # Take triangles up to the pair budget (at least one)
+            offset = ends[start - 1] if start else 0
+            stop = max(int(np.searchsorted(ends, offset + PIXEL_BATCH, side='right')), start + 1)
+            batch = candidates[start:stop]
+            start = stop
+
+            batch_counts = counts[batch]
+            tri = np.repeat(batch, batch_counts)
+            local = np.arange(len(tri)) - np.repeat(np.cumsum(batch_counts) - batch_counts, batch_counts)
+            px = x0[tri] + local % box_w[tri]
+            py = y0[tri] + local // box_w[tri]
+            cx, cy = px + 0.5, py + 0.5
+
+            tx, ty = sx[tri], sy[tri]
+            b0 = ((tx[:, 1] - cx) * (ty[:, 2] - cy) - (tx[:, 2] - cx) * (ty[:, 1] - cy)) / area[tri]
+            b1 = ((tx[:, 2] - cx) * (ty[:, 0] - cy) - (tx[:, 0] - cx) * (ty[:, 2] - cy)) / area[tri]
+            b2 = 1.0 - b0 - b1
+            inside = (b0 >= 0) & (b1 >= 0) & (b2 >= 0)
+            if not inside.any():
+                continue
+            tri, px, py = tri[inside], px[inside], py[inside]
+            depth = (b0[inside] * inv_z[tri, 0] + b1[inside] * inv_z[tri, 1] + b2[inside] * inv_z[tri, 2])
+            pixel = py * width + px
+
+            # Nearest fragment per pixel in this batch, then against the buffer
+            order = np.lexsort((-depth, pixel))
+            pixel, depth, tri = pixel[order], depth[order], tri[order]
+            first = np.ones(len(pixel), dtype=bool)
+            first[1:] = pixel[1:] != pixel[:-1]
+            pixel, depth, tri = pixel[first], depth[first], tri[first]
+            closer = depth > inverse_depth[pixel]
+            inverse_depth[pixel[closer]] = depth[closer]
+            nearest[pixel[closer]] = keep[tri[closer]]
+
+        return nearest
@@ -0,0 +1,120 @@
+"""
+View frustum culling and level-of-detail selection
+
+A ViewCuller decides, for each scene object, whether a renderer should draw
+it at full detail, draw a cheaper proxy, or not draw it at all. Each object's
+bounding volume is a sphere around its position (half the diagonal of its
+scaled box, so it holds under any rotation). An object is hidden when its
+sphere lies entirely outside the camera's view frustum, unless it is within
+keep_distance of the camera, and drawn as a proxy beyond detail_distance.
+
+Classification is vectorized over all objects, so re-evaluating a large scene
+after a camera move is one NumPy pass; the renderer then only touches objects
+whose level changed.
+"""
+
+import math
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from engraf.visualizer.scene.scene_object import SceneObject
+
+FULL = "full"
+PROXY = "proxy"
+HIDDEN = "hidden"
+
+
+def bounding_spheres(objects: Sequence[SceneObject]) -> Tuple[np.ndarray, np.ndarray]:
+    """Get the (N, 3) centers and (N,) radii of the objects' bounding spheres."""
+    centers = np.array([(obj.position['x'], obj.position['y'], obj.position['z']) for obj in objects],
+                       dtype=np.float64).reshape(-1, 3)
+    scales = np.array([(obj.scale['x'], obj.scale['y'], obj.scale['z']) for obj in objects],
+                      dtype=np.float64).reshape(-1, 3)
+    return centers, np.linalg.norm(scales, axis=1) / 2
+
+
+class ViewCuller:
+    """
+    Classifies objects as FULL, PROXY or HIDDEN for the current camera.
+    """
+
+    def __init__(self, fov_degrees: float = 60.0, aspect: float = 4 / 3, near: float = 0.1, far: float = 1000.0,
+                 detail_distance: Optional[float] = 50.0, keep_distance: float = 0.0):
+        """
+        Initialize the culler.
+
+        Args:
+            fov_degrees: Vertical field of view of the camera
+            aspect: Viewport width divided by height
+            near: Distance from the camera to the near clipping plane
+            far: Distance from the camera to the far clipping plane
+            detail_distance: Objects farther than this are drawn as proxies (None: never)
+            keep_distance: Objects this close to the camera stay drawn even outside
+                           the frustum, so turning the camera does not pop them in
+        """
+        if not 0 < fov_degrees < 180:
+            raise ValueError(f"fov_degrees must be between 0 and 180, got {fov_degrees}")
+        if not 0 <= near < far:
+            raise ValueError(f"need 0 <= near < far, got near={near}, far={far}")
+        self.fov_degrees = fov_degrees
+        self.aspect = aspect
+        self.near = near
+        self.far = far
+        self.detail_distance = detail_distance
+        self.keep_distance = keep_distance
+        self.camera_position: Optional[np.ndarray] = None
+        self._forward: Optional[np.ndarray] = None
+        self._side_normals: Optional[np.ndarray] = None  # (4, 3) inward unit normals through the camera
+
+    def set_camera(self, position: Tuple[float, float, float], target: Tuple[float, float, float],
+                   up: Tuple[float, float, float] = (0.0, 1.0, 0.0)) -> None:
+        """Point the frustum from position towards target."""
+        position = np.asarray(position, dtype=np.float64)
+        forward = np.asarray(target, dtype=np.float64) - position
+        if not np.any(forward):
+            raise ValueError("camera position and target must differ")
+        forward /= np.linalg.norm(forward)
+        right = np.cross(forward, np.asarray(up, dtype=np.float64))
+        if not np.any(right):
+            # Looking straight along up: any perpendicular will do
+            right = np.cross(forward, (1.0, 0.0, 0.0) if abs(forward[0]) < 0.9 else (0.0, 0.0, 1.0))
+        right /= np.linalg.norm(right)
+        true_up = np.cross(right, forward)
+
+        tan_v = math.tan(math.radians(self.fov_degrees) / 2)
+        tan_h = tan_v * self.aspect
+        normals = np.array([
+            forward * tan_h + right,   # left
+            forward * tan_h - right,   # right
+            forward * tan_v + true_up,  # bottom
+            forward * tan_v - true_up,  # top
+        ])
+        self._side_normals = normals / np.linalg.norm(normals, axis=1, keepdims=True)
+        self._forward = forward
+        self.camera_position = position
+
+    def levels(self, objects: Sequence[SceneObject]) -> List[str]:
+        """Classify each object for the current camera (all FULL before a camera is set)."""
+        if self.camera_position is None:
+            return [FULL] * len(objects)
+        if not objects:
+            return []
+
+        centers, radii = bounding_spheres(objects)
+        offsets = centers - self.camera_position
+        depth = offsets @ self._forward
+        inside = (np.all(offsets @ self._side_normals.T >= -radii[:, None], axis=1)
+                  & (depth >= self.near - radii) & (depth <= self.far + radii))
+        distance = np.maximum(np.linalg.norm(offsets, axis=1) - radii, 0.0)
+        visible = inside | (distance <= self.keep_distance)
+
+        levels = np.full(len(objects), FULL, dtype=object)
+        if self.detail_distance is not None:
+            levels[distance > self.detail_distance] = PROXY
+        levels[~visible] = HIDDEN
+        return levels.tolist()
+
+    def level(self, obj: SceneObject) -> str:
+        """Classify a single object for the current camera."""
+        return self.levels([obj])[0]
@@ -4,22 +4,69 @@ VPython renderer for 3D visualization.
 This module provides a VPython-based renderer that can display 3D objects
 created by the ENGRAF system. It supports basic geometric shapes with
 colors, textures, and transformations.
+
+vpython itself is imported on first VPythonRenderer construction, so that
+importing this module (or the interpreter) stays cheap when nothing is drawn.
 """
 
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import logging
+import time
 import numpy as np
 from typing import List, Dict, Optional, Tuple, Any
 from abc import ABC, abstractmethod
 
-try:
-    import vpython as vp
-    VPYTHON_AVAILABLE = True
-except ImportError:
-    VPYTHON_AVAILABLE = False
+# Bound by _load_vpython() on first use
+vp = None
+VPYTHON_AVAILABLE = importlib.util.find_spec("vpython") is not None
 
 from engraf.visualizer.scene.scene_model import SceneModel
 from engraf.visualizer.scene.scene_object import SceneObject
 from latn.utils.debug import debug_print
 from engraf.visualizer.transforms.transform_matrix import TransformMatrix
+from engraf.visualizer.renderers.render_scheduler import RenderScheduler
+from engraf.visualizer.renderers.instance_batch import InstanceBatch
+from engraf.visualizer.renderers.view_culling import HIDDEN, PROXY, ViewCuller
+
+logger = logging.getLogger(__name__)
+
+# (axis, up) of each primitive as created, before any rotation; cones are built pointing up
+_DEFAULT_ORIENTATION = ((1.0, 0.0, 0.0), (0.0, 1.0, 0.0))
+_BASE_ORIENTATIONS = {
+    "cone": ((0.0, 1.0, 0.0), (-1.0, 0.0, 0.0)),
+}
+
+# Cheaper shapes drawn for distant objects (see ViewCuller); other shapes are their own proxy
+_PROXY_SHAPES = {
+    "table": "cube",
+    "arch": "cube",
+    "sphere": "simple_sphere",
+    "ellipsoid": "simple_sphere",
+}
+
+
+def orientation(shape_name: str, x_degrees: float, y_degrees: float,
+                z_degrees: float) -> Tuple[Tuple[float, float, float], Tuple[float, float, float]]:
+    """Get (axis, up) of a primitive of a shape rotated about world X, then Y, then Z."""
+    base_axis, base_up = _BASE_ORIENTATIONS.get(shape_name, _DEFAULT_ORIENTATION)
+    if x_degrees == 0.0 and y_degrees == 0.0 and z_degrees == 0.0:
+        return base_axis, base_up
+    rotation = TransformMatrix.rotation_z(z_degrees).compose(
+        TransformMatrix.rotation_y(y_degrees).compose(TransformMatrix.rotation_x(x_degrees)))
+    axis = rotation.apply_to_vector(np.array(base_axis))
+    up = rotation.apply_to_vector(np.array(base_up))
+    return tuple(float(v) for v in axis), tuple(float(v) for v in up)
+
+
+def _load_vpython():
+    """Import vpython on first use and bind it to the module-level name vp."""
+    global vp
+    if vp is None:
+        vp = importlib.import_module("vpython")
+    return vp
 
 
 class RendererBase(ABC):
@@ -49,7 +96,8 @@ class VPythonRenderer(RendererBase):
     basic geometric shapes with colors, scaling, and positioning.
     """
     
-    def __init__(self, width: int = 800, height: int = 600, title: str = "ENGRAF 3D Visualizer", headless: bool = False):
+    def __init__(self, width: int = 800, height: int = 600, title: str = "ENGRAF 3D Visualizer", headless: bool = False,
+                 fps: Optional[float] = None, pool_size: int = 256, culler: Optional[ViewCuller] = None):
         """
         Initialize the VPython renderer.
         
@@ -58,9 +106,16 @@ class VPythonRenderer(RendererBase):
             height: Window height in pixels
             title: Window title
             headless: If True, disable browser window (for testing)
+            fps: If set, queue object updates and push them to the display at
+                 most this many times per second (see RenderScheduler) instead
+                 of redrawing on every update_object call
+            pool_size: Number of released primitives kept per shape for reuse
+            culler: If set, only objects it keeps for the camera get primitives,
+                    and distant ones get lower-detail proxies (see set_camera)
         """
         if not VPYTHON_AVAILABLE:
             raise ImportError("VPython is required for VPythonRenderer. Install with: pip install vpython")
+        _load_vpython()
         
         self.width = width
         self.height = height
@@ -70,8 +125,16 @@ class VPythonRenderer(RendererBase):
         # Initialize VPython scene
         self._init_scene()
         
-        # Keep track of rendered objects
+        # Keep track of rendered objects, the shape each one was built as, and
+        # (by primitive identity) which object each primitive draws
         self.rendered_objects: Dict[str, vp.compound] = {}
+        self._rendered_shapes: Dict[str, str] = {}
+        self._entity_ids: Dict[int, str] = {}
+        
+        # Unit-size compounds to clone, and hidden released primitives to reuse, per shape
+        self._compound_templates: Dict[str, vp.compound] = {}
+        self._pools: Dict[str, List[Any]] = {}
+        self.pool_size = pool_size
         
         # Shape creation methods
         self.shape_creators = {
@@ -84,7 +147,36 @@ class VPythonRenderer(RendererBase):
             "pyramid": self._create_pyramid,
             "arch": self._create_arch,
             "table": self._create_table,
+            "simple_sphere": self._create_simple_sphere,
         }
+        
+        # Camera-aware culling: every object seen, and the detail level each is drawn at
+        self.culler = culler
+        self._tracked_objects: Dict[str, SceneObject] = {}
+        self._levels: Dict[str, str] = {}
+        
+        # Frame-coalesced updates (None redraws immediately)
+        self.scheduler: Optional[RenderScheduler] = None
+        if fps:
+            self.scheduler = RenderScheduler(self._update_now, self._forget_now, fps=fps,
+                                             wait=self._wait_for_frame, after_flush=self._wait_for_draw)
+    
+    def _wait_for_frame(self, seconds: float) -> None:
+        """Let the rest of the current frame pass before the next update burst."""
+        if self.scene is not None:
+            vp.rate(self.scheduler.fps)
+        else:
+            time.sleep(seconds)
+    
+    def _wait_for_draw(self) -> None:
+        """Block until the browser has drawn the latest update burst."""
+        if self.scene is not None:
+            self.scene.waitfor('draw_complete')
+    
+    def flush(self) -> None:
+        """Push queued updates to the display now (no-op without a scheduler)."""
+        if self.scheduler is not None:
+            self.scheduler.flush()
     
     def _init_scene(self) -> None:
         """Initialize the VPython scene with basic settings."""
@@ -127,10 +219,16 @@ class VPythonRenderer(RendererBase):
         Args:
             scene: The scene model to render
         """
-        # Only render objects that haven't been rendered yet
+        # Only render objects that haven't been rendered (or culled) yet
         for obj in scene.objects:
-            if obj.object_id not in self.rendered_objects:
-                self.render_object(obj)
+            if obj.object_id not in self.rendered_objects and obj.object_id not in self._levels:
+                if self.scheduler is not None:
+                    self.scheduler.mark_dirty(obj)
+                elif self.culler is not None:
+                    self._update_now(obj)
+                else:
+                    self.render_object(obj)
+        self.flush()
     
     def render_object(self, obj: SceneObject) -> None:
         """
@@ -142,84 +240,74 @@ class VPythonRenderer(RendererBase):
         # Ensure the object's transformation properties are up to date
         obj.update_transformations()
         
-        # Get the shape name from the object (extract from names like "cube_1", "sphere_2", etc.)
-        shape_name = obj.name.split('_')[0].lower() if '_' in obj.name else obj.name.lower()
+        # Never leave a previous primitive for the same object behind
+        self._remove_now(obj.object_id)
         
-        # Determine the appropriate shape creator
-        creator = self.shape_creators.get(shape_name, self._create_cube)
+        shape_name = self._drawn_shape(obj)
         
-        # Create the VPython object
-        vpython_obj = creator(obj)
+        pool = self._pools.get(shape_name)
+        if pool:
+            # Reuse a released primitive of the same shape
+            vpython_obj = pool.pop()
+            self._apply_transformations(vpython_obj, obj, reorient=True)
+            vpython_obj.visible = True
+        else:
+            # Determine the appropriate shape creator
+            creator = self.shape_creators.get(shape_name, self._create_cube)
+            
+            # Create the VPython object
+            vpython_obj = creator(obj)
         
         # Store the rendered object using object_id as key
         self.rendered_objects[obj.object_id] = vpython_obj
+        self._rendered_shapes[obj.object_id] = shape_name
+        self._entity_ids[id(vpython_obj)] = obj.object_id
+    
+    def _shape_name(self, obj: SceneObject) -> str:
+        """Get the shape an object is drawn as (from names like "cube_1", "sphere_2", etc.)."""
+        return obj.name.split('_')[0].lower() if '_' in obj.name else obj.name.lower()
+    
+    def _drawn_shape(self, obj: SceneObject) -> str:
+        """Get the shape an object's primitive is built as: its own, or its proxy at PROXY detail."""
+        shape_name = self._shape_name(obj)
+        if self._levels.get(obj.object_id) == PROXY:
+            return _PROXY_SHAPES.get(shape_name, shape_name)
+        return shape_name
     
     def clear_scene(self) -> None:
-        """Clear all objects from the scene."""
-        # First, clear our tracked objects
-        for obj in self.rendered_objects.values():
-            if hasattr(obj, 'visible'):
-                obj.visible = False
-            # Delete the object reference
-            del obj
+        """Clear all objects from the scene in one pass over what is drawn."""
+        # First, release our tracked objects in bulk
+        for object_id, vpython_obj in self.rendered_objects.items():
+            vpython_obj.visible = False
+            self._pool(self._rendered_shapes.get(object_id), vpython_obj)
         self.rendered_objects.clear()
-        
-        # Clear all objects from the VPython scene
-        if not self.headless and self.scene is not None:
-            try:
-                # Get a copy of the scene objects list since we'll be modifying it
-                scene_objects = list(self.scene.objects)
-                
-                # Remove all objects from the scene
-                for obj in scene_objects:
-                    if hasattr(obj, 'visible'):
-                        obj.visible = False
-                    # VPython objects are automatically removed when they go out of scope
-                    # and their visible property is set to False
-                
-                # Force garbage collection to ensure objects are properly cleaned up
-                import gc
-                gc.collect()
-                
-            except Exception as e:
-                # If there's any issue clearing the scene, log it but continue
-                print(f"Warning: Error clearing VPython scene: {e}")
-        
-        # Re-enabled unwanted object clearing for complete cleanup
+        self._rendered_shapes.clear()
+        self._entity_ids.clear()
+        self._tracked_objects.clear()
+        self._levels.clear()
+        if self.scheduler is not None:
+            self.scheduler.clear()
+        
+        # Then hide anything else still drawn on the canvas
         self._clear_unwanted_objects()
     
     def _clear_unwanted_objects(self) -> None:
-        """Clear any unwanted objects that VPython might have created after scene completion."""
+        """Hide every visible canvas object that is not one of our rendered objects."""
         if self.headless or self.scene is None:
             return
-            
+        
         try:
-            # Get all objects in the scene
-            scene_objects = self.scene.objects
-            
-            # Remove any objects that are not in our rendered_objects dict
-            objects_to_remove = []
-            for obj in scene_objects:
-                # Check if this object is one we created
-                is_our_object = False
-                for rendered_obj in self.rendered_objects.values():
-                    if obj == rendered_obj:
-                        is_our_object = True
-                        break
-                
-                # If it's not our object, mark it for removal
-                if not is_our_object:
-                    objects_to_remove.append(obj)
-            
-            # Remove the unwanted objects
-            for obj in objects_to_remove:
-                if hasattr(obj, 'visible'):
+            for obj in list(self.scene.objects):
+                # Identity lookup in the reverse map instead of comparing against every rendered object
+                if id(obj) not in self._entity_ids and getattr(obj, 'visible', False):
                     obj.visible = False
-                    del obj
-                    
-        except Exception:
-            # If there's any issue clearing unwanted objects, just continue
-            pass
+        except Exception as e:
+            # If there's any issue clearing the scene, log it but continue
+            logger.warning("Error clearing VPython scene: %s", e)
+    
+    def entity_id_for(self, vpython_obj) -> Optional[str]:
+        """Get the ID of the scene object a VPython primitive draws, or None."""
+        return self._entity_ids.get(id(vpython_obj))
     
     def _create_cube(self, obj: SceneObject) -> vp.compound:
         """Create a cube/box object."""
@@ -249,6 +337,18 @@ class VPythonRenderer(RendererBase):
         
         return sphere
     
+    def _create_simple_sphere(self, obj: SceneObject) -> vp.simple_sphere:
+        """Create a low-detail sphere (the proxy for distant spheres and ellipsoids)."""
+        sphere = vp.simple_sphere(
+            pos=vp.vector(0, 0, 0),
+            radius=0.5,
+            color=vp.vector(1, 1, 1)
+        )
+        
+        self._apply_transformations(sphere, obj)
+        
+        return sphere
+    
     def _create_ellipsoid(self, obj: SceneObject) -> vp.compound:
         """Create an ellipsoid object that can be scaled non-uniformly."""
         position = self._extract_position(obj)
@@ -317,12 +417,15 @@ class VPythonRenderer(RendererBase):
         return pyramid
     
     def _create_arch(self, obj: SceneObject) -> vp.compound:
-        """Create an arch object using compound shapes."""
-        position = self._extract_position(obj)
-        size = self._extract_size(obj)
-        color = self._extract_color(obj)
+        """Create an arch object by cloning the unit arch compound."""
+        arch = self._clone_template("arch", self._arch_parts)
+        
+        self._apply_transformations(arch, obj)
         
-        # Create arch as combination of boxes and a cylinder
+        return arch
+    
+    def _arch_parts(self, position: vp.vector, size: vp.vector, color: vp.vector) -> List[Any]:
+        """Build the parts of an arch: two pillars and a cylinder across the top."""
         # Base pillars
         left_pillar = vp.box(
             pos=position + vp.vector(-size.x/2, 0, 0),
@@ -344,19 +447,18 @@ class VPythonRenderer(RendererBase):
             color=color
         )
         
-        # Combine into compound object
-        arch = vp.compound([left_pillar, right_pillar, arch_top])
-        
-        self._apply_transformations(arch, obj)
-        
-        return arch
+        return [left_pillar, right_pillar, arch_top]
     
     def _create_table(self, obj: SceneObject) -> vp.compound:
-        """Create a table object using compound shapes."""
-        position = self._extract_position(obj)
-        size = self._extract_size(obj)
-        color = self._extract_color(obj)
+        """Create a table object by cloning the unit table compound."""
+        table = self._clone_template("table", self._table_parts)
+        
+        self._apply_transformations(table, obj)
         
+        return table
+    
+    def _table_parts(self, position: vp.vector, size: vp.vector, color: vp.vector) -> List[Any]:
+        """Build the parts of a table: a top and four legs."""
         # Table top
         table_top = vp.box(
             pos=position + vp.vector(0, size.y/2, 0),
@@ -382,12 +484,22 @@ class VPythonRenderer(RendererBase):
             )
             legs.append(leg)
         
-        # Combine all parts
-        table = vp.compound([table_top] + legs)
-        
-        self._apply_transformations(table, obj)
+        return [table_top] + legs
+    
+    def _clone_template(self, shape_name: str, build_parts) -> vp.compound:
+        """
+        Clone the cached unit-size compound for a shape, building it on first use.
         
-        return table
+        Compound construction is expensive in VPython; a clone is cheap, and
+        _apply_transformations sets the clone's actual position, size and color.
+        """
+        template = self._compound_templates.get(shape_name)
+        if template is None:
+            white = vp.vector(1, 1, 1)
+            template = vp.compound(build_parts(vp.vector(0, 0, 0), vp.vector(1, 1, 1), white))
+            template.visible = False
+            self._compound_templates[shape_name] = template
+        return template.clone(visible=True)
     
     def _extract_position(self, obj: SceneObject) -> vp.vector:
         """Extract position from object's vector or default to origin."""
@@ -433,8 +545,24 @@ class VPythonRenderer(RendererBase):
         
         return vp.vector(1, 1, 1)  # Default to white
     
-    def _apply_transformations(self, vpython_obj: vp.compound, obj: SceneObject) -> None:
-        """Apply transformations using SceneObject properties directly - clean approach."""
+    def _apply_transformations(self, vpython_obj: vp.compound, obj: SceneObject, reorient: bool = False) -> None:
+        """
+        Set a primitive's position, color, orientation and size from SceneObject properties.
+        
+        Every property is set absolutely, so this also updates an existing primitive in place.
+        
+        Args:
+            vpython_obj: The primitive to update
+            obj: The scene object it draws
+            reorient: Set axis/up even without a rotation, resetting any earlier one
+                      (for primitives that are updated or reused rather than new)
+        """
+        
+        # Apply orientation before size: setting axis also sets a primitive's length
+        if reorient or obj.has_rotation():
+            axis, up = self._orientation(obj)
+            vpython_obj.axis = vp.vector(*axis)
+            vpython_obj.up = vp.vector(*up)
         
         # Apply position
         if obj.position:
@@ -457,21 +585,16 @@ class VPythonRenderer(RendererBase):
                 # For sphere objects, use average scale as radius
                 vpython_obj.radius = (obj.scale['x'] + obj.scale['y'] + obj.scale['z']) / 3
         
-        # Apply rotation using individual rotation values
+    def _orientation(self, obj: SceneObject) -> Tuple[Tuple[float, float, float], Tuple[float, float, float]]:
+        """
+        Get (axis, up) for an object's rotation, computed directly from its angles.
+        
+        Equivalent to rotating the unrotated primitive about the world X, then Y,
+        then Z axis, but never accumulates rounding from earlier rotations.
+        """
         if obj.has_rotation():
             debug_print(f"🔧 Applying rotations: X={obj.rotation['x']}°, Y={obj.rotation['y']}°, Z={obj.rotation['z']}°")
-            
-            # Get rotation in radians
-            rot_radians = obj.get_rotation_radians()
-            
-            # Apply rotations using VPython's rotate method
-            # VPython rotations are applied around the object's center
-            if rot_radians['x'] != 0.0:
-                vpython_obj.rotate(angle=rot_radians['x'], axis=vp.vector(1, 0, 0))
-            if rot_radians['y'] != 0.0:
-                vpython_obj.rotate(angle=rot_radians['y'], axis=vp.vector(0, 1, 0))
-            if rot_radians['z'] != 0.0:
-                vpython_obj.rotate(angle=rot_radians['z'], axis=vp.vector(0, 0, 1))
+        return orientation(self._shape_name(obj), obj.rotation['x'], obj.rotation['y'], obj.rotation['z'])
     
     def _apply_transform_matrix(self, vpython_obj: vp.compound, matrix: np.ndarray) -> None:
         """Legacy matrix transformation method - now using direct SceneObject properties instead."""
@@ -480,18 +603,109 @@ class VPythonRenderer(RendererBase):
         pass
     
     def update_object(self, obj: SceneObject) -> None:
-        """Update an existing object in the scene."""
+        """
+        Update an existing object in the scene.
+        
+        The existing primitive is moved, resized, recolored and reoriented in
+        place; a new one is only built if the object is not rendered yet or its
+        shape changed. With a scheduler, the update is queued and drawn with
+        the next frame's burst.
+        """
+        if self.scheduler is not None:
+            self.scheduler.mark_dirty(obj)
+            self.scheduler.poll()
+            return
+        self._update_now(obj)
+    
+    def _update_now(self, obj: SceneObject) -> None:
         # Ensure the object's transformation properties are up to date
         obj.update_transformations()
         
-        if obj.object_id in self.rendered_objects:
-            # Remove the old object
-            self.rendered_objects[obj.object_id].visible = False
-            del self.rendered_objects[obj.object_id]
+        if self.culler is not None:
+            self._tracked_objects[obj.object_id] = obj
+            self._levels[obj.object_id] = self.culler.level(obj)
+        self._draw(obj)
+    
+    def _draw(self, obj: SceneObject) -> None:
+        """Bring an object's primitive in line with its properties and detail level."""
+        if self._levels.get(obj.object_id) == HIDDEN:
+            self._remove_now(obj.object_id)
+            return
+        
+        vpython_obj = self.rendered_objects.get(obj.object_id)
+        if vpython_obj is not None and self._rendered_shapes.get(obj.object_id) == self._drawn_shape(obj):
+            self._apply_transformations(vpython_obj, obj, reorient=True)
+            return
         
         # Render the updated object
         self.render_object(obj)
     
+    def update_visibility(self) -> int:
+        """
+        Re-evaluate which objects are drawn, and at what detail, for the culler's camera.
+        
+        All objects are classified in one pass; only those whose level changed
+        get a primitive built, swapped for a proxy or released.
+        
+        Returns:
+            Number of objects whose level changed
+        """
+        if self.culler is None:
+            return 0
+        objects = list(self._tracked_objects.values())
+        changed = 0
+        for obj, level in zip(objects, self.culler.levels(objects)):
+            if self._levels.get(obj.object_id) != level:
+                self._levels[obj.object_id] = level
+                self._draw(obj)
+                changed += 1
+        return changed
+
+    def remove_object(self, object_id: str) -> None:
+        """Remove a rendered object from the scene."""
+        if self.scheduler is not None:
+            self.scheduler.mark_removed(object_id)
+            self.scheduler.poll()
+            return
+        self._forget_now(object_id)
+    
+    def _forget_now(self, object_id: str) -> None:
+        self._tracked_objects.pop(object_id, None)
+        self._levels.pop(object_id, None)
+        self._remove_now(object_id)
+    
+    def _remove_now(self, object_id: str) -> None:
+        shape_name = self._rendered_shapes.pop(object_id, None)
+        vpython_obj = self.rendered_objects.pop(object_id, None)
+        if vpython_obj is not None:
+            self._entity_ids.pop(id(vpython_obj), None)
+            vpython_obj.visible = False
+            self._pool(shape_name, vpython_obj)
+    
+    def _pool(self, shape_name: Optional[str], vpython_obj) -> None:
+        """Keep a hidden primitive for the next object of the same shape, if the pool has room."""
+        pool = self._pools.setdefault(shape_name, [])
+        if len(pool) < self.pool_size:
+            pool.append(vpython_obj)
+
+    def apply_scene_diff(self, scene: SceneModel, diff) -> None:
+        """
+        Bring the display in line with a new scene state by touching only the
+        objects in a SceneDiff, instead of re-rendering the whole scene.
+
+        Args:
+            scene: The scene state being switched to
+            diff: A SceneDiff from the currently displayed scene to `scene`
+        """
+        for object_id in diff.removed:
+            self.remove_object(object_id)
+
+        for object_id in diff.added + diff.changed:
+            obj = scene.find_object_by_id(object_id)
+            if obj is not None:
+                self.update_object(obj)
+        self.flush()
+
     def get_object_info(self, obj_name: str) -> Optional[Dict[str, Any]]:
         """Get information about a rendered object."""
         if obj_name in self.rendered_objects:
@@ -505,15 +719,152 @@ class VPythonRenderer(RendererBase):
         return None
     
     def set_camera(self, position: Tuple[float, float, float], target: Tuple[float, float, float]) -> None:
-        """Set the camera position and target."""
-        self.scene.camera.pos = vp.vector(*position)
-        self.scene.center = vp.vector(*target)
+        """Set the camera position and target, re-culling the scene if a culler is set."""
+        if self.scene is not None:
+            self.scene.camera.pos = vp.vector(*position)
+            self.scene.center = vp.vector(*target)
+        if self.culler is not None:
+            self.culler.set_camera(position, target)
+            self.update_visibility()
     
     def set_background_color(self, color: Tuple[float, float, float]) -> None:
         """Set the background color."""
         self.scene.background = vp.vector(*color)
 
 
+class InstancedVPythonRenderer(VPythonRenderer):
+    """
+    VPython renderer that draws objects of the same shape as instances.
+    
+    Each shape's objects live as rows of an InstanceBatch (position, size,
+    color and rotation arrays). VPython has no per-instance draw call, so every
+    chunk of rows is drawn as one merged static compound built from clones of a
+    unit primitive: 50k cubes become about 50 VPython objects. Changing an
+    object only rebuilds its chunk, on the next render_scene() or flush().
+    """
+    
+    def __init__(self, width: int = 800, height: int = 600, title: str = "ENGRAF 3D Visualizer",
+                 headless: bool = False, chunk_size: int = 1024, **kwargs):
+        """
+        Initialize the instanced renderer.
+        
+        Args:
+            width: Window width in pixels
+            height: Window height in pixels
+            title: Window title
+            headless: If True, disable browser window (for testing)
+            chunk_size: Instances merged into each compound; smaller chunks make
+                        single-object updates cheaper, larger ones mean fewer objects
+            **kwargs: Other VPythonRenderer options (pool_size). fps and culler
+                      are rejected: instances are only drawn, whole chunks at a
+                      time, by flush()
+        """
+        if kwargs.get('fps') or kwargs.get('culler') is not None:
+            raise ValueError("InstancedVPythonRenderer does not support fps or culler; "
+                             "use the 'vpython' backend for scheduled or culled rendering")
+        super().__init__(width=width, height=height, title=title, headless=headless, **kwargs)
+        self.chunk_size = chunk_size
+        self.batches: Dict[str, InstanceBatch] = {}
+        self._instance_shapes: Dict[str, str] = {}  # object_id -> shape
+        self._chunks: Dict[Tuple[str, int], Any] = {}  # (shape, chunk) -> drawn compound
+        self._unit_primitives: Dict[str, Any] = {}
+    
+    def render_scene(self, scene: SceneModel) -> None:
+        """Add the scene's new objects as instances and redraw changed chunks."""
+        for obj in scene.objects:
+            if obj.object_id not in self._instance_shapes:
+                self._set_instance(obj)
+        self.flush()
+    
+    def render_object(self, obj: SceneObject) -> None:
+        """Add or update an object's instance (drawn on the next flush)."""
+        self._set_instance(obj)
+    
+    def update_object(self, obj: SceneObject) -> None:
+        """Update an object's instance (drawn on the next flush)."""
+        self._set_instance(obj)
+    
+    def remove_object(self, object_id: str) -> None:
+        """Remove an object's instance (drawn on the next flush)."""
+        shape_name = self._instance_shapes.pop(object_id, None)
+        if shape_name is not None:
+            self.batches[shape_name].remove(object_id)
+    
+    def flush(self) -> None:
+        """Rebuild the compound of every chunk that changed."""
+        for shape_name, batch in self.batches.items():
+            for chunk in batch.take_dirty():
+                self._draw_chunk(shape_name, batch, chunk)
+    
+    def clear_scene(self) -> None:
+        """Clear all instances and drawn chunks."""
+        for compound in self._chunks.values():
+            compound.visible = False
+        self._chunks.clear()
+        self.batches.clear()
+        self._instance_shapes.clear()
+        super().clear_scene()
+    
+    def get_object_info(self, obj_name: str) -> Optional[Dict[str, Any]]:
+        """Get information about an instanced object."""
+        shape_name = self._instance_shapes.get(obj_name)
+        if shape_name is None:
+            return None
+        batch = self.batches[shape_name]
+        row = batch.row(obj_name)
+        return {
+            "name": obj_name,
+            "position": batch.positions[row].tolist(),
+            "visible": True,
+            "color": batch.colors[row].tolist()
+        }
+    
+    def _set_instance(self, obj: SceneObject) -> None:
+        obj.update_transformations()
+        shape_name = self._shape_name(obj)
+        previous = self._instance_shapes.get(obj.object_id)
+        if previous is not None and previous != shape_name:
+            self.batches[previous].remove(obj.object_id)
+        batch = self.batches.get(shape_name)
+        if batch is None:
+            batch = self.batches[shape_name] = InstanceBatch(shape_name, self.chunk_size)
+        batch.set(obj)
+        self._instance_shapes[obj.object_id] = shape_name
+    
+    def _draw_chunk(self, shape_name: str, batch: InstanceBatch, chunk: int) -> None:
+        old = self._chunks.pop((shape_name, chunk), None)
+        if old is not None:
+            old.visible = False
+        rows = batch.chunk_rows(chunk)
+        if not rows:
+            return
+        parts = [self._instance_part(shape_name, batch, row) for row in rows]
+        self._chunks[(shape_name, chunk)] = vp.compound(parts) if len(parts) > 1 else parts[0]
+    
+    def _instance_part(self, shape_name: str, batch: InstanceBatch, row: int):
+        """Clone the shape's unit primitive with one row's transform and color."""
+        position, size, color = batch.positions[row], batch.sizes[row], batch.colors[row]
+        part = self._unit_primitive(shape_name).clone(
+            pos=vp.vector(*position), color=vp.vector(*color), visible=True)
+        rotation = batch.rotations[row]
+        if rotation.any():
+            axis, up = orientation(shape_name, *rotation)
+            part.axis = vp.vector(*axis)
+            part.up = vp.vector(*up)
+        part.size = vp.vector(*size)
+        return part
+    
+    def _unit_primitive(self, shape_name: str):
+        """Get the hidden unit-size primitive a shape's instances are cloned from."""
+        unit = self._unit_primitives.get(shape_name)
+        if unit is None:
+            creator = self.shape_creators.get(shape_name, self._create_cube)
+            unit = creator(SceneObject(shape_name, None, object_id=f"{shape_name}-unit"))
+            unit.visible = False
+            self._unit_primitives[shape_name] = unit
+        return unit
+
+
 class MockVPythonRenderer(RendererBase):
     """
     Mock renderer for testing when VPython is not available.
@@ -564,18 +915,25 @@ def create_renderer(backend: str = "vpython", **kwargs) -> RendererBase:
     Factory function to create a renderer.
     
     Args:
-        backend: The rendering backend ("vpython" or "mock")
+        backend: The rendering backend ("vpython", "instanced", "software", "websocket" or "mock")
         **kwargs: Additional arguments passed to the renderer
         
     Returns:
         A renderer instance
     """
-    if backend == "vpython":
+    if backend in ("vpython", "instanced"):
         if VPYTHON_AVAILABLE:
-            return VPythonRenderer(**kwargs)
+            renderer_class = InstancedVPythonRenderer if backend == "instanced" else VPythonRenderer
+            return renderer_class(**kwargs)
         else:
-            print("Warning: VPython not available, using mock renderer")
+            logger.warning("VPython not available, using mock renderer")
             return MockVPythonRenderer(**kwargs)
+    elif backend == "software":
+        from engraf.visualizer.renderers.software_renderer import SoftwareRenderer
+        return SoftwareRenderer(**kwargs)
+    elif backend == "websocket":
+        from engraf.visualizer.renderers.websocket_renderer import WebSocketRenderer
+        return WebSocketRenderer(**kwargs)
     elif backend == "mock":
         return MockVPythonRenderer(**kwargs)
     else:
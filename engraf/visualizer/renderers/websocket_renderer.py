@@ -0,0 +1,510 @@
+"""
+WebSocket delta-streaming renderer
+
+WebSocketRenderer serves the scene to browser clients over a local
+WebSocket (plain RFC 6455 on asyncio, no extra dependencies). It implements
+the same change-set interface as the other renderers: render_object,
+update_object, remove_object and apply_scene_diff. It streams those changes
+as compact binary messages:
+
+    CLEAR   kind=0
+    REMOVE  kind=1  handles
+    CREATE  kind=2  handles, rows, then each object's shape and ID
+    UPDATE  kind=3  handles, rows
+    CAMERA  kind=4  position and target
+
+Every message starts with an 8-byte header (uint8 kind, 3 pad bytes, uint32
+count), followed by count uint32 handles and count rows of 12 float32
+(position, rotation in degrees, scale, color; see process_renderer). All
+values are little-endian and 4-byte aligned.
+
+Each client has its own pending change set rather than a message queue. A
+client whose socket is backed up (see high_water) is not written to. Its
+pending changes keep merging, so an object edited many times is sent once
+when the client catches up. New clients start with a snapshot: a pending set
+holding every current object. Bandwidth and CPU therefore follow the edits,
+not the size of the scene.
+
+GET / serves the bundled HTML/JS client (web/delta_client.html).
+DeltaClient is a blocking Python client for tests and tooling.
+"""
+
+import asyncio
+import base64
+import hashlib
+import itertools
+import os
+import socket
+import struct
+import threading
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from engraf.visualizer.renderers.process_renderer import ROW_FIELDS, object_row
+from engraf.visualizer.renderers.vpython_renderer import RendererBase
+from engraf.visualizer.scene.scene_model import SceneModel
+from engraf.visualizer.scene.scene_object import SceneObject
+
+CLEAR, REMOVE, CREATE, UPDATE, CAMERA = range(5)
+
+_HEADER = struct.Struct('<B3xI')
+_WEBSOCKET_GUID = b'258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+_CLIENT_PAGE = os.path.join(os.path.dirname(__file__), 'web', 'delta_client.html')
+
+
+def _accept_key(key: str) -> str:
+    return base64.b64encode(hashlib.sha1(key.encode() + _WEBSOCKET_GUID).digest()).decode()
+
+
+def _frame(payload: bytes, opcode: int = 0x2) -> bytes:
+    """Encode an unmasked (server-to-client) WebSocket frame."""
+    length = len(payload)
+    if length < 126:
+        header = struct.pack('!BB', 0x80 | opcode, length)
+    elif length < 1 << 16:
+        header = struct.pack('!BBH', 0x80 | opcode, 126, length)
+    else:
+        header = struct.pack('!BBQ', 0x80 | opcode, 127, length)
+    return header + payload
+
+
+def encode_rows(kind: int, handles: List[int], rows: Optional[np.ndarray] = None) -> bytes:
+    """Encode a REMOVE, UPDATE or CREATE body (without the CREATE names)."""
+    parts = [_HEADER.pack(kind, len(handles)), np.asarray(handles, dtype='<u4').tobytes()]
+    if rows is not None:
+        parts.append(np.asarray(rows, dtype='<f4').reshape(-1, ROW_FIELDS).tobytes())
+    return b''.join(parts)
+
+
+def decode_message(data: bytes) -> Tuple[int, Dict[str, Any]]:
+    """Decode one message into (kind, fields); the inverse of what WebSocketRenderer sends."""
+    kind, count = _HEADER.unpack_from(data)
+    offset = _HEADER.size
+    if kind == CAMERA:
+        values = np.frombuffer(data, dtype='<f4', count=6, offset=offset).tolist()
+        return kind, {'position': values[:3], 'target': values[3:]}
+    handles = np.frombuffer(data, dtype='<u4', count=count, offset=offset).tolist()
+    offset += 4 * count
+    fields: Dict[str, Any] = {'handles': handles}
+    if kind in (CREATE, UPDATE):
+        fields['rows'] = np.frombuffer(data, dtype='<f4', count=count * ROW_FIELDS,
+                                       offset=offset).reshape(count, ROW_FIELDS)
+        offset += 4 * count * ROW_FIELDS
+    if kind == CREATE:
+        names = []
+        for _ in range(count):
+            shape_length = data[offset]
+            shape = data[offset + 1:offset + 1 + shape_length].decode()
+            offset += 1 + shape_length
+            (id_length,) = struct.unpack_from('<H', data, offset)
+            object_id = data[offset + 2:offset + 2 + id_length].decode()
+            offset += 2 + id_length
+            names.append((shape, object_id))
+        fields['names'] = names
+    return kind, fields
+
+
+class _ClientState:
+    """
+    One client's pending changes since its last send. Mutated under the
+    renderer's lock; the client's sender task waits on `wake`.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, writer: Optional[asyncio.StreamWriter] = None):
+        self.loop = loop
+        self.writer = writer
+        self.wake = asyncio.Event()
+        self.clear = False
+        self.created: Dict[int, None] = {}  # Ordered set
+        self.updated: Set[int] = set()
+        self.removed: Set[int] = set()
+        self.camera = False
+        self.bytes_sent = 0
+        self._signalled = False
+
+    def create(self, handle: int) -> None:
+        self.created[handle] = None
+
+    def update(self, handle: int) -> None:
+        if handle not in self.created:
+            self.updated.add(handle)
+
+    def remove(self, handle: int) -> None:
+        if handle in self.created:
+            del self.created[handle]  # Never sent: the client need not hear of it
+            return
+        self.updated.discard(handle)
+        self.removed.add(handle)
+
+    def reset(self) -> None:
+        self.clear = True
+        self.created.clear()
+        self.updated.clear()
+        self.removed.clear()
+
+    @property
+    def pending(self) -> bool:
+        return bool(self.clear or self.created or self.updated or self.removed or self.camera)
+
+    def signal(self) -> None:
+        """Wake the sender task (at most one wakeup scheduled at a time)."""
+        if not self._signalled:
+            self._signalled = True
+            self.loop.call_soon_threadsafe(self.wake.set)
+
+    def take(self) -> Tuple[bool, List[int], List[int], List[int], bool]:
+        taken = (self.clear, sorted(self.removed), list(self.created), sorted(self.updated), self.camera)
+        self.clear = self.camera = self._signalled = False
+        self.created, self.updated, self.removed = {}, set(), set()
+        return taken
+
+
+class WebSocketRenderer(RendererBase):
+    """
+    Renderer that streams scene changes to WebSocket clients.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8765, high_water: int = 1 << 20, headless: bool = True):
+        """
+        Start serving in a background thread.
+
+        Args:
+            host: Interface to listen on
+            port: Port to listen on (0 picks a free port; see self.port)
+            high_water: Bytes buffered for a client before its changes are held back and merged
+            headless: Accepted for create_renderer compatibility
+        """
+        self.headless = headless
+        self.high_water = high_water
+        self._lock = threading.Lock()
+        self._handles: Dict[str, int] = {}
+        self._objects: Dict[int, Tuple[str, str, Tuple[float, ...]]] = {}  # handle -> (object_id, shape, row)
+        self._next_handle = itertools.count(1)
+        self._camera: Optional[Tuple[float, ...]] = None
+        self._clients: Set[_ClientState] = set()
+        self._connections: Set[asyncio.Task] = set()
+
+        self._loop = asyncio.new_event_loop()
+        self._server: Optional[asyncio.base_events.Server] = None
+        self._startup_error: Optional[BaseException] = None
+        ready = threading.Event()
+        self._thread = threading.Thread(target=self._serve, args=(host, port, ready), name="engraf-websocket",
+                                        daemon=True)
+        self._thread.start()
+        ready.wait()
+        if self._startup_error is not None:
+            raise self._startup_error
+
+    @property
+    def client_count(self) -> int:
+        with self._lock:
+            return len(self._clients)
+
+    def render_scene(self, scene: SceneModel) -> None:
+        """Stream every object not sent yet."""
+        for obj in scene.objects:
+            if obj.object_id not in self._handles:
+                self.render_object(obj)
+
+    def render_object(self, obj: SceneObject) -> None:
+        """Stream a new object (or an update of a known one)."""
+        obj.update_transformations()
+        with self._lock:
+            handle = self._handles.get(obj.object_id)
+            if handle is not None and self._objects[handle][1] != obj.name:
+                # Shape changed: clients rebuild it
+                self._remove_locked(obj.object_id)
+                handle = None
+            if handle is None:
+                handle = self._handles[obj.object_id] = next(self._next_handle)
+                self._objects[handle] = (obj.object_id, obj.name, object_row(obj))
+                for client in self._clients:
+                    client.create(handle)
+                    client.signal()
+            else:
+                self._objects[handle] = (obj.object_id, obj.name, object_row(obj))
+                for client in self._clients:
+                    client.update(handle)
+                    client.signal()
+
+    def update_object(self, obj: SceneObject) -> None:
+        """Stream an object's new state."""
+        self.render_object(obj)
+
+    def remove_object(self, object_id: str) -> None:
+        """Stream an object's removal."""
+        with self._lock:
+            self._remove_locked(object_id)
+
+    def _remove_locked(self, object_id: str) -> None:
+        handle = self._handles.pop(object_id, None)
+        if handle is not None:
+            del self._objects[handle]
+            for client in self._clients:
+                client.remove(handle)
+                client.signal()
+
+    def apply_scene_diff(self, scene: SceneModel, diff) -> None:
+        """Stream the objects in a SceneDiff."""
+        for object_id in diff.removed:
+            self.remove_object(object_id)
+        for object_id in diff.added + diff.changed:
+            obj = scene.find_object_by_id(object_id)
+            if obj is not None:
+                self.update_object(obj)
+
+    def clear_scene(self) -> None:
+        """Remove every object on every client."""
+        with self._lock:
+            self._handles.clear()
+            self._objects.clear()
+            for client in self._clients:
+                client.reset()
+                client.signal()
+
+    def set_camera(self, position: Tuple[float, float, float], target: Tuple[float, float, float]) -> None:
+        """Move every client's camera."""
+        with self._lock:
+            self._camera = tuple(position) + tuple(target)
+            for client in self._clients:
+                client.camera = True
+                client.signal()
+
+    def flush(self) -> None:
+        """Nothing to do: changes are sent as soon as each client can take them."""
+
+    def get_object_info(self, obj_name: str) -> Optional[Dict[str, Any]]:
+        """Get information about a streamed object."""
+        with self._lock:
+            handle = self._handles.get(obj_name)
+            if handle is None:
+                return None
+            row = self._objects[handle][2]
+        return {"name": obj_name, "position": list(row[0:3]), "visible": True, "color": list(row[9:12])}
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Disconnect every client and stop serving."""
+        if not self._thread.is_alive():
+            return
+        asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result(timeout)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout)
+
+    # Server thread
+
+    def _serve(self, host: str, port: int, ready: threading.Event) -> None:
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._server = self._loop.run_until_complete(asyncio.start_server(self._handle_connection, host, port))
+            self.port = self._server.sockets[0].getsockname()[1]
+        except OSError as e:
+            self._startup_error = e
+            ready.set()
+            return
+        ready.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            self._loop.close()
+
+    async def _shutdown(self) -> None:
+        self._server.close()
+        with self._lock:
+            clients = list(self._clients)
+        for client in clients:
+            client.writer.transport.abort()  # Ends the read loop even if the client is backed up
+        await asyncio.gather(*self._connections, return_exceptions=True)
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        self._connections.add(task)
+        try:
+            await self._converse(reader, writer)
+        finally:
+            self._connections.discard(task)
+
+    async def _converse(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            head = await reader.readuntil(b'\r\n\r\n')
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            writer.close()
+            return
+        request_line, *header_lines = head.decode('latin-1').split('\r\n')
+        headers = {}
+        for line in header_lines:
+            if ':' in line:
+                name, value = line.split(':', 1)
+                headers[name.strip().lower()] = value.strip()
+
+        if headers.get('upgrade', '').lower() != 'websocket':
+            await self._serve_page(request_line, writer)
+            return
+
+        writer.write(('HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n'
+                      f'Sec-WebSocket-Accept: {_accept_key(headers.get("sec-websocket-key", ""))}\r\n\r\n').encode())
+        writer.transport.set_write_buffer_limits(high=self.high_water)
+
+        client = _ClientState(self._loop, writer)
+        with self._lock:
+            # Snapshot: the new client's first pending set is the whole scene
+            for handle in self._objects:
+                client.create(handle)
+            client.camera = self._camera is not None
+            self._clients.add(client)
+            client.signal()
+
+        sender = asyncio.ensure_future(self._send_changes(client, writer))
+        try:
+            await self._read_frames(reader, writer)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            with self._lock:
+                self._clients.discard(client)
+            sender.cancel()
+            await asyncio.gather(sender, return_exceptions=True)
+            writer.close()
+
+    async def _serve_page(self, request_line: str, writer: asyncio.StreamWriter) -> None:
+        parts = request_line.split()
+        if len(parts) >= 2 and parts[0] == 'GET' and parts[1] in ('/', '/index.html'):
+            with open(_CLIENT_PAGE, 'rb') as f:
+                body = f.read()
+            status, content_type = '200 OK', 'text/html; charset=utf-8'
+        else:
+            body, status, content_type = b'Not found', '404 Not Found', 'text/plain'
+        writer.write((f'HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\nContent-Length: {len(body)}\r\n'
+                      'Connection: close\r\n\r\n').encode() + body)
+        await writer.drain()
+        writer.close()
+
+    async def _read_frames(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Handle the client's frames: answer pings, stop on close, ignore the rest."""
+        while True:
+            first, second = await reader.readexactly(2)
+            opcode, length = first & 0x0F, second & 0x7F
+            if length == 126:
+                (length,) = struct.unpack('!H', await reader.readexactly(2))
+            elif length == 127:
+                (length,) = struct.unpack('!Q', await reader.readexactly(8))
+            mask = await reader.readexactly(4) if second & 0x80 else b'\x00' * 4
+            payload = bytes(b ^ mask[i % 4] for i, b in enumerate(await reader.readexactly(length)))
+            if opcode == 0x8:
+                writer.write(_frame(payload[:2], opcode=0x8))
+                return
+            if opcode == 0x9:
+                writer.write(_frame(payload, opcode=0xA))
+
+    async def _send_changes(self, client: _ClientState, writer: asyncio.StreamWriter) -> None:
+        while True:
+            await client.wake.wait()
+            client.wake.clear()
+            with self._lock:
+                messages = self._encode_pending(client)
+            for message in messages:
+                data = _frame(message)
+                writer.write(data)
+                client.bytes_sent += len(data)
+            # Blocks only this client; its changes keep merging meanwhile
+            await writer.drain()
+
+    def _encode_pending(self, client: _ClientState) -> List[bytes]:
+        clear, removed, created, updated, camera = client.take()
+        messages = []
+        if clear:
+            messages.append(_HEADER.pack(CLEAR, 0))
+        if removed:
+            messages.append(encode_rows(REMOVE, removed))
+        if created:
+            entries = [self._objects[handle] for handle in created]
+            names = b''.join(struct.pack('<B', len(shape.encode())) + shape.encode() +
+                             struct.pack('<H', len(object_id.encode())) + object_id.encode()
+                             for object_id, shape, _ in entries)
+            messages.append(encode_rows(CREATE, created, [row for _, _, row in entries]) + names)
+        if updated:
+            messages.append(encode_rows(UPDATE, updated, [self._objects[handle][2] for handle in updated]))
+        if camera and self._camera is not None:
+            messages.append(_HEADER.pack(CAMERA, 0) + np.asarray(self._camera, dtype='<f4').tobytes())
+        return messages
+
+
+class DeltaClient:
+    """
+    Blocking WebSocket client that applies WebSocketRenderer messages to a
+    local copy of the scene; a headless stand-in for the browser client.
+    """
+
+    def __init__(self, host: str, port: int, timeout: float = 5.0):
+        self.objects: Dict[str, Dict[str, Any]] = {}  # object_id -> {'shape', 'row'}
+        self.camera: Optional[Dict[str, List[float]]] = None
+        self.bytes_received = 0
+        self._ids: Dict[int, str] = {}
+        self._socket = socket.create_connection((host, port), timeout=timeout)
+        key = base64.b64encode(os.urandom(16)).decode()
+        self._socket.sendall((f'GET /ws HTTP/1.1\r\nHost: {host}:{port}\r\nUpgrade: websocket\r\n'
+                              f'Connection: Upgrade\r\nSec-WebSocket-Key: {key}\r\n'
+                              'Sec-WebSocket-Version: 13\r\n\r\n').encode())
+        response = b''
+        while b'\r\n\r\n' not in response:
+            chunk = self._socket.recv(4096)
+            if not chunk:
+                raise ConnectionError("server closed the connection during the handshake")
+            response += chunk
+        head, self._buffer = response.split(b'\r\n\r\n', 1)
+        if b' 101 ' not in head.split(b'\r\n')[0] or _accept_key(key).encode() not in head:
+            raise ConnectionError(f"WebSocket handshake failed: {head!r}")
+
+    def receive(self, timeout: Optional[float] = None) -> int:
+        """Wait for one message, apply it, and return its kind."""
+        if timeout is not None:
+            self._socket.settimeout(timeout)
+        header = self._read(2)
+        length = header[1] & 0x7F
+        if length == 126:
+            (length,) = struct.unpack('!H', self._read(2))
+        elif length == 127:
+            (length,) = struct.unpack('!Q', self._read(8))
+        payload = self._read(length)
+        self.bytes_received += len(header) + length
+        kind, fields = decode_message(payload)
+        self._apply(kind, fields)
+        return kind
+
+    def receive_until(self, predicate, timeout: float = 5.0) -> None:
+        """Apply messages until predicate(self) holds."""
+        while not predicate(self):
+            self.receive(timeout)
+
+    def close(self) -> None:
+        try:
+            self._socket.sendall(b'\x88\x82' + b'\x00' * 4 + struct.pack('!H', 1000))
+        except OSError:
+            pass
+        self._socket.close()
+
+    def _read(self, size: int) -> bytes:
+        while len(self._buffer) < size:
+            chunk = self._socket.recv(65536)
+            if not chunk:
+                raise ConnectionError("server closed the connection")
+            self._buffer += chunk
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def _apply(self, kind: int, fields: Dict[str, Any]) -> None:
+        if kind == CLEAR:
+            self.objects.clear()
+            self._ids.clear()
+        elif kind == REMOVE:
+            for handle in fields['handles']:
+                self.objects.pop(self._ids.pop(handle, None), None)
+        elif kind == CREATE:
+            for handle, row, (shape, object_id) in zip(fields['handles'], fields['rows'], fields['names']):
+                self._ids[handle] = object_id
+                self.objects[object_id] = {'shape': shape, 'row': row.tolist()}
+        elif kind == UPDATE:
+            for handle, row in zip(fields['handles'], fields['rows']):
+                self.objects[self._ids[handle]]['row'] = row.tolist()
+        elif kind == CAMERA:
+            self.camera = fields
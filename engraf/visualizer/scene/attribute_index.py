@@ -0,0 +1,203 @@
+"""
+Attribute Index
+
+This module defines AttributeIndex, a set of per-attribute bitsets over the
+SceneObjects of a scene. Every object gets a slot; each attribute (a type, a
+thresholded color channel, a size category, membership in an assembly) keeps a
+Python int whose bit at that slot is set when the object has the attribute.
+
+Conjunctive selections such as "the red cubes" become bitwise ANDs and counts
+become popcounts, so attribute filtering stays flat as scenes grow. The index
+is owned and kept current by SceneModel; code that writes to an object's
+vector directly must call SceneModel.refresh_attributes(obj) afterwards.
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+from engraf.visualizer.scene.scene_object import SceneObject
+
+
+COLOR_CHANNELS = ('red', 'green', 'blue')
+SIZE_CATEGORIES = ('small', 'normal', 'large')
+
+
+def _component(obj: SceneObject, name: str, default: float) -> float:
+    """Read one vector component the way SceneObject does, tolerating missing vectors."""
+    vector = obj.vector
+    return vector[name] if vector and name in vector else default
+
+
+def size_category(obj: SceneObject) -> str:
+    """Get the size category of an object: large if any axis >= 1.5, small if any axis <= 0.75."""
+    scales = tuple(_component(obj, axis, 1.0) for axis in ('scaleX', 'scaleY', 'scaleZ'))
+    if any(scale >= 1.5 for scale in scales):
+        return 'large'
+    if any(scale <= 0.75 for scale in scales):
+        return 'small'
+    return 'normal'
+
+
+class AttributeIndex:
+    """
+    Bitset index of object type, color, size and assembly membership.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._slots: Dict[str, int] = {}            # object_id -> slot
+        self._ids: List[Optional[str]] = []         # slot -> object_id (None once removed)
+        self._slot_bits: Dict[str, tuple] = {}      # object_id -> attribute keys set for it
+        self._bits: Dict[str, int] = {}             # attribute key -> bitset
+        self.live = 0                               # bitset of slots in use
+
+    # --- Maintenance ---
+
+    def add(self, obj: SceneObject, in_assembly: bool = False) -> None:
+        """Index an object (re-indexes it if already present)."""
+        if obj.object_id in self._slots:
+            self.remove(obj.object_id)
+        slot = len(self._ids)
+        self._ids.append(obj.object_id)
+        self._slots[obj.object_id] = slot
+        self.live |= 1 << slot
+
+        keys = self._attribute_keys(obj)
+        if in_assembly:
+            keys += ('in_assembly',)
+        self._set(obj.object_id, keys)
+
+    def update(self, obj: SceneObject) -> None:
+        """Recompute an object's color and size bits after its vector changed."""
+        if obj.object_id not in self._slots:
+            return
+        in_assembly = 'in_assembly' in self._slot_bits[obj.object_id]
+        keys = self._attribute_keys(obj)
+        if in_assembly:
+            keys += ('in_assembly',)
+        self._clear(obj.object_id)
+        self._set(obj.object_id, keys)
+
+    def set_in_assembly(self, object_id: str, in_assembly: bool) -> None:
+        """Flag or unflag an object as belonging to an assembly."""
+        if object_id not in self._slots:
+            return
+        keys = tuple(key for key in self._slot_bits[object_id] if key != 'in_assembly')
+        if in_assembly:
+            keys += ('in_assembly',)
+        self._clear(object_id)
+        self._set(object_id, keys)
+
+    def remove(self, object_id: str) -> None:
+        """Drop an object from the index."""
+        if object_id not in self._slots:
+            return
+        self._clear(object_id)
+        slot = self._slots.pop(object_id)
+        del self._slot_bits[object_id]
+        self._ids[slot] = None
+        self.live &= ~(1 << slot)
+
+        # Compact once most slots are dead so bitsets do not grow without bound
+        if len(self._ids) > 64 and len(self._slots) * 2 < len(self._ids):
+            self._compact()
+
+    def clear(self) -> None:
+        """Drop every object."""
+        self._slots = {}
+        self._ids = []
+        self._slot_bits = {}
+        self._bits = {}
+        self.live = 0
+
+    # --- Queries ---
+
+    def bits(self, key: str) -> int:
+        """Get the bitset of one attribute key (e.g. 'type:cube', 'red', 'red>0', 'large')."""
+        return self._bits.get(key, 0)
+
+    def select(self, noun: Optional[str] = None, colors: Iterable[str] = (),
+               colors_present: Iterable[str] = (), size: Optional[str] = None,
+               in_assembly: Optional[bool] = None) -> int:
+        """
+        Get the bitset of objects matching every given predicate.
+
+        Args:
+            noun: Object type (None matches any type)
+            colors: Color channels the object must have strongly (> 0.5)
+            colors_present: Color channels the object must have at all (> 0)
+            size: 'small', 'normal' or 'large'
+            in_assembly: True/False to require (or exclude) assembly membership
+
+        Returns:
+            Bitset of matching slots
+        """
+        selected = self.live
+        if noun:
+            selected &= self.bits('type:' + noun)
+        for color in colors:
+            selected &= self.bits(color)
+        for color in colors_present:
+            selected &= self.bits(color + '>0')
+        if size is not None:
+            selected &= self.bits(size)
+        if in_assembly is True:
+            selected &= self.bits('in_assembly')
+        elif in_assembly is False:
+            selected &= ~self.bits('in_assembly')
+        return selected
+
+    def count(self, selected: int) -> int:
+        """Count the objects in a bitset."""
+        return bin(selected).count('1')
+
+    def ids(self, selected: int) -> List[str]:
+        """Get the object IDs in a bitset, in slot (insertion) order."""
+        ids = []
+        while selected:
+            low = selected & -selected
+            ids.append(self._ids[low.bit_length() - 1])
+            selected ^= low
+        return ids
+
+    def __contains__(self, object_id: str) -> bool:
+        return object_id in self._slots
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    # --- Internals ---
+
+    def _attribute_keys(self, obj: SceneObject) -> tuple:
+        keys = ['type:' + obj.name, size_category(obj)]
+        for color in COLOR_CHANNELS:
+            value = _component(obj, color, 0.0)
+            if value > 0:
+                keys.append(color + '>0')
+            if value > 0.5:
+                keys.append(color)
+        return tuple(keys)
+
+    def _set(self, object_id: str, keys: tuple) -> None:
+        bit = 1 << self._slots[object_id]
+        for key in keys:
+            self._bits[key] = self._bits.get(key, 0) | bit
+        self._slot_bits[object_id] = keys
+
+    def _clear(self, object_id: str) -> None:
+        mask = ~(1 << self._slots[object_id])
+        for key in self._slot_bits.get(object_id, ()):
+            self._bits[key] &= mask
+
+    def _compact(self) -> None:
+        entries = [(object_id, self._slot_bits[object_id]) for object_id in self._ids if object_id is not None]
+        self._slots = {}
+        self._ids = []
+        self._slot_bits = {}
+        self._bits = {}
+        self.live = 0
+        for object_id, keys in entries:
+            slot = len(self._ids)
+            self._ids.append(object_id)
+            self._slots[object_id] = slot
+            self.live |= 1 << slot
+            self._set(object_id, keys)
@@ -0,0 +1,75 @@
+"""
+Scene Diff
+
+This module computes the difference between two scene states in terms of the
+SceneObjects a renderer has to touch: objects that appeared, disappeared or
+changed their visual state. Renderers can apply a SceneDiff incrementally
+instead of re-rendering the whole scene.
+"""
+
+from typing import Dict, List
+from engraf.visualizer.scene.scene_model import SceneModel
+from engraf.visualizer.scene.scene_object import SceneObject
+
+
+class SceneDiff:
+    """
+    The visual difference between an old and a new scene state.
+    """
+
+    def __init__(self, added: List[str], removed: List[str], changed: List[str]):
+        """
+        Initialize a scene diff.
+
+        Args:
+            added: IDs of objects present only in the new scene
+            removed: IDs of objects present only in the old scene
+            changed: IDs of objects present in both whose visual state differs
+        """
+        self.added = added
+        self.removed = removed
+        self.changed = changed
+
+    def is_empty(self) -> bool:
+        """Check if the two scenes look identical."""
+        return not (self.added or self.removed or self.changed)
+
+    def __len__(self) -> int:
+        return len(self.added) + len(self.removed) + len(self.changed)
+
+    def __repr__(self) -> str:
+        return f"SceneDiff(added={self.added}, removed={self.removed}, changed={self.changed})"
+
+
+def _visual_state(obj: SceneObject) -> tuple:
+    """Everything about an object that affects how it is drawn."""
+    return (
+        obj.name,
+        tuple(obj.position.values()),
+        tuple(obj.rotation.values()),
+        tuple(obj.scale.values()),
+        tuple(obj.color.values())
+    )
+
+
+def _objects_by_id(scene: SceneModel) -> Dict[str, SceneObject]:
+    return {obj.object_id: obj for obj in scene.get_all_scene_objects()}
+
+
+def diff_scenes(old_scene: SceneModel, new_scene: SceneModel) -> SceneDiff:
+    """
+    Compute the objects a renderer must add, remove or update to go from
+    old_scene to new_scene. Objects inside assemblies are included.
+    """
+    old_objects = _objects_by_id(old_scene)
+    new_objects = _objects_by_id(new_scene)
+
+    added = [obj_id for obj_id in new_objects if obj_id not in old_objects]
+    removed = [obj_id for obj_id in old_objects if obj_id not in new_objects]
+    changed = []
+    for obj_id, new_obj in new_objects.items():
+        old_obj = old_objects.get(obj_id)
+        if old_obj is not None and _visual_state(old_obj) != _visual_state(new_obj):
+            changed.append(obj_id)
+
+    return SceneDiff(added, removed, changed)
@@ -0,0 +1,57 @@
+"""
+Scene Handle
+
+This module defines SceneHandle, a single shared indirection to the current
+SceneModel. Interpreter handlers hold the handle instead of a scene, so
+swapping the current scene (e.g. for temporal navigation) is a pointer swap
+that every handler observes immediately, with no handler reconstruction.
+"""
+
+from engraf.visualizer.scene.scene_model import SceneModel
+
+
+class SceneHandle:
+    """
+    Mutable reference to the current SceneModel.
+
+    Attribute access is forwarded to the current scene, so a handle can be
+    passed anywhere a SceneModel is read (``handle.objects``,
+    ``handle.find_entity_by_id(...)``, ``resolve_pronoun(word, handle)``).
+    """
+
+    __slots__ = ('_scene',)
+
+    def __init__(self, scene: SceneModel):
+        """
+        Initialize the handle.
+
+        Args:
+            scene: The scene the handle initially points to
+        """
+        self._scene = scene
+
+    @property
+    def scene(self) -> SceneModel:
+        """The scene the handle currently points to."""
+        return self._scene
+
+    def swap(self, scene: SceneModel) -> SceneModel:
+        """
+        Point the handle at a different scene.
+
+        Args:
+            scene: The new current scene
+
+        Returns:
+            The previously current scene
+        """
+        previous = self._scene
+        self._scene = scene
+        return previous
+
+    def __getattr__(self, name):
+        # Only called for attributes not found on the handle itself
+        return getattr(self._scene, name)
+
+    def __repr__(self) -> str:
+        return f"SceneHandle({self._scene!r})"
@@ -1,8 +1,12 @@
 from engraf.visualizer.scene.scene_object import SceneObject
 from engraf.visualizer.scene.scene_assembly import SceneAssembly
 from engraf.visualizer.scene.scene_entity import SceneEntity
+from engraf.visualizer.scene.attribute_index import AttributeIndex
+from engraf.visualizer.scene.semantic_index import SemanticIndex
+from engraf.visualizer.scene.scene_transaction import SceneTransaction, capture_state, restore_state
 from latn.lexer.vector_space import VectorSpace
-from typing import List, Optional, Union
+from typing import Callable, Iterable, List, Optional, Union
+from contextlib import contextmanager
 import copy
 
 
@@ -14,6 +18,17 @@ class SceneModel:
         # Deprecated - kept for backward compatibility during transition
         self._objects = []       # Will be removed after refactoring
         self._assemblies = []    # Will be removed after refactoring
+        
+        # Bitsets over object type/color/size/assembly membership, kept current by the mutators below
+        self.attribute_index = AttributeIndex()
+        
+        # Approximate semantic search, built on first use once the scene has ann_threshold objects
+        self.semantic_index: Optional[SemanticIndex] = None
+        self.ann_threshold = 10000
+        
+        # Open transactions, innermost last (see begin_transaction)
+        self._transactions: List[SceneTransaction] = []
+        self._replaying = False
     
     @property
     def objects(self) -> List[SceneObject]:
@@ -27,18 +42,212 @@ class SceneModel:
 
     def add_object(self, obj: SceneObject):
         """Add a SceneObject to the scene."""
+        self._log_added(obj)
         self.entities.append(obj)
         self.recent = [obj]
+        self._index_entity(obj)
+
+    def add_objects(self, objects: List[SceneObject]):
+        """Add many SceneObjects at once, logged as a single undo step."""
+        if self._recording():
+            added = {id(obj) for obj in objects}
+            recent = list(self.recent)
+
+            def undo():
+                self.entities[:] = [entity for entity in self.entities if id(entity) not in added]
+                for obj in objects:
+                    self._unindex_entity(obj)
+                self.recent = recent
+            self._log(undo, created=[obj.object_id for obj in objects])
+        self.entities.extend(objects)
+        self.recent = list(objects)
+        for obj in objects:
+            self._index_entity(obj)
 
     def add_assembly(self, assembly: SceneAssembly):
         """Add a SceneAssembly to the scene."""
+        self._log_added(assembly)
         self.entities.append(assembly)
         self.recent = [assembly]
+        self._index_entity(assembly)
     
     def add_entity(self, entity: SceneEntity):
         """Add any SceneEntity to the scene."""
+        self._log_added(entity)
         self.entities.append(entity)
         self.recent = [entity]
+        self._index_entity(entity)
+    
+    def refresh_attributes(self, entity: SceneEntity):
+        """Re-index an entity's color and size after its vector was written directly."""
+        if isinstance(entity, SceneAssembly):
+            for obj in entity.objects:
+                self.attribute_index.update(obj)
+        elif isinstance(entity, SceneObject):
+            self.attribute_index.update(entity)
+        if self.semantic_index is not None:
+            self.semantic_index.update(entity)
+            for obj in getattr(entity, 'objects', ()):
+                self.semantic_index.update(obj)
+    
+    def reindex(self):
+        """Rebuild the attribute index from the entity list."""
+        self.attribute_index.clear()
+        for entity in self.entities:
+            self._index_entity(entity)
+        if self.semantic_index is not None:
+            self.semantic_index.build(self._searchable_entities())
+    
+    def enable_semantic_index(self, num_tables: int = 8, num_bits: int = 12, probe_radius: int = 1) -> SemanticIndex:
+        """
+        Build the approximate semantic index now, with the given recall/latency settings.
+        
+        find_noun_phrase builds one with the default settings on its own once the
+        scene reaches ann_threshold objects; call this to tune it or to build it early.
+        See SemanticIndex for what the settings trade off.
+        """
+        self.semantic_index = SemanticIndex(num_tables=num_tables, num_bits=num_bits, probe_radius=probe_radius)
+        self.semantic_index.build(self._searchable_entities())
+        return self.semantic_index
+    
+    def _searchable_entities(self) -> List[SceneEntity]:
+        """Assemblies, standalone objects, then assembly members (find_noun_phrase's search order)."""
+        assemblies = self.assemblies
+        members = [obj for assembly in assemblies for obj in assembly.objects]
+        return assemblies + self.objects + members
+    
+    def _refresh_semantics(self, assembly: SceneAssembly):
+        # Membership changes recompute the assembly's vector
+        if self.semantic_index is not None:
+            self.semantic_index.update(assembly)
+    
+    def _index_entity(self, entity: SceneEntity, in_assembly: bool = False):
+        if isinstance(entity, SceneAssembly):
+            for obj in entity.objects:
+                self.attribute_index.add(obj, in_assembly=True)
+        elif isinstance(entity, SceneObject):
+            self.attribute_index.add(entity, in_assembly=in_assembly)
+        if self.semantic_index is not None:
+            self.semantic_index.add(entity)
+            for obj in getattr(entity, 'objects', ()):
+                self.semantic_index.add(obj)
+    
+    def _unindex_entity(self, entity: SceneEntity):
+        if isinstance(entity, SceneAssembly):
+            for obj in entity.objects:
+                self.attribute_index.remove(obj.object_id)
+        elif isinstance(entity, SceneObject):
+            self.attribute_index.remove(entity.object_id)
+        if self.semantic_index is not None:
+            self.semantic_index.remove(entity.entity_id)
+            for obj in getattr(entity, 'objects', ()):
+                self.semantic_index.remove(obj.entity_id)
+
+    # --- Transactions ---
+    
+    def begin_transaction(self) -> SceneTransaction:
+        """
+        Open a transaction, nested inside the current one if there is one.
+        
+        Until it is committed or rolled back, the scene logs how to undo each
+        structural change, and code about to write an entity's fields must call
+        touch(entity) first so its fields can be restored.
+        """
+        parent = self._transactions[-1] if self._transactions else None
+        transaction = SceneTransaction(parent)
+        self._transactions.append(transaction)
+        return transaction
+    
+    def commit_transaction(self) -> None:
+        """Keep the innermost transaction's changes (an enclosing transaction can still undo them)."""
+        transaction = self._pop_transaction()
+        if transaction.parent is not None:
+            transaction.merge_into_parent()
+    
+    def rollback_transaction(self) -> SceneTransaction:
+        """
+        Undo every change made since the innermost transaction began.
+        
+        Returns:
+            The rolled back transaction; its diff() tells a renderer what changed back
+        """
+        transaction = self._pop_transaction()
+        self._replaying = True
+        try:
+            transaction.undo()
+        finally:
+            self._replaying = False
+        return transaction
+    
+    @contextmanager
+    def transaction(self):
+        """Run a block in a transaction: commit if it finishes, roll back if it raises."""
+        transaction = self.begin_transaction()
+        try:
+            yield transaction
+        except BaseException:
+            self.rollback_transaction()
+            raise
+        self.commit_transaction()
+    
+    @property
+    def in_transaction(self) -> bool:
+        """Check if a transaction is open."""
+        return bool(self._transactions)
+    
+    def touch(self, entity: SceneEntity):
+        """
+        Save an entity's fields (and an assembly's members') before they are written,
+        once per transaction. Does nothing outside a transaction.
+        """
+        if not self._recording():
+            return
+        transaction = self._transactions[-1]
+        for target in [entity] + list(getattr(entity, 'objects', ())):
+            if not transaction.should_capture(target):
+                continue
+            state = capture_state(target)
+            transaction.record(lambda target=target, state=state: self._restore_entity(target, state))
+            if isinstance(target, SceneObject):
+                transaction.modified.append(target.object_id)
+    
+    def _pop_transaction(self) -> SceneTransaction:
+        if not self._transactions:
+            raise RuntimeError("No scene transaction is open")
+        return self._transactions.pop()
+    
+    def _recording(self) -> bool:
+        return bool(self._transactions) and not self._replaying
+    
+    def _log(self, undo: Callable[[], None], created: Iterable[str] = (), deleted: Iterable[str] = ()):
+        transaction = self._transactions[-1]
+        transaction.record(undo)
+        transaction.created.extend(created)
+        transaction.deleted.extend(deleted)
+    
+    def _log_added(self, entity: SceneEntity):
+        if not self._recording():
+            return
+        recent = list(self.recent)
+        
+        def undo():
+            self.entities.remove(entity)
+            self._unindex_entity(entity)
+            self.recent = recent
+        self._log(undo, created=_object_ids(entity))
+    
+    def _log_removed(self, entity: SceneEntity, position: int):
+        if not self._recording():
+            return
+        
+        def undo():
+            self.entities.insert(position, entity)
+            self._index_entity(entity)
+        self._log(undo, deleted=_object_ids(entity))
+    
+    def _restore_entity(self, entity: SceneEntity, state: dict):
+        restore_state(entity, state)
+        self.refresh_attributes(entity)
 
     def __repr__(self):
         """String representation showing all entities."""
@@ -105,9 +314,11 @@ class SceneModel:
     def remove_object(self, object_id: str) -> bool:
         """Remove an object from the scene (handles both standalone and assembly objects)."""
         # Try to remove from standalone objects
-        for entity in self.entities:
+        for position, entity in enumerate(self.entities):
             if isinstance(entity, SceneObject) and entity.object_id == object_id:
-                self.entities.remove(entity)
+                self._log_removed(entity, position)
+                del self.entities[position]
+                self._unindex_entity(entity)
                 return True
         
         # Try to remove from assemblies
@@ -115,24 +326,33 @@ class SceneModel:
             if isinstance(entity, SceneAssembly):
                 for obj in entity.objects:
                     if obj.object_id == object_id:
+                        self.touch(entity)
+                        if self._recording():
+                            self._log(lambda obj=obj: self._index_entity(obj, in_assembly=True), deleted=[object_id])
                         entity.remove_object(obj)
+                        self._unindex_entity(obj)
+                        self._refresh_semantics(entity)
                         return True
         
         return False
 
     def remove_assembly(self, assembly_id: str) -> bool:
         """Remove an entire assembly from the scene."""
-        for entity in self.entities:
+        for position, entity in enumerate(self.entities):
             if isinstance(entity, SceneAssembly) and entity.assembly_id == assembly_id:
-                self.entities.remove(entity)
+                self._log_removed(entity, position)
+                del self.entities[position]
+                self._unindex_entity(entity)
                 return True
         return False
     
     def remove_entity(self, entity_id: str) -> bool:
         """Remove any entity from the scene by ID."""
-        for entity in self.entities:
+        for position, entity in enumerate(self.entities):
             if entity.entity_id == entity_id:
-                self.entities.remove(entity)
+                self._log_removed(entity, position)
+                del self.entities[position]
+                self._unindex_entity(entity)
                 return True
         return False
 
@@ -142,8 +362,17 @@ class SceneModel:
         assembly = self.find_assembly_by_id(assembly_id)
         
         if obj and assembly and obj in self.entities:
-            self.entities.remove(obj)
+            position = self.entities.index(obj)
+            self.touch(assembly)
+            if self._recording():
+                def undo():
+                    self.entities.insert(position, obj)
+                    self.attribute_index.set_in_assembly(object_id, False)
+                self._log(undo)
+            del self.entities[position]
             assembly.add_object(obj)
+            self.attribute_index.set_in_assembly(object_id, True)
+            self._refresh_semantics(assembly)
             return True
         
         return False
@@ -153,16 +382,35 @@ class SceneModel:
         for assembly in self.assemblies:
             for obj in assembly.objects:
                 if obj.object_id == object_id:
+                    self.touch(assembly)
+                    if self._recording():
+                        def undo(obj=obj):
+                            self.entities.remove(obj)
+                            self.attribute_index.set_in_assembly(object_id, True)
+                        self._log(undo)
                     assembly.remove_object(obj)
                     self.entities.append(obj)
+                    self.attribute_index.set_in_assembly(object_id, False)
+                    self._refresh_semantics(assembly)
                     return True
         
         return False
         
     def clear(self):
         """Clear all entities and recent items from the scene."""
+        if self._recording():
+            entities, recent = list(self.entities), list(self.recent)
+            
+            def undo():
+                self.entities[:] = entities
+                self.recent = recent
+                self.reindex()
+            self._log(undo, deleted=[obj.object_id for obj in self.get_all_scene_objects()])
         self.entities.clear()
         self.recent.clear()
+        self.attribute_index.clear()
+        if self.semantic_index is not None:
+            self.semantic_index.clear()
         
     def find_noun_phrase(self, np, return_all_matches=True):
         """
@@ -181,10 +429,17 @@ class SceneModel:
         Returns:
             If return_all_matches=False: Single best SceneObject/Assembly or None
             If return_all_matches=True: List of (similarity, object) tuples sorted by similarity
+        
+        Once the scene has ann_threshold objects, return_all_matches=True with a
+        vector searches the approximate semantic index instead of scoring every
+        entity, so a weak match may be left out.
         """
         noun = np.noun
         vector = np.vector
 
+        if return_all_matches and vector and len(self.attribute_index) >= self.ann_threshold:
+            return self._find_noun_phrase_approximate(np)
+
         candidates = []
 
         # Search assemblies first (they have precedence as compound nouns)
@@ -245,6 +500,30 @@ class SceneModel:
             # Legacy behavior: return single best match
             return candidates[0][1]
 
+    def _find_noun_phrase_approximate(self, np):
+        """find_noun_phrase(np, return_all_matches=True) over the semantic index."""
+        if self.semantic_index is None:
+            self.enable_semantic_index()
+        noun = np.noun
+        vector = np.vector
+
+        # A type with few members is scored exactly; otherwise only the LSH shortlist is
+        if noun and noun != "object":
+            entities = self.semantic_index.named(noun)
+            if len(entities) > self.ann_threshold:
+                entities = [entity for entity in self.semantic_index.query(vector) if entity.name == noun]
+        else:
+            entities = [entity for entity in self.semantic_index.query(vector)
+                        if not (noun and isinstance(entity, SceneAssembly))]
+
+        candidates = []
+        for entity in entities:
+            similarity = vector.semantic_similarity(entity.vector)
+            if similarity > 0:
+                candidates.append((similarity, entity))
+        candidates.sort(key=lambda pair: pair[0], reverse=True)
+        return candidates
+
     # --- SceneAdapter protocol (latn.lexer.scene_adapter) ---
     # Thin, behavior-preserving wrappers so the LATN core depends on the
     # protocol, not on SceneModel directly.
@@ -265,6 +544,8 @@ class SceneModel:
         
         # Deep copy all entities directly to the unified list
         new_scene.entities = [copy.deepcopy(entity) for entity in self.entities]
+        new_scene.ann_threshold = self.ann_threshold
+        new_scene.reindex()
         
         # Deep copy recent objects/assemblies list
         if self.recent:
@@ -279,6 +560,13 @@ class SceneModel:
         return new_scene
     
 
+def _object_ids(entity: SceneEntity) -> List[str]:
+    """IDs of the SceneObjects an entity contributes to the scene."""
+    if isinstance(entity, SceneAssembly):
+        return [obj.object_id for obj in entity.objects]
+    return [entity.object_id] if isinstance(entity, SceneObject) else []
+
+
 def resolve_pronoun(word, scene: SceneModel):
     """Resolve pronouns to entities in the scene.
 
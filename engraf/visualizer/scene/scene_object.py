@@ -1,6 +1,8 @@
-from pprint import pprint
+import logging
 from .scene_entity import SceneEntity
 
+logger = logging.getLogger(__name__)
+
 
 class SceneObject(SceneEntity):
     def __init__(self, name, vector, object_id=None):
@@ -157,8 +159,7 @@ class SceneObject(SceneEntity):
 
 def scene_object_from_np(noun_phrase):
     """Create a SceneObject from a noun phrase."""
-    from pprint import pprint
-    pprint(f"🟢 scene from NP = {noun_phrase}")
+    logger.debug("🟢 scene from NP = %s", noun_phrase)
 
     obj = SceneObject(
         name=noun_phrase.noun,
@@ -0,0 +1,91 @@
+"""
+Scene Transaction
+
+This module defines SceneTransaction, the undo log behind SceneModel's
+transactions. While a transaction is open, SceneModel records how to reverse
+each structural change (entities added, removed, moved in or out of an
+assembly) and, the first time an entity is touched, a copy of its fields.
+Rolling back replays the log backwards, so an atomic command costs the
+entities it actually touched instead of a copy of the whole scene.
+
+Transactions nest: committing an inner transaction hands its log to the
+enclosing one, so rolling back the outer transaction also undoes the inner.
+"""
+
+import copy
+from typing import Any, Callable, Dict, List, Optional, Set
+
+
+def capture_state(entity) -> Dict[str, Any]:
+    """Copy an entity's fields. An assembly's member list is copied, not the members."""
+    return {key: list(value) if key == 'objects' else copy.deepcopy(value)
+            for key, value in vars(entity).items()}
+
+
+def restore_state(entity, state: Dict[str, Any]) -> None:
+    """Put back fields saved by capture_state."""
+    entity.__dict__.clear()
+    entity.__dict__.update(state)
+
+
+class SceneTransaction:
+    """
+    Undo log for one (possibly nested) scene transaction.
+    """
+
+    def __init__(self, parent: Optional['SceneTransaction'] = None):
+        """
+        Initialize an empty transaction.
+
+        Args:
+            parent: The enclosing transaction, if this one is nested
+        """
+        self.parent = parent
+        self._undo: List[Callable[[], None]] = []
+        self._captured: Set[int] = set()        # id() of entities whose fields are saved
+        self.created: List[str] = []            # object IDs added to the scene
+        self.deleted: List[str] = []            # object IDs removed from the scene
+        self.modified: List[str] = []           # object IDs whose fields were saved
+
+    def record(self, undo: Callable[[], None]) -> None:
+        """Add a step that reverses the change about to be (or just) made."""
+        self._undo.append(undo)
+
+    def should_capture(self, entity) -> bool:
+        """Check (and mark) whether an entity's fields still need saving in this transaction."""
+        key = id(entity)
+        if key in self._captured:
+            return False
+        self._captured.add(key)
+        return True
+
+    def merge_into_parent(self) -> None:
+        """Hand this transaction's log to the enclosing one (on commit)."""
+        parent = self.parent
+        parent._undo.extend(self._undo)
+        parent.created.extend(self.created)
+        parent.deleted.extend(self.deleted)
+        parent.modified.extend(self.modified)
+
+    def undo(self) -> None:
+        """Replay the log backwards."""
+        for step in reversed(self._undo):
+            step()
+        self._undo = []
+
+    def diff(self):
+        """
+        Get the SceneDiff a renderer needs to show the state this transaction
+        was rolled back to, starting from the state it was rolled back from.
+        """
+        from engraf.visualizer.scene.scene_diff import SceneDiff
+
+        created, deleted = set(self.created), set(self.deleted)
+        removed = [object_id for object_id in dict.fromkeys(self.created) if object_id not in deleted]
+        added = [object_id for object_id in dict.fromkeys(self.deleted) if object_id not in created]
+        changed = [object_id for object_id in dict.fromkeys(self.modified)
+                   if object_id not in created and object_id not in deleted]
+        return SceneDiff(added, removed, changed)
+
+    def __len__(self) -> int:
+        return len(self._undo)
@@ -0,0 +1,197 @@
+"""
+Semantic Index
+
+This module defines SemanticIndex, an approximate nearest-neighbour index over
+the semantic vectors of scene entities. It uses random-hyperplane locality
+sensitive hashing: each of several hash tables projects a vector onto a few
+random hyperplanes and buckets it by the signs, so vectors at a small angle
+tend to share a bucket. A query only looks at the entities in its own buckets
+(and optionally the buckets one bit away), instead of scoring the whole scene.
+
+The index only produces a shortlist. Callers score the shortlist exactly, so
+approximation can drop a weak match but never invents or reorders one.
+
+Recall versus latency is set by num_tables (more tables, more chances to
+collide), num_bits (fewer bits, bigger buckets) and probe_radius (0 looks at
+the query's own bucket, 1 also at its num_bits neighbouring buckets).
+"""
+
+from typing import Dict, List, Optional, Set
+
+import numpy
+
+from engraf.visualizer.scene.scene_entity import SceneEntity
+
+
+def _vector_array(entity: SceneEntity):
+    """Get an entity's semantic vector as a float array, or None if it has none."""
+    vector = getattr(entity, 'vector', None)
+    if not hasattr(vector, 'as_numpy_array'):
+        return None
+    return numpy.asarray(vector.as_numpy_array(), dtype=float)
+
+
+class SemanticIndex:
+    """
+    Random-projection LSH over entity semantic vectors, updated incrementally.
+    """
+
+    def __init__(self, num_tables: int = 8, num_bits: int = 12, probe_radius: int = 1, seed: int = 0):
+        """
+        Initialize an empty index.
+
+        Args:
+            num_tables: Number of independent hash tables (higher = better recall, slower)
+            num_bits: Hyperplanes per table (higher = smaller buckets, faster, lower recall)
+            probe_radius: 0 to probe only the query's bucket, 1 to also probe buckets one bit away
+            seed: Seed for the random hyperplanes, so results are reproducible
+        """
+        if probe_radius not in (0, 1):
+            raise ValueError(f"probe_radius must be 0 or 1, got {probe_radius}")
+        self.num_tables = num_tables
+        self.num_bits = num_bits
+        self.probe_radius = probe_radius
+        self.seed = seed
+
+        self._planes = None                               # tables x bits x dimensions, made on first add
+        self._center = None                               # subtracted before hashing
+        self._bit_values = 1 << numpy.arange(num_bits, dtype=numpy.int64)
+        self._tables: List[Dict[int, Set[int]]] = [{} for _ in range(num_tables)]
+        self._slots: Dict[str, int] = {}                  # entity_id -> slot
+        self._entities: List[Optional[SceneEntity]] = []  # slot -> entity (None once removed)
+        self._codes: Dict[int, tuple] = {}                # slot -> bucket code per table
+        self._names: Dict[str, Set[int]] = {}             # entity name -> slots
+
+    # --- Maintenance ---
+
+    def build(self, entities: List[SceneEntity]) -> None:
+        """
+        Replace the index contents with the given entities.
+
+        The hashing center is fixed to the mean of these vectors. Vectors share
+        a large common component (e.g. part-of-speech features), which would
+        otherwise put most entities on the same side of every hyperplane.
+        """
+        self.clear()
+        entities = [entity for entity in entities if _vector_array(entity) is not None]
+        if not entities:
+            return
+        matrix = numpy.stack([_vector_array(entity) for entity in entities])
+        self._center = matrix.mean(axis=0)
+        self._make_planes(matrix.shape[1])
+
+        codes = self._hash(matrix)
+        for entity, row in zip(entities, codes):
+            self._insert(entity, tuple(int(code) for code in row))
+
+    def add(self, entity: SceneEntity) -> None:
+        """Index an entity (re-indexes it if already present)."""
+        if entity.entity_id in self._slots:
+            self.remove(entity.entity_id)
+        vector = _vector_array(entity)
+        if vector is None:
+            return
+        if self._planes is None:
+            self._center = numpy.zeros(len(vector))
+            self._make_planes(len(vector))
+        self._insert(entity, tuple(int(code) for code in self._hash(vector[None, :])[0]))
+
+    def update(self, entity: SceneEntity) -> None:
+        """Re-hash an entity after its vector changed."""
+        if entity.entity_id in self._slots:
+            self.add(entity)
+
+    def remove(self, entity_id: str) -> None:
+        """Drop an entity from the index."""
+        slot = self._slots.pop(entity_id, None)
+        if slot is None:
+            return
+        for table, code in zip(self._tables, self._codes.pop(slot)):
+            bucket = table[code]
+            bucket.discard(slot)
+            if not bucket:
+                del table[code]
+        name = self._entities[slot].name
+        self._names[name].discard(slot)
+        if not self._names[name]:
+            del self._names[name]
+        self._entities[slot] = None
+
+        # Compact once most slots are dead so the entity list does not grow without bound
+        if len(self._entities) > 64 and len(self._slots) * 2 < len(self._entities):
+            self._compact()
+
+    def clear(self) -> None:
+        """Drop every entity (the hyperplanes are kept)."""
+        self._tables = [{} for _ in range(self.num_tables)]
+        self._slots = {}
+        self._entities = []
+        self._codes = {}
+        self._names = {}
+
+    # --- Queries ---
+
+    def query(self, vector) -> List[SceneEntity]:
+        """
+        Get the entities that may be near a query vector.
+
+        Args:
+            vector: VectorSpace (or 1-D array) to search around
+
+        Returns:
+            Candidate entities in insertion order, unscored
+        """
+        if self._planes is None or not self._slots:
+            return []
+        if hasattr(vector, 'as_numpy_array'):
+            vector = vector.as_numpy_array()
+        codes = self._hash(numpy.asarray(vector, dtype=float)[None, :])[0]
+
+        flips = [0]
+        if self.probe_radius:
+            flips += [1 << bit for bit in range(self.num_bits)]
+
+        found: Set[int] = set()
+        for table, code in zip(self._tables, codes):
+            code = int(code)
+            for flip in flips:
+                bucket = table.get(code ^ flip)
+                if bucket:
+                    found.update(bucket)
+        return [self._entities[slot] for slot in sorted(found)]
+
+    def named(self, name: str) -> List[SceneEntity]:
+        """Get every indexed entity with the given name, in insertion order."""
+        return [self._entities[slot] for slot in sorted(self._names.get(name, ()))]
+
+    def __contains__(self, entity_id: str) -> bool:
+        return entity_id in self._slots
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    # --- Internals ---
+
+    def _make_planes(self, dimensions: int) -> None:
+        rng = numpy.random.default_rng(self.seed)
+        self._planes = rng.standard_normal((self.num_tables, self.num_bits, dimensions))
+
+    def _hash(self, matrix):
+        """Bucket codes of each row for each table (rows x tables)."""
+        signs = numpy.einsum('tbd,nd->ntb', self._planes, matrix - self._center) > 0
+        return signs.astype(numpy.int64) @ self._bit_values
+
+    def _compact(self) -> None:
+        entries = [(entity, self._codes[slot]) for slot, entity in enumerate(self._entities) if entity is not None]
+        self.clear()
+        for entity, codes in entries:
+            self._insert(entity, codes)
+
+    def _insert(self, entity: SceneEntity, codes: tuple) -> None:
+        slot = len(self._entities)
+        self._entities.append(entity)
+        self._slots[entity.entity_id] = slot
+        self._codes[slot] = codes
+        self._names.setdefault(entity.name, set()).add(slot)
+        for table, code in zip(self._tables, codes):
+            table.setdefault(code, set()).add(slot)
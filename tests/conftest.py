@@ -0,0 +1,27 @@
+"""
+Shared test fixtures.
+"""
+
+import pytest
+from engraf.visualizer.scene.scene_object import SceneObject
+from latn.lexer.vector_space import VectorSpace
+
+
+@pytest.fixture
+def make_object():
+    """
+    Factory for scene objects built from vector features.
+
+    make_object(object_id, name="cube", scale=1.0, color=None, **features):
+    scale sets all three scale axes, color an (r, g, b) tuple, and any other
+    keyword a vector feature such as locX or rotY.
+    """
+    def make(object_id, name="cube", scale=1.0, color=None, **features):
+        vector = VectorSpace()
+        vector['scaleX'] = vector['scaleY'] = vector['scaleZ'] = scale
+        if color is not None:
+            vector['red'], vector['green'], vector['blue'] = color
+        for feature, value in features.items():
+            vector[feature] = value
+        return SceneObject(name=name, vector=vector, object_id=object_id)
+    return make
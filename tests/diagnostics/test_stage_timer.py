@@ -0,0 +1,112 @@
+"""
+Tests for per-stage latency instrumentation.
+"""
+
+import pytest
+from engraf.diagnostics.stage_timer import StageTimer, NullStageTimer, LatencyHistogram
+
+
+class TestLatencyHistogram:
+    """Test the rolling latency histogram."""
+
+    def test_empty_summary(self):
+        """Test that an empty histogram reports no percentiles."""
+        histogram = LatencyHistogram()
+        summary = histogram.summary()
+        assert summary['count'] == 0
+        assert summary['p50'] is None
+        assert histogram.percentile(99) is None
+
+    def test_percentiles(self):
+        """Test interpolated percentiles over recorded samples."""
+        histogram = LatencyHistogram()
+        for value in range(1, 101):
+            histogram.record(float(value))
+
+        summary = histogram.summary()
+        assert summary['count'] == 100
+        assert summary['max'] == 100.0
+        assert summary['p50'] == pytest.approx(50.5)
+        assert summary['p99'] == pytest.approx(99.01)
+
+    def test_window_is_rolling(self):
+        """Test that only the most recent samples are kept."""
+        histogram = LatencyHistogram(window=10)
+        for value in range(100):
+            histogram.record(float(value))
+
+        assert histogram.count == 100
+        assert len(histogram.samples) == 10
+        assert histogram.summary()['max'] == 99.0
+        assert histogram.percentile(0) == 90.0
+
+
+class TestStageTimer:
+    """Test timing named stages of each command."""
+
+    def test_stages_are_reported_per_command(self):
+        """Test that each stage and the total are reported for a command."""
+        timer = StageTimer()
+        timer.begin()
+        with timer.stage('parse'):
+            pass
+        with timer.stage('render'):
+            pass
+        timings = timer.finish()
+
+        assert set(timings) == {'parse', 'render', 'total'}
+        assert all(value >= 0.0 for value in timings.values())
+        assert timings['total'] >= timings['parse']
+
+    def test_repeated_stage_accumulates(self):
+        """Test that repeated records of one stage add up."""
+        timer = StageTimer()
+        timer.begin()
+        timer.record('execute.object_modifier', 1.0)
+        timer.record('execute.object_modifier', 2.5)
+        timings = timer.finish()
+
+        assert timings['execute.object_modifier'] == 3.5
+
+    def test_histograms_aggregate_across_commands(self):
+        """Test that the report aggregates every command until reset."""
+        timer = StageTimer()
+        for _ in range(3):
+            timer.begin()
+            with timer.stage('parse'):
+                pass
+            timer.finish()
+
+        report = timer.report()
+        assert report['parse']['count'] == 3
+        assert report['total']['count'] == 3
+
+        timer.reset()
+        assert timer.report() == {}
+
+    def test_stage_records_on_exception(self):
+        """Test that a stage is recorded even when it raises."""
+        timer = StageTimer()
+        timer.begin()
+        with pytest.raises(ValueError):
+            with timer.stage('execute'):
+                raise ValueError("boom")
+        assert 'execute' in timer.finish()
+
+
+class TestNullStageTimer:
+    """Test the no-op timer used when timings are off."""
+
+    def test_records_nothing(self):
+        """Test that nothing is recorded or reported."""
+        timer = NullStageTimer()
+        timer.begin()
+        with timer.stage('parse'):
+            pass
+        assert timer.finish() is None
+        assert timer.report() == {}
+
+    def test_stage_is_shared(self):
+        """Test that every stage returns the same no-op context."""
+        timer = NullStageTimer()
+        assert timer.stage('parse') is timer.stage('render')
@@ -0,0 +1,90 @@
+"""
+Tests for Chrome trace-event export.
+"""
+
+import json
+import pytest
+from engraf.diagnostics.tracing import (
+    Tracer, NullTracer, get_tracer, enable_tracing, disable_tracing
+)
+
+
+class TestTracer:
+    """Test recording spans as trace events."""
+
+    def test_nested_spans_are_complete_events(self):
+        """Test that nested spans become complete events with their arguments."""
+        tracer = Tracer()
+        with tracer.span('interpret', sentence="draw a cube") as outer:
+            with tracer.span('parse') as inner:
+                inner.set('hypotheses', 2)
+            outer.set('scene_size', 1)
+
+        events = tracer.to_trace()['traceEvents']
+        # Inner spans finish first
+        assert [event['name'] for event in events] == ['parse', 'interpret']
+        parse, interpret = events
+        assert parse['ph'] == 'X' and interpret['ph'] == 'X'
+        assert parse['args'] == {'hypotheses': 2}
+        assert interpret['args'] == {'sentence': "draw a cube", 'scene_size': 1}
+        # The parse span nests inside the interpret span
+        assert interpret['ts'] <= parse['ts']
+        assert parse['ts'] + parse['dur'] <= interpret['ts'] + interpret['dur']
+
+    def test_ring_buffer_keeps_most_recent(self):
+        """Test that the oldest events are dropped and counted."""
+        tracer = Tracer(capacity=3)
+        for i in range(5):
+            tracer.instant('tick', i=i)
+
+        trace = tracer.to_trace()
+        assert [event['args']['i'] for event in trace['traceEvents']] == [2, 3, 4]
+        assert trace['otherData']['dropped_events'] == 2
+
+    def test_error_is_recorded(self):
+        """Test that a span records the exception type it exits with."""
+        tracer = Tracer()
+        with pytest.raises(RuntimeError):
+            with tracer.span('render'):
+                raise RuntimeError("boom")
+        assert tracer.to_trace()['traceEvents'][0]['args']['error'] == 'RuntimeError'
+
+    def test_flush_writes_trace_json(self, tmp_path):
+        """Test that flush writes a Chrome trace JSON file."""
+        tracer = Tracer(path=str(tmp_path / "session.json"))
+        with tracer.span('snapshot'):
+            pass
+
+        path = tracer.flush()
+        with open(path) as fh:
+            trace = json.load(fh)
+        assert trace['traceEvents'][0]['name'] == 'snapshot'
+        assert trace['displayTimeUnit'] == 'ms'
+
+
+class TestGlobalTracer:
+    """Test enabling and disabling the process-wide tracer."""
+
+    def teardown_method(self):
+        """Disable tracing again."""
+        disable_tracing()
+
+    def test_disabled_by_default(self):
+        """Test that the default tracer records nothing."""
+        tracer = get_tracer()
+        assert isinstance(tracer, NullTracer)
+        assert tracer.span('a') is tracer.span('b')
+        assert tracer.flush() is None
+
+    def test_enable_and_disable(self, tmp_path):
+        """Test that spans are recorded only while tracing is enabled."""
+        tracer = enable_tracing(str(tmp_path / "trace.json"), flush_on_exit=False)
+        assert get_tracer() is tracer
+
+        with get_tracer().span('interpret'):
+            pass
+        disable_tracing()
+        with get_tracer().span('ignored'):
+            pass
+
+        assert [event['name'] for event in tracer.to_trace()['traceEvents']] == ['interpret']
@@ -0,0 +1,70 @@
+"""
+Tests for the headless batch command runner.
+"""
+
+import io
+import json
+import pytest
+from engraf.interpreter import batch_runner
+from engraf.interpreter.batch_runner import read_commands, run_batch
+from engraf.visualizer.scene.scene_model import SceneModel
+from engraf.visualizer.scene.scene_object import SceneObject
+from latn.lexer.vector_space import VectorSpace
+
+
+class FakeInterpreter:
+    """Creates a cube per 'draw' command and fails everything else."""
+
+    def __init__(self):
+        self.scene = SceneModel()
+
+    def interpret(self, sentence):
+        if sentence.startswith("draw"):
+            object_id = f"cube_{len(self.scene.objects) + 1}"
+            self.scene.add_object(SceneObject(name="cube", vector=VectorSpace(), object_id=object_id))
+            return {'success': True, 'message': "ok", 'sentence': sentence, 'objects_created': [object_id]}
+        return {'success': False, 'message': "Failed to parse sentence", 'sentence': sentence}
+
+    def get_stage_latencies(self):
+        return {}
+
+
+class TestBatchRunner:
+    """Test running command files without a display."""
+
+    def test_read_commands_skips_blanks_and_comments(self):
+        """Test that blank lines and comments are skipped and commands stripped."""
+        stream = io.StringIO("# setup\ndraw a cube\n\n  move it up  \n")
+
+        assert list(read_commands(stream)) == ["draw a cube", "move it up"]
+
+    def test_run_batch_writes_results_and_reports(self):
+        """Test that each command gets a JSON result line and the report totals them."""
+        results = io.StringIO()
+
+        report = run_batch(["draw a cube", "draw a sphere", "fly away"], results, interpreter=FakeInterpreter())
+
+        lines = [json.loads(line) for line in results.getvalue().splitlines()]
+        assert [line['index'] for line in lines] == [0, 1, 2]
+        assert lines[0]['objects_created'] == ["cube_1"]
+        assert lines[2]['success'] == False and lines[2]['message'] == "Failed to parse sentence"
+
+        summary = report.summary()
+        assert summary['commands'] == 3
+        assert summary['failures'] == 1
+        assert summary['scene_objects'] == 2
+        assert summary['latency_ms']['p50'] <= summary['latency_ms']['p99']
+        assert "commands/s" in report.format()
+
+    def test_main_exit_code(self, tmp_path, monkeypatch):
+        """Test that failures give exit code 1 unless allowed."""
+        commands = tmp_path / "commands.txt"
+        commands.write_text("draw a cube\nfly away\n")
+        report_path = tmp_path / "report.json"
+        monkeypatch.setattr(batch_runner, 'run_batch',
+                            lambda stream, results, **kwargs: run_batch(stream, results, interpreter=FakeInterpreter()))
+
+        args = [str(commands), '-o', str(tmp_path / "results.jsonl"), '--report-json', str(report_path)]
+        assert batch_runner.main(args) == 1
+        assert batch_runner.main(args + ['--allow-failures']) == 0
+        assert json.loads(report_path.read_text())['commands'] == 2
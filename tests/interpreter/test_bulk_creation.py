@@ -0,0 +1,104 @@
+"""
+Tests for quantity-and-layout bulk creation commands.
+"""
+
+import numpy as np
+import pytest
+from engraf.interpreter.bulk_creation import BulkCommand, BulkCreateStep, layout_positions, parse_bulk_command
+from engraf.interpreter.sentence_interpreter import SentenceInterpreter
+from engraf.visualizer.renderers.mock_renderer import MockRenderer
+from latn.lexer.vector_space import VectorSpace
+
+
+class TestParseBulkCommand:
+    """Test recognizing quantity-and-layout sentences."""
+
+    def test_grid(self):
+        """Test a numeric count laid out in a grid."""
+        command = parse_bulk_command("draw 500 red cubes in a grid")
+
+        assert (command.verb, command.count, command.layout) == ("draw", 500, "grid")
+        assert command.description_sentence == "draw a red cube"
+
+    def test_circle_with_number_word_and_radius(self):
+        """Test a number word with a circle radius."""
+        command = parse_bulk_command("draw ten spheres in a circle of radius 5")
+
+        assert (command.count, command.layout, command.radius) == (10, "circle", 5.0)
+
+    def test_rows(self):
+        """Test rows of a given length."""
+        command = parse_bulk_command("draw 3 rows of 20 boxes")
+
+        assert (command.count, command.rows, command.layout) == (60, 3, "rows")
+        assert command.description == "box"
+
+    def test_compound_number_words(self):
+        """Test that compound number words are read as one count."""
+        assert parse_bulk_command("draw twenty one cubes in a row").count == 21
+        assert parse_bulk_command("draw 3 rows of forty-two boxes").count == 126
+        assert parse_bulk_command("draw twenty one hundred cubes in a row") is None
+
+    def test_radius_only_for_circles(self):
+        """Test that a radius is only accepted after a circle layout."""
+        assert parse_bulk_command("draw 20 cubes in a grid of radius 5") is None
+        assert parse_bulk_command("draw 20 cubes in a row of radius 5") is None
+
+    def test_other_sentences_are_left_to_the_parser(self):
+        """Test that single objects, unlaid counts and mixed lists are not bulk commands."""
+        assert parse_bulk_command("draw a red cube") is None
+        assert parse_bulk_command("draw 2 cubes") is None
+        assert parse_bulk_command("draw 1 cube in a row") is None
+        assert parse_bulk_command("draw two cubes and a sphere in a row") is None
+
+
+class TestLayoutPositions:
+    """Test the position arrays for each layout."""
+
+    def test_grid_is_centered(self):
+        """Test that a grid is centered on the origin in the ground plane."""
+        positions = layout_positions('grid', 9, 2.0)
+
+        assert positions.shape == (9, 3)
+        assert np.allclose(positions.mean(axis=0), 0.0)
+        assert positions[:, 0].max() == pytest.approx(2.0)
+        assert np.all(positions[:, 1] == 0.0)
+
+    def test_rows_use_per_row_columns(self):
+        """Test that rows share columns."""
+        positions = layout_positions('rows', 6, 1.0, rows=2)
+
+        assert len(np.unique(positions[:, 0])) == 3
+        assert len(np.unique(positions[:, 2])) == 2
+
+    def test_circle_radius(self):
+        """Test that a circle's positions lie on its radius."""
+        positions = layout_positions('circle', 10, 2.0, radius=5.0)
+
+        assert np.allclose(np.hypot(positions[:, 0], positions[:, 2]), 5.0)
+
+
+class TestBulkCreateStep:
+    """Test creating many objects in one step."""
+
+    def test_creates_one_batch_and_rolls_back_as_one(self):
+        """Test that a bulk step creates every object and rolls back as one."""
+        interpreter = SentenceInterpreter(renderer=MockRenderer())
+        vector = VectorSpace()
+        vector['red'] = 1.0
+        step = BulkCreateStep(BulkCommand("draw", 12, "row", "red cube"), {'type': 'cube', 'vector_space': vector})
+        result = {'objects_created': []}
+
+        interpreter.scene.begin_transaction()
+        step.run(interpreter, [], result)
+
+        objects = interpreter.scene.objects
+        assert result['objects_created'] == [f"cube-{i}" for i in range(1, 13)]
+        assert interpreter.last_acted_object == "cube-12"
+        assert interpreter.object_counter == 12
+        assert len({obj.vector['locX'] for obj in objects}) == 12
+        assert all(obj.vector['red'] == 1.0 for obj in objects)
+
+        interpreter.scene.rollback_transaction()
+        assert interpreter.scene.entities == []
+        assert len(interpreter.scene.attribute_index) == 0
@@ -0,0 +1,130 @@
+"""
+Tests for compiled command plans and their template cache.
+"""
+
+import logging
+from types import SimpleNamespace
+
+import pytest
+from engraf.interpreter.command_plan import CommandPlan, CommandPlanCache, ModifyStep, sentence_template
+from engraf.interpreter.sentence_interpreter import SentenceInterpreter
+from engraf.visualizer.renderers.mock_renderer import MockRenderer
+
+
+class TestSentenceTemplate:
+    """Test turning sentences into templates and slot values."""
+
+    def test_vector_literal_becomes_slots(self):
+        """Test that vector literal numbers become slots."""
+        template, params = sentence_template("move the cube to [1, 2.5, -3]")
+
+        assert template == "move the cube to [#, #, #]"
+        assert params == [1.0, 2.5, -3.0]
+
+    def test_spacing_does_not_change_template(self):
+        """Test that spacing inside literals does not change the template."""
+        assert sentence_template("draw a cube at [1,2,3]")[0] == sentence_template("draw  a cube at [ 4, 5, 6 ]")[0]
+
+    def test_amount_after_by_becomes_slot(self):
+        """Test that the number after "by" becomes a slot."""
+        template, params = sentence_template("rotate it by 90 degrees")
+
+        assert template == "rotate it by # degrees"
+        assert params == [90.0]
+
+    def test_quantities_stay_in_template(self):
+        """Test that quantities outside literals stay in the template."""
+        template, params = sentence_template("move 2 cubes to [1, 2, 3]")
+
+        assert template == "move 2 cubes to [#, #, #]"
+        assert params == [1.0, 2.0, 3.0]
+
+
+class TestCommandPlanCache:
+    """Test the LRU plan cache."""
+
+    def test_lru_eviction(self):
+        """Test that the least recently used plan is evicted."""
+        cache = CommandPlanCache(capacity=2)
+        for template in ["a", "b"]:
+            cache.put(CommandPlan(template, None, [], [], []))
+        cache.get("a")
+        cache.put(CommandPlan("c", None, [], [], []))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.stats() == {'hits': 3, 'misses': 1, 'size': 2}
+
+
+class TestModifyStep:
+    """Test applying modification ops to resolved targets."""
+
+    def test_failed_modification_is_logged(self, caplog):
+        """Test that a failing op is logged and its target not reported as modified."""
+        class FailingOp:
+            def apply(self, modifier, entity, values):
+                raise ValueError("no such axis")
+
+        entity = object()
+        interpreter = SimpleNamespace(
+            object_modifier=SimpleNamespace(update_rendering=lambda entity: None),
+            object_resolver=SimpleNamespace(resolve_target_objects=lambda vp: ["cube-1"]),
+            scene=SimpleNamespace(find_entity_by_id=lambda entity_id: entity, touch=lambda entity: None,
+                                  refresh_attributes=lambda entity: None),
+            _last_acted_object=[None],
+        )
+        result = {'objects_modified': []}
+
+        with caplog.at_level(logging.WARNING, logger='engraf.interpreter.command_plan'):
+            ModifyStep(SimpleNamespace(verb="rotate"), [FailingOp()]).run(interpreter, [], result)
+
+        assert result['objects_modified'] == []
+        assert interpreter._last_acted_object == [None]
+        assert "Failed to modify entity cube-1: no such axis" in caplog.text
+
+
+class TestCompiledExecution:
+    """Test interpreting sentences through cached plans."""
+
+    def setup_method(self):
+        """Set up an interpreter with a plan cache."""
+        self.interpreter = SentenceInterpreter(renderer=MockRenderer(), plan_cache_size=16)
+
+    def test_repeated_creation_uses_plan(self):
+        """Test that a second creation with new coordinates reuses the plan."""
+        first = self.interpreter.interpret("draw a red cube at [1, 2, 3]")
+        second = self.interpreter.interpret("draw a red cube at [4, 5, 6]")
+
+        assert first['success'] and second['success']
+        assert 'plan_cache_hit' not in first
+        assert second['plan_cache_hit'] == True
+        assert len(self.interpreter.scene.objects) == 2
+
+        obj = self.interpreter.scene.find_object_by_id(second['objects_created'][0])
+        assert (obj.vector['locX'], obj.vector['locY'], obj.vector['locZ']) == (4.0, 5.0, 6.0)
+        assert obj.vector['red'] > 0.5
+        # The first object must not share its vector with the plan
+        assert self.interpreter.scene.objects[0].vector is not obj.vector
+
+    def test_repeated_move_uses_plan(self):
+        """Test that a second move with new coordinates reuses the plan."""
+        self.interpreter.interpret("draw a cube")
+        self.interpreter.interpret("move the cube to [1, 2, 3]")
+        result = self.interpreter.interpret("move the cube to [7, 8, 9]")
+
+        assert result['success'] == True
+        assert result['plan_cache_hit'] == True
+        obj = self.interpreter.scene.objects[0]
+        assert (obj.vector['locX'], obj.vector['locY'], obj.vector['locZ']) == (7.0, 8.0, 9.0)
+        assert self.interpreter.last_acted_object == obj.object_id
+
+    def test_cached_plan_is_still_validated(self):
+        """Test that a cached plan still fails when its target is gone."""
+        self.interpreter.interpret("draw a cube")
+        self.interpreter.interpret("move the cube to [1, 2, 3]")
+        self.interpreter.clear_scene()
+
+        result = self.interpreter.interpret("move the cube to [4, 5, 6]")
+
+        assert result['success'] == False
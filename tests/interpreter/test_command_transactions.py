@@ -0,0 +1,54 @@
+"""
+Tests for all-or-nothing command execution in SentenceInterpreter.
+"""
+
+import pytest
+from engraf.interpreter.sentence_interpreter import SentenceInterpreter
+from engraf.visualizer.renderers.mock_renderer import MockRenderer
+from engraf.visualizer.scene.scene_object import SceneObject
+from latn.lexer.vector_space import VectorSpace
+
+
+class TestCommandTransactions:
+    """Test that each command runs as one scene transaction."""
+
+    def setup_method(self):
+        """Set up an interpreter with one cube."""
+        self.interpreter = SentenceInterpreter(renderer=MockRenderer())
+        self.interpreter.scene.add_object(SceneObject(name="cube", vector=VectorSpace(), object_id="cube-1"))
+        self.interpreter.last_acted_object = "cube-1"
+
+    def half_done_command(self, success):
+        """Create an object, then report the command's outcome."""
+        scene = self.interpreter.scene
+        scene.add_object(SceneObject(name="sphere", vector=VectorSpace(), object_id="sphere-1"))
+        self.interpreter.last_acted_object = "sphere-1"
+        return {'success': success}
+
+    def test_failed_command_is_rolled_back(self):
+        """Test that a failed command leaves the scene as it was."""
+        result = self.interpreter._execute_atomically(lambda: self.half_done_command(False))
+
+        assert result['success'] == False
+        assert [obj.object_id for obj in self.interpreter.scene.objects] == ["cube-1"]
+        assert self.interpreter.last_acted_object == "cube-1"
+        assert not self.interpreter.scene.in_transaction
+
+    def test_successful_command_is_kept(self):
+        """Test that a successful command commits its changes."""
+        self.interpreter._execute_atomically(lambda: self.half_done_command(True))
+
+        assert len(self.interpreter.scene.objects) == 2
+        assert self.interpreter.last_acted_object == "sphere-1"
+        assert not self.interpreter.scene.in_transaction
+
+    def test_exception_is_rolled_back_and_raised(self):
+        """Test that a crashing command is rolled back and its exception raised."""
+        def failing():
+            self.half_done_command(True)
+            raise RuntimeError("handler crashed")
+
+        with pytest.raises(RuntimeError):
+            self.interpreter._execute_atomically(failing)
+
+        assert len(self.interpreter.scene.objects) == 1
@@ -0,0 +1,92 @@
+"""
+Tests for the bounded execution history and its JSONL sink.
+"""
+
+import io
+import json
+import pytest
+from engraf.interpreter.execution_history import ExecutionHistory
+from engraf.interpreter.handlers.scene_manager import SceneManager
+from engraf.visualizer.scene.scene_model import SceneModel
+
+
+class FakeParse:
+    """Stands in for a parse tree: not JSON serializable."""
+
+    def __str__(self):
+        return "(S draw a cube)"
+
+
+def make_result(sentence, created=()):
+    """Build an interpret result for a sentence."""
+    return {
+        'success': True,
+        'message': f"Successfully executed: {sentence}",
+        'sentence': sentence,
+        'sentence_parsed': FakeParse(),
+        'objects_created': list(created),
+        'objects_modified': [],
+        'actions_performed': ['draw']
+    }
+
+
+class TestExecutionHistory:
+    """Test the bounded history and its sink."""
+
+    def test_records_are_compact(self):
+        """Test that kept records drop the parse tree."""
+        history = ExecutionHistory()
+
+        record = history.append(make_result("draw a cube", ["cube_1"]))
+
+        assert 'sentence_parsed' not in record
+        assert record['sentence'] == "draw a cube"
+        assert record['objects_created'] == ["cube_1"]
+        assert history.last is record
+
+    def test_ring_buffer_drops_oldest(self):
+        """Test that the oldest records are dropped but still counted."""
+        history = ExecutionHistory(capacity=3)
+        for i in range(5):
+            history.append(make_result(f"draw cube {i}"))
+
+        assert len(history) == 3
+        assert history.total == 5
+        assert [record['sentence'] for record in history] == ["draw cube 2", "draw cube 3", "draw cube 4"]
+
+    def test_sink_receives_full_records(self):
+        """Test that the sink gets every record, parse tree included."""
+        sink = io.StringIO()
+        history = ExecutionHistory(capacity=1, sink=sink)
+        history.append(make_result("draw a cube"))
+        history.append(make_result("draw a sphere"))
+
+        lines = [json.loads(line) for line in sink.getvalue().splitlines()]
+        assert [line['sentence'] for line in lines] == ["draw a cube", "draw a sphere"]
+        assert lines[0]['sentence_parsed'] == "(S draw a cube)"
+
+    def test_sink_path(self, tmp_path):
+        """Test writing the sink to a file path."""
+        path = tmp_path / "history.jsonl"
+        history = ExecutionHistory(sink=str(path))
+        history.append(make_result("draw a cube"))
+        history.close()
+
+        assert json.loads(path.read_text())['sentence'] == "draw a cube"
+
+    def test_invalid_capacity(self):
+        """Test that a capacity below one is rejected."""
+        with pytest.raises(ValueError):
+            ExecutionHistory(capacity=0)
+
+    def test_scene_summary_uses_history(self):
+        """Test that the scene summary counts and reads the history."""
+        history = ExecutionHistory(capacity=1)
+        manager = SceneManager(SceneModel(), None, history, [0], None)
+        history.append(make_result("draw a cube"))
+        history.append(make_result("draw a sphere"))
+
+        summary = manager.get_scene_summary()
+
+        assert summary['execution_history'] == 2
+        assert summary['last_action']['sentence'] == "draw a sphere"
@@ -0,0 +1,40 @@
+"""
+Tests that handler diagnostics go through logging instead of stdout.
+"""
+
+import logging
+from engraf.interpreter.handlers.object_creator import ObjectCreator
+from engraf.visualizer.scene.scene_model import SceneModel
+from latn.lexer.vector_space import VectorSpace
+
+
+def make_obj_info(noun="cube"):
+    return {
+        'type': noun,
+        'determiner': 'a',
+        'adjectives': [],
+        'vector_space': VectorSpace(),
+        'custom_name': None
+    }
+
+
+def test_create_scene_object_is_silent_by_default(capsys):
+    """Test that creating objects writes nothing to stdout or stderr."""
+    creator = ObjectCreator(SceneModel(), [0])
+
+    obj_id = creator.create_scene_object(make_obj_info())
+
+    assert obj_id is not None
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert captured.err == ""
+
+
+def test_create_scene_object_logs_at_info(caplog):
+    """Test that object creation is reported through the module logger."""
+    creator = ObjectCreator(SceneModel(), [0])
+
+    with caplog.at_level(logging.INFO, logger="engraf.interpreter.handlers.object_creator"):
+        obj_id = creator.create_scene_object(make_obj_info())
+
+    assert any(obj_id in record.getMessage() for record in caplog.records)
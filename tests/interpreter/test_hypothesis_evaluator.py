@@ -0,0 +1,134 @@
+"""Tests for evaluation of competing parse hypotheses."""
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import Mock
+from engraf.interpreter.sentence_interpreter import SentenceInterpreter
+from engraf.interpreter.hypothesis_evaluator import HypothesisEvaluator
+from engraf.visualizer.renderers.mock_renderer import MockRenderer
+
+
+def make_evaluation(rank, success, has_effect):
+    """Build an executed hypothesis evaluation."""
+    return {
+        'rank': rank,
+        'status': 'executed',
+        'success': success,
+        'message': '',
+        'elapsed_ms': 1.0,
+        'has_effect': has_effect,
+        'sentence_parsed': None
+    }
+
+
+class TestHypothesisSelection:
+    """Selection rules for the winning hypothesis."""
+
+    def setup_method(self):
+        """Set up an evaluator with no interpreter."""
+        self.evaluator = HypothesisEvaluator(interpreter=None, max_hypotheses=3)
+
+    def test_no_successful_hypothesis(self):
+        """Test that nothing is selected when every hypothesis failed."""
+        evaluations = [make_evaluation(0, False, False), make_evaluation(1, False, False)]
+        assert self.evaluator.select_best(evaluations) is None
+
+    def test_best_rank_wins_among_successes(self):
+        """Test that the best-ranked success wins."""
+        evaluations = [make_evaluation(0, False, False), make_evaluation(1, True, True), make_evaluation(2, True, True)]
+        assert self.evaluator.select_best(evaluations)['rank'] == 1
+
+    def test_effect_beats_rank(self):
+        """Test that a success that changed the scene beats a better-ranked no-op."""
+        evaluations = [make_evaluation(0, True, False), make_evaluation(1, True, True)]
+        assert self.evaluator.select_best(evaluations)['rank'] == 1
+
+    def test_unreduced_hypotheses_are_reported(self):
+        """Test that a hypothesis that did not reduce to a sentence is reported unparsed."""
+        hypothesis = SimpleNamespace(tokens=[object(), object()])
+        evaluations = self.evaluator.evaluate([hypothesis], "draw a cube")
+
+        assert len(evaluations) == 1
+        assert evaluations[0]['status'] == 'unparsed'
+        assert evaluations[0]['success'] == False
+
+
+class TestDryRuns:
+    """Dry runs execute on the live scene and are rolled back."""
+
+    @pytest.fixture(autouse=True)
+    def setup_interpreter(self, make_object):
+        """Set up an interpreter whose execution adds one cube."""
+        self.make_object = make_object
+        self.renderer = Mock()
+        self.interpreter = SentenceInterpreter(renderer=self.renderer)
+        self.interpreter.semantic_validator.validate_command = lambda phrase, sentence: (True, None)
+        self.interpreter._execute_sentence = self.execute
+        self.hypotheses = [SimpleNamespace(tokens=[SimpleNamespace(phrase=SimpleNamespace())]) for _ in range(3)]
+
+    def execute(self, phrase, sentence):
+        """Add a cube and push it to the renderer, like a creation command."""
+        interpreter = self.interpreter
+        interpreter.object_counter += 1
+        cube = self.make_object(f"cube-{interpreter.object_counter}")
+        interpreter.scene.add_object(cube)
+        interpreter.object_modifier.update_rendering(cube)
+        interpreter.last_acted_object = cube.object_id
+        return {'success': True, 'message': '', 'objects_created': [cube.object_id]}
+
+    def test_dry_runs_leave_no_trace(self, monkeypatch):
+        """Test that dry runs are rolled back without copying or redrawing the scene."""
+        monkeypatch.setattr(self.interpreter.scene, 'copy', Mock(side_effect=AssertionError("scene copied")))
+
+        evaluations = HypothesisEvaluator(self.interpreter, max_hypotheses=3).evaluate(self.hypotheses, "draw a cube")
+
+        assert [evaluation['has_effect'] for evaluation in evaluations] == [True, True, True]
+        assert self.interpreter.scene.objects == []
+        assert not self.interpreter.scene.in_transaction
+        assert self.interpreter.object_counter == 0
+        assert self.interpreter.last_acted_object is None
+        self.renderer.update_object.assert_not_called()
+
+    def test_hypotheses_past_the_cap_are_not_started(self):
+        """Test that hypotheses not started within the latency cap time out."""
+        evaluations = HypothesisEvaluator(self.interpreter, max_hypotheses=3, latency_cap=0.0).evaluate(
+            self.hypotheses, "draw a cube")
+
+        assert [evaluation['status'] for evaluation in evaluations] == ['timed_out'] * 3
+        assert self.interpreter.object_counter == 0
+
+
+class TestParallelInterpretation:
+    """End-to-end interpretation with hypothesis evaluation enabled."""
+
+    def setup_method(self):
+        """Set up an interpreter evaluating three hypotheses."""
+        self.interpreter = SentenceInterpreter(renderer=MockRenderer(), parallel_hypotheses=3)
+
+    def test_creation_still_works(self):
+        """Test that a creation commits exactly one object."""
+        result = self.interpreter.interpret("draw a red cube")
+
+        assert result['success'] == True
+        assert len(result['objects_created']) == 1
+        assert len(self.interpreter.scene.objects) == 1
+
+    def test_dry_runs_do_not_touch_live_scene(self):
+        """Test that dry runs leave no objects or counter changes behind."""
+        self.interpreter.interpret("draw a red cube")
+        self.interpreter.interpret("draw a blue sphere")
+
+        # Exactly one hypothesis was committed per sentence
+        assert len(self.interpreter.scene.objects) == 2
+        assert self.interpreter.object_counter == 2
+
+    def test_evaluations_carry_timing(self):
+        """Test that each evaluation reports its rank, status and time."""
+        result = self.interpreter.interpret("draw a big red cube at [1, 2, 3]")
+
+        for evaluation in result.get('hypothesis_evaluations', []):
+            assert 'rank' in evaluation
+            assert 'status' in evaluation
+            assert 'sentence_parsed' not in evaluation
+            if evaluation['status'] != 'timed_out':
+                assert evaluation['elapsed_ms'] >= 0.0
@@ -0,0 +1,82 @@
+"""
+Tests for the vectorized candidate scoring in ObjectResolver.
+"""
+
+import pytest
+from types import SimpleNamespace
+from engraf.interpreter.handlers.object_resolver import ObjectResolver
+from engraf.visualizer.scene.scene_model import SceneModel
+from engraf.visualizer.scene.scene_object import SceneObject
+from latn.lexer.vector_space import VectorSpace
+
+
+def make_vector(red=0.0, green=0.0, blue=0.0, scale=1.0, x=0.0):
+    """Build a vector with the given color, unit scale and x position."""
+    vector = VectorSpace()
+    vector['red'] = red
+    vector['green'] = green
+    vector['blue'] = blue
+    vector['scaleX'] = vector['scaleY'] = vector['scaleZ'] = scale
+    vector['locX'] = x
+    return vector
+
+
+def make_np(noun, vector):
+    """Build a noun phrase stand-in."""
+    return SimpleNamespace(noun=noun, vector=vector, pronoun=None)
+
+
+class TestVectorizedScoring:
+    """Test filtering and ranking candidates as arrays."""
+
+    def setup_method(self):
+        """Set up an empty scene and its resolver."""
+        self.scene = SceneModel()
+        self.resolver = ObjectResolver(self.scene, [None])
+
+    def add(self, object_id, name="cube", **features):
+        """Add an object with the given features."""
+        self.scene.add_object(SceneObject(name=name, vector=make_vector(**features), object_id=object_id))
+
+    def test_color_conflicts_are_dropped(self):
+        """Test that candidates with a conflicting color are dropped."""
+        self.add("red-cube", red=1.0)
+        self.add("blue-cube", blue=1.0)
+        self.add("white-cube", red=1.0, green=1.0, blue=1.0)
+
+        ranked = self.resolver.find_objects_by_description(make_np("cube", make_vector(red=1.0)))
+
+        assert ranked == ["red-cube", "white-cube"]
+
+    def test_other_types_are_ignored(self):
+        """Test that only the phrase's noun is considered."""
+        self.add("cube-1")
+        self.add("sphere-1", name="sphere")
+
+        assert self.resolver.find_objects_by_description(make_np("sphere", make_vector())) == ["sphere-1"]
+
+    def test_ranked_by_distance_with_stable_ties(self):
+        """Test that candidates are ranked by distance, keeping scene order on ties."""
+        self.add("far", x=9.0)
+        self.add("near-a", x=1.0)
+        self.add("near-b", x=1.0)
+
+        ranked = self.resolver.find_objects_by_description(make_np("cube", make_vector(x=0.0)))
+
+        assert ranked == ["near-a", "near-b", "far"]
+
+    def test_same_size_category_is_a_match(self):
+        """Test that scales in the same size category have no distance."""
+        distance = self.resolver._calculate_vector_distance
+        query = make_vector(scale=2.0)
+
+        assert distance(make_vector(scale=3.0), query) == 0.0
+        assert distance(make_vector(scale=1.0), query) > 0.0
+
+    def test_scalar_helpers_agree_with_rules(self):
+        """Test the one-object helpers against the matching rules."""
+        assert self.resolver._has_feature_mismatch(make_vector(blue=1.0), make_vector(red=1.0))
+        assert not self.resolver._has_feature_mismatch(make_vector(red=1.0, blue=1.0), make_vector(red=1.0))
+        assert self.resolver._categorize_scale(0.5) == 'small'
+        assert self.resolver._categorize_scale(1.0) == 'normal'
+        assert self.resolver._categorize_scale(1.5) == 'large'
@@ -0,0 +1,126 @@
+"""
+Tests for per-command sharing of noun phrase matches.
+"""
+
+import pytest
+from types import SimpleNamespace
+from engraf.interpreter.resolution_context import ResolutionContext
+from engraf.interpreter.handlers.object_resolver import ObjectResolver
+from engraf.interpreter.semantic_validator import SemanticAgreementValidator
+from engraf.visualizer.scene.scene_model import SceneModel
+from latn.lexer.vector_space import VectorSpace
+
+
+def make_np(noun, grounding=None, red=0.0):
+    """Build a noun phrase stand-in with an optional grounding."""
+    vector = VectorSpace()
+    vector['red'] = red
+    return SimpleNamespace(noun=noun, vector=vector, pronoun=None, determiner='the', grounding=grounding)
+
+
+class CountingScene(SceneModel):
+    """Scene that counts how often its object list is scanned."""
+
+    def __init__(self):
+        super().__init__()
+        self.scans = 0
+
+    @property
+    def objects(self):
+        self.scans += 1
+        return super().objects
+
+
+class TestResolutionContext:
+    """Test caching of candidate lists per noun phrase."""
+
+    @pytest.fixture(autouse=True)
+    def setup_scene(self, make_object):
+        """Set up a scan-counting scene with two cubes and a sphere."""
+        self.make_object = make_object
+        self.scene = CountingScene()
+        for object_id, name in [("cube-1", "cube"), ("sphere-1", "sphere"), ("cube-2", "cube")]:
+            self.scene.add_object(make_object(object_id, name))
+        self.scene.scans = 0
+
+    def test_candidates_are_computed_once(self):
+        """Test that a noun phrase's candidates are scanned once."""
+        context = ResolutionContext(self.scene)
+        np = make_np("cube")
+
+        first = context.candidates(np)
+        second = context.candidates(np)
+
+        assert [obj.object_id for obj in first] == ["cube-1", "cube-2"]
+        assert second is first
+        assert self.scene.scans == 1
+
+    def test_grounding_restricts_candidates(self):
+        """Test that grounded objects replace the scene scan."""
+        context = ResolutionContext(self.scene)
+        grounded = self.scene.find_object_by_id("cube-2")
+        np = make_np("cube", grounding={'scene_objects': [grounded]})
+
+        assert [obj.object_id for obj in context.candidates(np)] == ["cube-2"]
+
+    def test_grounding_can_be_ignored(self):
+        """Test that use_grounding=False scans the scene anyway."""
+        context = ResolutionContext(self.scene, use_grounding=False)
+        grounded = self.scene.find_object_by_id("cube-2")
+        np = make_np("cube", grounding={'scene_object': grounded})
+
+        assert [obj.object_id for obj in context.candidates(np)] == ["cube-1", "cube-2"]
+
+    def test_stale_grounding_falls_back_to_scene(self):
+        """Test that grounding to objects no longer in the scene is ignored."""
+        context = ResolutionContext(self.scene)
+        np = make_np("cube", grounding={'scene_objects': [self.make_object("cube-99")]})
+
+        assert [obj.object_id for obj in context.candidates(np)] == ["cube-1", "cube-2"]
+
+    def test_invalidate_sees_new_objects(self):
+        """Test that invalidate drops cached candidates."""
+        context = ResolutionContext(self.scene)
+        np = make_np("cube")
+        context.candidates(np)
+
+        self.scene.add_object(self.make_object("cube-3"))
+        context.invalidate()
+
+        assert len(context.candidates(np)) == 3
+
+
+class TestSharedResolution:
+    """Test the validator and resolver sharing one context per command."""
+
+    def test_validator_and_resolver_share_one_scan(self, make_object):
+        """Test that validation and resolution of one phrase scan the scene once."""
+        scene = CountingScene()
+        scene.add_object(make_object("cube-1", red=1.0))
+        scene.add_object(make_object("cube-2"))
+        context_ref = [None]
+        validator = SemanticAgreementValidator(scene, context_ref)
+        resolver = ObjectResolver(scene, [None], context_ref)
+        np = make_np("cube", red=1.0)
+        scene.scans = 0
+
+        context_ref[0] = ResolutionContext(scene)
+        count = validator._count_matching_objects(np)
+        ranked = resolver.find_objects_by_description(np)
+        ranked_again = resolver.find_objects_by_description(np)
+
+        assert count == 1
+        assert ranked == ["cube-1"]
+        assert ranked_again == ranked
+        assert resolver.find_object("cube-2").object_id == "cube-2"
+        assert scene.scans == 1
+
+    def test_resolver_without_context_scans_scene(self, make_object):
+        """Test that the resolver works without an open context."""
+        scene = SceneModel()
+        scene.add_object(make_object("cube-1"))
+        resolver = ObjectResolver(scene, [None])
+
+        assert resolver.find_objects_by_description(make_np("cube")) == ["cube-1"]
+        assert resolver.find_object("cube-1").object_id == "cube-1"
+        assert resolver.find_object("missing") is None
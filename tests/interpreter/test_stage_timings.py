@@ -0,0 +1,48 @@
+"""Test suite for per-stage timings in interpreter results."""
+
+import pytest
+from engraf.interpreter.sentence_interpreter import SentenceInterpreter
+from engraf.visualizer.renderers.mock_renderer import MockRenderer
+
+
+class TestStageTimings:
+    """Timings are opt-in and aggregated per stage."""
+
+    def test_timings_absent_by_default(self):
+        """Test that results carry no timings unless asked."""
+        interpreter = SentenceInterpreter(renderer=MockRenderer())
+        result = interpreter.interpret("draw a cube")
+
+        assert result['success'] == True
+        assert 'timings' not in result
+        assert interpreter.get_stage_latencies() == {}
+
+    def test_timings_cover_each_stage(self):
+        """Test that every interpret stage is timed."""
+        interpreter = SentenceInterpreter(renderer=MockRenderer(), collect_timings=True)
+        result = interpreter.interpret("draw a red cube")
+
+        timings = result['timings']
+        for stage in ['temporal_check', 'parse', 'validate', 'execute',
+                      'execute.object_creator', 'snapshot', 'render', 'total']:
+            assert stage in timings
+            assert timings[stage] >= 0.0
+
+    def test_modification_times_resolver_and_modifier(self):
+        """Test that modifications time the resolver and modifier."""
+        interpreter = SentenceInterpreter(renderer=MockRenderer(), collect_timings=True)
+        interpreter.interpret("draw a red cube")
+        result = interpreter.interpret("move it to [1, 2, 3]")
+
+        assert 'execute.object_resolver' in result['timings']
+        assert 'execute.object_modifier' in result['timings']
+
+    def test_latencies_are_queryable(self):
+        """Test that per-stage latencies aggregate across commands."""
+        interpreter = SentenceInterpreter(renderer=MockRenderer(), collect_timings=True)
+        interpreter.interpret("draw a cube")
+        interpreter.interpret("draw a sphere")
+
+        latencies = interpreter.get_stage_latencies()
+        assert latencies['parse']['count'] == 2
+        assert latencies['total']['p50'] is not None
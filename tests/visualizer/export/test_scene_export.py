@@ -0,0 +1,136 @@
+"""
+Tests for streaming scene export to glTF, OBJ and STL.
+"""
+
+import json
+import struct
+
+import numpy as np
+import pytest
+from engraf.visualizer.export.scene_export import export_scene, quaternions
+from engraf.visualizer.renderers.shape_meshes import rotation_matrices, unit_mesh
+from engraf.visualizer.scene.scene_assembly import SceneAssembly
+from engraf.visualizer.scene.scene_model import SceneModel
+
+RED = (1.0, 0.0, 0.0)
+
+
+@pytest.fixture
+def scene(make_object):
+    """Two red cubes, a blue sphere and a red pyramid-and-cube house assembly."""
+    scene = SceneModel()
+    scene.add_objects([
+        make_object("cube-1", color=RED),
+        make_object("cube-2", color=RED, locX=2.0, rotY=90.0),
+        make_object("sphere-1", "sphere", color=(0.0, 0.0, 1.0), locX=4.0),
+    ])
+    house = SceneAssembly("house", [make_object("roof-1", "pyramid", color=RED), make_object("wall-1", color=RED)],
+                          assembly_id="house-1")
+    scene.add_assembly(house)
+    return scene
+
+
+def read_glb(path):
+    """Check a .glb file's chunk framing and return its JSON document and binary chunk."""
+    data = path.read_bytes()
+    magic, version, length = struct.unpack('<4sII', data[:12])
+    assert (magic, version, length) == (b'glTF', 2, len(data))
+    json_length, json_type = struct.unpack('<I4s', data[12:20])
+    assert json_type == b'JSON' and json_length % 4 == 0
+    document = json.loads(data[20:20 + json_length])
+    bin_length, bin_type = struct.unpack('<I4s', data[20 + json_length:28 + json_length])
+    assert bin_type == b'BIN\x00'
+    return document, data[28 + json_length:28 + json_length + bin_length]
+
+
+class TestGltfExport:
+    """Test binary glTF export."""
+
+    def test_objects_instance_shared_meshes(self, scene, tmp_path):
+        """Test that nodes instance one mesh per shape and color."""
+        path = tmp_path / "scene.glb"
+
+        assert export_scene(scene, str(path)) == 5
+
+        document, binary = read_glb(path)
+        nodes = document["nodes"]
+        assert [node["name"] for node in nodes] == ["cube-1", "cube-2", "sphere-1", "roof-1", "wall-1", "house-1"]
+        assert nodes[5]["children"] == [3, 4]
+        assert document["scenes"][0]["nodes"] == [0, 1, 2, 5]
+
+        # Red cubes share one mesh; each shape's vertices are stored once
+        assert nodes[0]["mesh"] == nodes[1]["mesh"] == nodes[4]["mesh"]
+        assert len(document["meshes"]) == 3  # Red cube, blue sphere, red pyramid
+        assert len(document["accessors"]) == 2 * 3
+        assert document["buffers"][0]["byteLength"] == len(binary)
+        cube_positions = document["accessors"][0]
+        assert cube_positions["count"] == 3 * len(unit_mesh("cube")[1])
+        assert cube_positions["min"] == [-0.5, -0.5, -0.5]
+
+        assert nodes[1]["translation"] == [2.0, 0.0, 0.0]
+        assert nodes[1]["rotation"] == pytest.approx([0.0, 2 ** -0.5, 0.0, 2 ** -0.5])
+        sphere_material = document["meshes"][nodes[2]["mesh"]]["primitives"][0]["material"]
+        assert document["materials"][sphere_material]["pbrMetallicRoughness"]["baseColorFactor"] == [0.0, 0.0, 1.0, 1.0]
+
+    def test_batches_do_not_change_output(self, scene, tmp_path):
+        """Test that the batch size does not change the file."""
+        export_scene(scene, str(tmp_path / "one.glb"), batch_size=1)
+        export_scene(scene, str(tmp_path / "all.glb"))
+
+        assert (tmp_path / "one.glb").read_bytes() == (tmp_path / "all.glb").read_bytes()
+
+    def test_quaternions_match_rotation_matrices(self):
+        """Test that quaternions rotate like rotation_matrices."""
+        angles = np.array([[30.0, 45.0, 60.0], [0.0, 0.0, 0.0], [-90.0, 10.0, 200.0]])
+
+        for (x, y, z, w), matrix in zip(quaternions(angles), rotation_matrices(angles)):
+            expected = np.array([
+                [1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w)],
+                [2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w)],
+                [2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)],
+            ])
+            assert np.allclose(matrix, expected)
+
+
+class TestObjExport:
+    """Test Wavefront OBJ export."""
+
+    def test_objects_and_groups(self, scene, tmp_path):
+        """Test one object per scene object, grouped by assembly, with valid face indices."""
+        path = tmp_path / "scene.obj"
+
+        export_scene(scene, str(path), batch_size=2)
+
+        lines = path.read_text().splitlines()
+        objects = [line.split()[1] for line in lines if line.startswith("o ")]
+        assert objects == ["cube-1", "cube-2", "sphere-1", "roof-1", "wall-1"]
+        assert lines.index("g house-1") < lines.index("o roof-1")
+
+        meshes = [unit_mesh(shape) for shape in ("cube", "cube", "sphere", "pyramid", "cube")]
+        vertices = [line.split() for line in lines if line.startswith("v ")]
+        faces = np.array([line.split()[1:] for line in lines if line.startswith("f ")], dtype=int)
+        assert len(vertices) == sum(len(v) for v, _ in meshes)
+        assert len(faces) == sum(len(f) for _, f in meshes)
+        assert faces.min() == 1 and faces.max() == len(vertices)
+        assert [float(value) for value in vertices[0][4:]] == [1.0, 0.0, 0.0]
+
+
+class TestStlExport:
+    """Test binary STL export."""
+
+    def test_triangles(self, scene, tmp_path):
+        """Test that the triangle count matches the meshes and the file length."""
+        path = tmp_path / "scene.stl"
+
+        export_scene(scene, str(path), batch_size=2)
+
+        data = path.read_bytes()
+        count = struct.unpack('<I', data[80:84])[0]
+        assert count == sum(len(unit_mesh(shape)[1]) for shape in ("cube", "cube", "sphere", "pyramid", "cube"))
+        assert len(data) == 84 + 50 * count
+
+
+def test_unknown_format(scene, tmp_path):
+    """Test that an unsupported extension is rejected."""
+    with pytest.raises(ValueError):
+        export_scene(scene, str(tmp_path / "scene.fbx"))
@@ -0,0 +1,146 @@
+"""
+Tests for instance batches and the instanced VPython renderer.
+"""
+
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+from engraf.visualizer.renderers.instance_batch import InstanceBatch
+from engraf.visualizer.renderers.vpython_renderer import InstancedVPythonRenderer, create_renderer
+from engraf.visualizer.scene.scene_model import SceneModel
+from tests.visualizer.renderers.test_vpython_renderer import FakeVector
+
+
+class TestInstanceBatch:
+    """Test the per-shape instance arrays and their dirty chunks."""
+
+    def test_set_adds_then_overwrites(self, make_object):
+        """Test that setting a known object rewrites its row in place."""
+        batch = InstanceBatch("cube", chunk_size=2)
+        batch.set(make_object("cube-1", locX=1.0))
+        row = batch.set(make_object("cube-2", locX=2.0, red=1.0))
+
+        assert len(batch) == 2
+        assert batch.take_dirty() == [0]
+
+        batch.set(make_object("cube-2", locX=2.0, locY=3.0))
+        assert batch.row("cube-2") == row
+        assert batch.positions[row].tolist() == [2.0, 3.0, 0.0]
+        assert batch.take_dirty() == [0]
+        assert batch.take_dirty() == []
+
+    def test_remove_moves_last_row(self, make_object):
+        """Test that removal swaps the last row into the hole."""
+        batch = InstanceBatch("cube", chunk_size=2)
+        for index in range(5):
+            batch.set(make_object(f"cube-{index}", locX=float(index)))
+        batch.take_dirty()
+
+        assert batch.remove("cube-0")
+        assert not batch.remove("cube-0")
+
+        assert batch.row("cube-4") == 0
+        assert batch.positions[0][0] == 4.0
+        assert batch.take_dirty() == [0, 2]
+        assert list(batch.chunk_rows(2)) == []
+        assert batch.num_chunks == 2
+
+    def test_grows_past_capacity(self, make_object):
+        """Test that the arrays grow and keep their rows."""
+        batch = InstanceBatch("cube", capacity=2)
+        for index in range(5):
+            batch.set(make_object(f"cube-{index}", locX=float(index)))
+
+        assert len(batch.positions) >= 5
+        assert np.allclose(batch.positions[:5, 0], range(5))
+        assert np.allclose(batch.sizes[:5], 1.0)
+
+    def test_invalid_chunk_size(self):
+        """Test that a chunk size below one is rejected."""
+        with pytest.raises(ValueError):
+            InstanceBatch("cube", chunk_size=0)
+
+
+class TestInstancedVPythonRenderer:
+    """Test drawing repeated shapes as one compound per chunk."""
+
+    def setup_method(self):
+        """Set up a renderer with mocked VPython."""
+        self.available_patcher = patch('engraf.visualizer.renderers.vpython_renderer.VPYTHON_AVAILABLE', True)
+        self.vp_patcher = patch('engraf.visualizer.renderers.vpython_renderer.vp')
+        self.available_patcher.start()
+        self.mock_vp = self.vp_patcher.start()
+        self.mock_vp.vector = Mock(side_effect=lambda x, y, z: (x, y, z))
+        self.mock_vp.box = Mock(side_effect=lambda **kwargs: Mock(clone=Mock(side_effect=lambda **kw: Mock(**kw))))
+        self.mock_vp.compound = Mock(side_effect=lambda parts: Mock(parts=parts))
+        self.renderer = InstancedVPythonRenderer(headless=True, chunk_size=1000)
+
+    def teardown_method(self):
+        """Stop the VPython patches."""
+        self.vp_patcher.stop()
+        self.available_patcher.stop()
+
+    @pytest.fixture(autouse=True)
+    def setup_scene(self, make_object):
+        """Set up a row of 2500 cubes."""
+        self.scene = SceneModel()
+        self.scene.add_objects([make_object(f"cube-{index}", locX=float(index)) for index in range(2500)])
+
+    def test_one_compound_per_chunk(self):
+        """Test that 2500 cubes become three compounds cloned from one primitive."""
+        self.renderer.render_scene(self.scene)
+
+        assert self.mock_vp.box.call_count == 1  # The unit primitive
+        assert self.mock_vp.compound.call_count == 3
+        assert len(self.renderer._chunks) == 3
+        assert self.renderer.get_object_info("cube-1234")["position"] == [1234.0, 0.0, 0.0]
+
+    def test_update_redraws_only_its_chunk(self):
+        """Test that an update rebuilds only the chunk holding the object."""
+        self.renderer.render_scene(self.scene)
+        old_chunks = dict(self.renderer._chunks)
+
+        cube = self.scene.find_object_by_id("cube-1500")
+        cube.vector['locY'] = 2.0
+        self.renderer.update_object(cube)
+        self.renderer.flush()
+
+        assert self.mock_vp.compound.call_count == 4
+        assert old_chunks[("cube", 1)].visible is False
+        assert self.renderer._chunks[("cube", 0)] is old_chunks[("cube", 0)]
+        assert self.renderer.get_object_info("cube-1500")["position"] == [1500.0, 2.0, 0.0]
+
+    def test_remove_object(self):
+        """Test that a removed object leaves its batch and chunk."""
+        self.renderer.render_scene(self.scene)
+
+        self.renderer.remove_object("cube-7")
+        self.renderer.flush()
+
+        assert self.renderer.get_object_info("cube-7") is None
+        assert len(self.renderer.batches["cube"]) == 2499
+        assert len(self.renderer._chunks[("cube", 0)].parts) == 1000
+
+    def test_compounds_are_instanced_from_one_template(self, make_object):
+        """Test that tables are cloned from one unit table built from one compound template."""
+        self.mock_vp.vector = FakeVector
+        for index in range(3):
+            self.renderer.render_object(make_object(f"table-{index}", name="table", locX=float(index)))
+        self.renderer.flush()
+
+        unit = self.renderer._unit_primitives["table"]
+        assert self.mock_vp.box.call_count == 5  # Top and legs of the template
+        assert self.mock_vp.compound.call_count == 2  # The template and one chunk
+        assert unit.clone.call_count == 3
+        assert len(self.renderer._chunks[("table", 0)].parts) == 3
+        assert self.renderer.get_object_info("table-2")["position"] == [2.0, 0.0, 0.0]
+
+    def test_vpython_options(self):
+        """Test that pool_size is passed on and per-object drawing options are rejected."""
+        renderer = create_renderer("instanced", headless=True, pool_size=8)
+
+        assert isinstance(renderer, InstancedVPythonRenderer)
+        assert renderer.pool_size == 8
+        with pytest.raises(ValueError):
+            create_renderer("instanced", headless=True, fps=30)
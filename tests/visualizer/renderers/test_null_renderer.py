@@ -0,0 +1,51 @@
+"""
+Tests for the null renderer and the headless interpreter default.
+"""
+
+import subprocess
+import sys
+
+import pytest
+from engraf.visualizer.renderers.null_renderer import NullRenderer
+from engraf.visualizer.scene.scene_model import SceneModel
+from engraf.visualizer.scene.scene_object import SceneObject
+from latn.lexer.vector_space import VectorSpace
+
+
+class TestNullRenderer:
+    """Test the NullRenderer class functionality."""
+
+    def test_accepts_every_call(self):
+        """Test that every renderer call is accepted and does nothing."""
+        renderer = NullRenderer()
+        scene = SceneModel()
+        cube = SceneObject(name="cube", vector=VectorSpace(), object_id="cube_1")
+        scene.add_object(cube)
+
+        renderer.render_scene(scene)
+        renderer.render_object(cube)
+        renderer.update_object(cube)
+        renderer.remove_object("cube_1")
+        renderer.apply_scene_diff(scene, None)
+        renderer.clear_scene()
+        renderer.close()
+
+        assert renderer.headless
+
+    def test_interpreter_defaults_to_null_renderer(self):
+        """Test that an interpreter without a renderer gets a NullRenderer."""
+        from engraf.interpreter.sentence_interpreter import SentenceInterpreter
+
+        interpreter = SentenceInterpreter()
+
+        assert isinstance(interpreter.renderer, NullRenderer)
+
+    def test_import_does_not_load_vpython(self):
+        """Test that importing the interpreter and VPython renderer leaves vpython unloaded."""
+        code = ("import sys; import engraf.interpreter; "
+                "import engraf.visualizer.renderers.vpython_renderer; "
+                "print('vpython' in sys.modules)")
+
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+
+        assert output.stdout.strip() == "False"
@@ -0,0 +1,97 @@
+"""
+Tests for the shared-memory transform buffer and the out-of-process renderer.
+"""
+
+import numpy as np
+import pytest
+from engraf.visualizer.renderers.process_renderer import ProcessRenderer, TransformBuffer, object_row
+from engraf.visualizer.scene.scene_model import SceneModel
+
+RED = (1.0, 0.0, 0.0)
+
+
+class TestTransformBuffer:
+    """Test sharing rows and change frames between two attachments."""
+
+    def setup_method(self):
+        """Set up a small buffer and a second attachment reading it."""
+        self.writer = TransformBuffer(capacity=4, frames=4, frame_rows=3)
+        self.reader = TransformBuffer.attach(self.writer.spec)
+
+    def teardown_method(self):
+        """Release both attachments."""
+        self.reader.close()
+        self.writer.close()
+
+    def test_rows_and_frames_are_shared(self, make_object):
+        """Test that rows and published frames are visible to the reader."""
+        self.writer.rows[1] = object_row(make_object("cube-1", color=RED, locX=5.0))
+        self.writer.publish([1])
+        self.writer.publish([1, 2])
+
+        latest, changed = self.reader.read_since(0)
+
+        assert (latest, changed) == (2, {1, 2})
+        assert self.reader.rows[1][0] == 5.0
+        assert self.reader.read_since(2) == (2, set())
+
+    def test_lapped_reader_resyncs(self):
+        """Test that a reader overtaken by the ring is told to resync."""
+        for _ in range(5):
+            self.writer.publish([0])
+
+        assert self.reader.read_since(0) == (5, None)
+        assert self.reader.read_since(2) == (5, {0})
+
+    def test_oversized_frame_means_every_slot(self):
+        """Test that a frame too large to list means every slot changed."""
+        self.writer.publish([0, 1, 2, 3])
+
+        assert self.reader.read_since(0) == (1, None)
+
+    def test_grow_keeps_rows(self):
+        """Test that growing the table keeps existing rows."""
+        self.writer.rows[3] = np.arange(12)
+        self.writer.grow(8)
+        self.reader.remap(self.writer.spec['table'], 8)
+
+        assert self.reader.capacity == 8
+        assert self.reader.rows[3].tolist() == list(range(12))
+
+
+class TestProcessRenderer:
+    """Test driving a software renderer in a child process."""
+
+    @pytest.fixture
+    def renderer(self):
+        """Start a small software renderer process and close it afterwards."""
+        renderer = ProcessRenderer(backend="software", width=40, height=30, capacity=2)
+        yield renderer
+        renderer.close()
+
+    def test_changes_reach_the_renderer_process(self, renderer, make_object):
+        """Test that creations, updates and removals reach the child renderer."""
+        scene = SceneModel()
+        cubes = [make_object(f"cube-{i}", color=RED, locX=float(i)) for i in range(5)]
+        scene.add_objects(cubes)
+        renderer.render_scene(scene)
+
+        cubes[3].move_to(7.0, 1.0, 0.0)
+        renderer.update_object(cubes[3])
+        renderer.remove_object("cube-0")
+
+        assert renderer.get_object_info("cube-3")["position"] == [7.0, 1.0, 0.0]
+        assert renderer.get_object_info("cube-4")["color"] == [1.0, 0.0, 0.0]
+        assert renderer.get_object_info("cube-0") is None
+        assert renderer.call('render_image').shape == (30, 40, 3)
+        assert renderer.stats()['frames_drawn'] >= 1
+
+    def test_clear_scene(self, renderer, make_object):
+        """Test that clearing forgets every object."""
+        scene = SceneModel()
+        scene.add_object(make_object("cube-1", color=RED))
+        renderer.render_scene(scene)
+
+        renderer.clear_scene()
+
+        assert renderer.get_object_info("cube-1") is None
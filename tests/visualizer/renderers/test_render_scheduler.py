@@ -0,0 +1,128 @@
+"""
+Tests for frame-coalesced render scheduling.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+from engraf.visualizer.renderers.render_scheduler import RenderScheduler
+from engraf.visualizer.renderers.vpython_renderer import VPythonRenderer
+from engraf.visualizer.scene.scene_assembly import SceneAssembly
+from engraf.visualizer.scene.scene_model import SceneModel
+from engraf.visualizer.scene.scene_object import SceneObject
+from latn.lexer.vector_space import VectorSpace
+
+
+class FakeClock:
+    """Clock whose sleeps advance time and are recorded."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.waits.append(seconds)
+        self.now += seconds
+
+
+def make_scheduler(clock, fps=10.0):
+    """Build a scheduler that records flushed updates and removals."""
+    updates, removals = [], []
+    clock.waits = []
+    scheduler = RenderScheduler(updates.append, removals.append, fps=fps, wait=clock.sleep, clock=clock)
+    return scheduler, updates, removals
+
+
+class TestRenderScheduler:
+    """Test coalescing updates into frames."""
+
+    def test_duplicate_updates_are_drawn_once(self):
+        """Test that repeated updates to one object are drawn once."""
+        clock = FakeClock()
+        scheduler, updates, _ = make_scheduler(clock)
+        cube = SimpleNamespace(object_id="cube-1")
+        sphere = SimpleNamespace(object_id="sphere-1")
+
+        for obj in [cube, sphere, cube, cube]:
+            scheduler.mark_dirty(obj)
+
+        assert scheduler.flush() == 2
+        assert updates == [cube, sphere]
+        assert scheduler.pending == 0
+
+    def test_at_most_one_flush_per_frame(self):
+        """Test that flushes are spaced at least one frame apart."""
+        clock = FakeClock()
+        scheduler, updates, _ = make_scheduler(clock, fps=10.0)
+        cube = SimpleNamespace(object_id="cube-1")
+
+        scheduler.mark_dirty(cube)
+        assert scheduler.poll() == 1
+
+        clock.now = 0.05
+        scheduler.mark_dirty(cube)
+        assert scheduler.poll() == 0  # Still inside the frame
+
+        assert scheduler.flush() == 1  # Waits out the frame first
+        assert clock.waits == [pytest.approx(0.05)]
+        assert scheduler.flushes == 2
+
+    def test_removal_cancels_pending_update(self):
+        """Test that removing an object drops its pending update."""
+        clock = FakeClock()
+        scheduler, updates, removals = make_scheduler(clock)
+
+        scheduler.mark_dirty(SimpleNamespace(object_id="cube-1"))
+        scheduler.mark_removed("cube-1")
+        scheduler.flush()
+
+        assert updates == []
+        assert removals == ["cube-1"]
+
+    def test_invalid_fps(self):
+        """Test that a non-positive frame rate is rejected."""
+        with pytest.raises(ValueError):
+            RenderScheduler(print, print, fps=0)
+
+
+class TestScheduledVPythonRenderer:
+    """Test the VPython renderer drawing through its scheduler."""
+
+    def setup_method(self):
+        """Set up a headless renderer over a mocked VPython."""
+        self.available_patcher = patch('engraf.visualizer.renderers.vpython_renderer.VPYTHON_AVAILABLE', True)
+        self.vp_patcher = patch('engraf.visualizer.renderers.vpython_renderer.vp')
+        self.available_patcher.start()
+        self.mock_vp = self.vp_patcher.start()
+        self.mock_vp.vector = Mock(side_effect=lambda x, y, z: Mock(x=x, y=y, z=z))
+        self.mock_vp.box = Mock(side_effect=lambda **kwargs: Mock())
+        self.renderer = VPythonRenderer(headless=True, fps=20.0)
+
+    def teardown_method(self):
+        """Stop the VPython patches."""
+        self.vp_patcher.stop()
+        self.available_patcher.stop()
+
+    def test_grouped_transform_is_one_burst(self):
+        """Test that moving an assembly repeatedly redraws each cube once."""
+        scene = SceneModel()
+        cubes = [SceneObject("cube", VectorSpace(), object_id=f"cube-{i}") for i in range(50)]
+        scene.add_objects(cubes)
+        self.renderer.render_scene(scene)
+        assembly = SceneAssembly(name="row", assembly_id="row-1")
+        for cube in cubes:
+            assembly.add_object(cube)
+
+        flushes = self.renderer.scheduler.flushes
+        for _ in range(3):
+            assembly.move_to(1.0, 0.0, 0.0)
+            for cube in assembly.objects:
+                self.renderer.update_object(cube)
+        self.renderer.render_scene(scene)
+
+        assert self.mock_vp.box.call_count == 50
+        assert self.renderer.scheduler.flushes - flushes == 1
+        assert self.renderer.scheduler.pending == 0
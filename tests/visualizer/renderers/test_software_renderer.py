@@ -0,0 +1,135 @@
+"""
+Tests for shape triangulation and the offscreen software renderer.
+"""
+
+import struct
+import zlib
+
+import numpy as np
+import pytest
+from engraf.visualizer.renderers.shape_meshes import rotation_matrices, scene_triangles, shape_of, unit_mesh
+from engraf.visualizer.renderers.software_renderer import SoftwareRenderer, write_png
+from engraf.visualizer.renderers.vpython_renderer import create_renderer
+from engraf.visualizer.scene.scene_model import SceneModel
+from engraf.visualizer.transforms.transform_matrix import TransformMatrix
+
+SHAPES = ["cube", "sphere", "cylinder", "cone", "pyramid", "arch", "table"]
+
+
+class TestShapeMeshes:
+    """Test the unit meshes and their placement."""
+
+    @pytest.mark.parametrize("shape_name", SHAPES)
+    def test_meshes_are_closed_and_outward(self, shape_name):
+        """Test that every edge is shared by two triangles and the volume is positive."""
+        vertices, faces = unit_mesh(shape_name)
+        corners = vertices[faces]
+
+        edges = np.sort(np.concatenate([faces[:, [0, 1]], faces[:, [1, 2]], faces[:, [2, 0]]]), axis=1)
+        _, uses = np.unique(edges, axis=0, return_counts=True)
+        volume = np.einsum('ij,ij->i', corners[:, 0], np.cross(corners[:, 1], corners[:, 2])).sum() / 6
+
+        assert np.all(uses == 2)
+        assert volume > 0
+
+    def test_unknown_shapes_are_cubes(self, make_object):
+        """Test mapping object names to mesh shapes."""
+        assert shape_of(make_object("box-1", "box")) == "cube"
+        assert shape_of(make_object("e-1", "ellipsoid")) == "sphere"
+        assert shape_of(make_object("w-1", "widget")) == "cube"
+
+    def test_rotation_matches_transform_matrix(self):
+        """Test that rotation_matrices agrees with TransformMatrix."""
+        angles = np.array([[30.0, 45.0, 60.0]])
+        expected = TransformMatrix.rotation_z(60.0).compose(
+            TransformMatrix.rotation_y(45.0).compose(TransformMatrix.rotation_x(30.0))).matrix[:3, :3]
+
+        assert np.allclose(rotation_matrices(angles)[0], expected)
+
+    def test_scene_triangles_are_placed(self, make_object):
+        """Test that triangles are scaled, moved and attributed to their objects."""
+        objects = [make_object("cube-1", locX=10.0, scale=2.0), make_object("sphere-1", "sphere")]
+
+        triangles, colors, owners = scene_triangles(objects)
+
+        cube = triangles[owners == 0]
+        assert len(cube) == 12
+        assert np.allclose(cube.reshape(-1, 3).min(axis=0), (9.0, -1.0, -1.0))
+        assert len(triangles) == len(colors) == 12 + len(unit_mesh("sphere")[1])
+
+
+class TestSoftwareRenderer:
+    """Test rasterizing scenes offscreen."""
+
+    def setup_method(self):
+        """Set up an 80x60 renderer looking down -Z."""
+        self.renderer = SoftwareRenderer(width=80, height=60)
+        self.renderer.set_camera((0.0, 0.0, 10.0), (0.0, 0.0, 0.0))
+
+    def test_empty_scene_is_background(self):
+        """Test that an empty scene is all background."""
+        image = self.renderer.render_image()
+
+        assert image.shape == (60, 80, 3)
+        assert np.all(image == 51)
+
+    def test_nearer_object_wins(self, make_object):
+        """Test that the depth buffer keeps the nearer surface."""
+        scene = SceneModel()
+        scene.add_objects([
+            make_object("far", locZ=-5.0, scale=8.0, color=(1.0, 0.0, 0.0)),
+            make_object("near", color=(0.0, 0.0, 1.0)),
+        ])
+        self.renderer.render_scene(scene)
+
+        image = self.renderer.render_image()
+
+        center, beside = image[30, 40], image[30, 48]
+        assert center[2] > 0 and center[0] == 0
+        assert beside[0] > 0 and beside[2] == 0
+        assert np.all(image[0, 0] == 51)
+
+    def test_updates_and_removal(self, make_object):
+        """Test that moved and removed objects leave the image."""
+        cube = make_object("cube-1", color=(0.0, 1.0, 0.0))
+        self.renderer.render_object(cube)
+
+        cube.vector['locX'] = 100.0
+        self.renderer.update_object(cube)
+        assert self.renderer.get_object_info("cube-1")["position"] == [100.0, 0.0, 0.0]
+        assert np.all(self.renderer.render_image() == 51)
+
+        self.renderer.remove_object("cube-1")
+        assert self.renderer.get_object_info("cube-1") is None
+
+    @pytest.mark.parametrize("shape_name", SHAPES)
+    def test_every_shape_draws(self, shape_name, make_object):
+        """Test that each shape covers some pixels."""
+        self.renderer.render_object(make_object("obj-1", shape_name, scale=3.0, color=(1.0, 1.0, 1.0), rotY=30.0))
+
+        assert np.any(self.renderer.render_image() != 51)
+
+    def test_save_png(self, tmp_path, make_object):
+        """Test that the PNG holds exactly the rendered image."""
+        self.renderer.render_object(make_object("sphere-1", "sphere", scale=4.0, color=(1.0, 0.0, 0.0)))
+        path = tmp_path / "snapshot.png"
+
+        image = self.renderer.save_png(str(path))
+
+        data = path.read_bytes()
+        assert data[:8] == b'\x89PNG\r\n\x1a\n'
+        width, height = struct.unpack('>II', data[16:24])
+        assert (width, height) == (80, 60)
+        idat_length = struct.unpack('>I', data[33:37])[0]
+        rows = np.frombuffer(zlib.decompress(data[41:41 + idat_length]), dtype=np.uint8).reshape(60, 1 + 80 * 3)
+        assert np.array_equal(rows[:, 1:].reshape(60, 80, 3), image)
+
+    def test_write_png_single_pixel(self, tmp_path):
+        """Test writing the smallest image."""
+        write_png(str(tmp_path / "one.png"), np.zeros((1, 1, 3), dtype=np.uint8))
+
+        assert (tmp_path / "one.png").stat().st_size > 0
+
+    def test_factory(self):
+        """Test creating the renderer through create_renderer."""
+        assert isinstance(create_renderer(backend="software", width=40, height=30), SoftwareRenderer)
@@ -0,0 +1,144 @@
+"""
+Tests for view frustum culling and level-of-detail selection.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+from engraf.visualizer.renderers.view_culling import FULL, HIDDEN, PROXY, ViewCuller, bounding_spheres
+from engraf.visualizer.renderers.vpython_renderer import VPythonRenderer
+from engraf.visualizer.scene.scene_model import SceneModel
+
+
+class TestViewCuller:
+    """Test frustum and distance classification."""
+
+    def setup_method(self):
+        """Set up a culler with the camera at z=10 looking at the origin."""
+        self.culler = ViewCuller(detail_distance=20.0)
+        self.culler.set_camera((0.0, 0.0, 10.0), (0.0, 0.0, 0.0))
+
+    def test_bounding_spheres(self, make_object):
+        """Test that a cube's sphere is centered on it and reaches its corners."""
+        centers, radii = bounding_spheres([make_object("cube-1", locX=1.0, scale=2.0)])
+
+        assert centers.tolist() == [[1.0, 0.0, 0.0]]
+        assert radii[0] == pytest.approx(3 ** 0.5)
+
+    def test_levels(self, make_object):
+        """Test full, hidden and proxy levels around the camera."""
+        objects = [
+            make_object("ahead"),
+            make_object("behind", locZ=20.0),
+            make_object("aside", locX=100.0),
+            make_object("distant", locZ=-40.0),
+        ]
+
+        assert self.culler.levels(objects) == [FULL, HIDDEN, HIDDEN, PROXY]
+
+    def test_bounding_sphere_straddling_the_frustum_is_kept(self, make_object):
+        """Test that an object partly inside the frustum is drawn."""
+        # Center just outside the right plane at this depth, but the sphere reaches in
+        edge = 10.0 * (4 / 3) * (3 ** -0.5)
+        assert self.culler.level(make_object("edge", locX=edge + 1.0, scale=4.0)) == FULL
+        assert self.culler.level(make_object("edge", locX=edge + 5.0)) == HIDDEN
+
+    def test_keep_distance(self, make_object):
+        """Test that objects near the camera are kept even behind it."""
+        culler = ViewCuller(keep_distance=15.0)
+        culler.set_camera((0.0, 0.0, 10.0), (0.0, 0.0, 0.0))
+
+        assert culler.level(make_object("behind", locZ=20.0)) == FULL
+
+    def test_everything_is_full_without_a_camera(self, make_object):
+        """Test that nothing is culled before a camera is set."""
+        assert ViewCuller().levels([make_object("behind", locZ=1e6)]) == [FULL]
+
+    def test_invalid_camera(self):
+        """Test that a camera looking at its own position is rejected."""
+        with pytest.raises(ValueError):
+            self.culler.set_camera((1.0, 1.0, 1.0), (1.0, 1.0, 1.0))
+
+
+class FakeVector:
+    """Stand-in for vpython.vector that supports addition."""
+
+    def __init__(self, x, y, z):
+        self.x, self.y, self.z = x, y, z
+
+    def __add__(self, other):
+        return FakeVector(self.x + other.x, self.y + other.y, self.z + other.z)
+
+
+class TestCulledVPythonRenderer:
+    """Test VPythonRenderer drawing only what its culler keeps."""
+
+    def setup_method(self):
+        """Set up a renderer with mocked VPython and a culler."""
+        self.available_patcher = patch('engraf.visualizer.renderers.vpython_renderer.VPYTHON_AVAILABLE', True)
+        self.vp_patcher = patch('engraf.visualizer.renderers.vpython_renderer.vp')
+        self.available_patcher.start()
+        self.mock_vp = self.vp_patcher.start()
+        self.mock_vp.vector = FakeVector
+        for primitive in ('box', 'sphere', 'simple_sphere'):
+            setattr(self.mock_vp, primitive, Mock(side_effect=lambda **kwargs: Mock()))
+        self.mock_vp.compound = Mock(side_effect=lambda parts: Mock(clone=Mock(side_effect=lambda **kwargs: Mock())))
+
+        self.culler = ViewCuller(detail_distance=20.0)
+        self.culler.set_camera((0.0, 0.0, 10.0), (0.0, 0.0, 0.0))
+        self.renderer = VPythonRenderer(headless=True, culler=self.culler)
+
+    def teardown_method(self):
+        """Stop the VPython patches."""
+        self.vp_patcher.stop()
+        self.available_patcher.stop()
+
+    @pytest.fixture(autouse=True)
+    def setup_scene(self, make_object):
+        """Set up near and far objects in front of the camera and one behind it."""
+        self.scene = SceneModel()
+        self.scene.add_objects([
+            make_object("near-sphere", "sphere"),
+            make_object("far-sphere", "sphere", locZ=-40.0),
+            make_object("far-table", "table", locX=5.0, locZ=-40.0),
+            make_object("behind", locZ=30.0),
+        ])
+
+    def test_only_visible_objects_get_primitives(self):
+        """Test that hidden objects get no primitive and distant ones get proxies."""
+        self.renderer.render_scene(self.scene)
+
+        assert set(self.renderer.rendered_objects) == {"near-sphere", "far-sphere", "far-table"}
+        assert self.renderer._rendered_shapes["far-sphere"] == "simple_sphere"
+        assert self.renderer._rendered_shapes["far-table"] == "cube"
+        assert self.mock_vp.compound.call_count == 0  # No full-detail table was built
+
+        # Re-rendering does not revisit culled objects
+        self.renderer.render_scene(self.scene)
+        assert self.mock_vp.box.call_count == 1
+
+    def test_camera_move_updates_only_changed_objects(self):
+        """Test that moving the camera redraws only objects whose level changed."""
+        self.renderer.render_scene(self.scene)
+        near_sphere = self.renderer.rendered_objects["near-sphere"]
+
+        # Turn around: the cube behind comes into view, everything else leaves it
+        self.renderer.set_camera((0.0, 0.0, 10.0), (0.0, 0.0, 40.0))
+        assert set(self.renderer.rendered_objects) == {"behind"}
+        assert near_sphere.visible is False
+
+        # Walk up to the far objects: they switch to full detail
+        self.renderer.set_camera((0.0, 0.0, -30.0), (0.0, 0.0, -40.0))
+        assert set(self.renderer.rendered_objects) == {"far-sphere", "far-table"}
+        assert self.renderer._rendered_shapes["far-sphere"] == "sphere"
+        assert self.renderer._rendered_shapes["far-table"] == "table"
+        assert self.renderer.update_visibility() == 0
+
+    def test_removed_objects_are_forgotten(self):
+        """Test that removed objects do not come back when the camera turns."""
+        self.renderer.render_scene(self.scene)
+
+        self.renderer.remove_object("behind")
+        self.renderer.set_camera((0.0, 0.0, 10.0), (0.0, 0.0, 40.0))
+
+        assert "behind" not in self.renderer.rendered_objects
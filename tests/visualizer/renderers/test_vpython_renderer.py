@@ -4,6 +4,8 @@ Tests for the VPython renderer.
 Tests both the real VPython renderer and the mock renderer for compatibility.
 """
 
+import logging
+
 import pytest
 import numpy as np
 from unittest.mock import Mock, patch, MagicMock
@@ -368,14 +370,15 @@ class TestRendererFactory:
         with pytest.raises(ValueError, match="Unknown renderer backend"):
             create_renderer(backend="unknown")
     
-    def test_fallback_to_mock_when_vpython_unavailable(self):
+    def test_fallback_to_mock_when_vpython_unavailable(self, caplog):
         """Test fallback to mock renderer when VPython is not available."""
         with patch('engraf.visualizer.renderers.vpython_renderer.VPYTHON_AVAILABLE', False):
-            with patch('builtins.print') as mock_print:
+            with caplog.at_level(logging.WARNING, logger='engraf.visualizer.renderers.vpython_renderer'):
                 renderer = create_renderer(backend="vpython")
                 
                 assert isinstance(renderer, MockVPythonRenderer)
-                mock_print.assert_called_once_with("Warning: VPython not available, using mock renderer")
+                assert [record.getMessage() for record in caplog.records] == [
+                    "VPython not available, using mock renderer"]
 
 
 class TestRendererIntegration:
@@ -480,3 +483,117 @@ class TestRendererIntegration:
         self.renderer.render_scene(self.scene)
         assert len(self.renderer.rendered_objects) == 3
         assert "cylinder" in self.renderer.rendered_objects
+
+
+class FakeVector:
+    """Stands in for vp.vector: components and addition."""
+    
+    def __init__(self, x, y, z):
+        self.x, self.y, self.z = x, y, z
+    
+    def __add__(self, other):
+        return FakeVector(self.x + other.x, self.y + other.y, self.z + other.z)
+
+
+class TestInPlaceUpdates:
+    """VPythonRenderer updates existing primitives instead of rebuilding them."""
+    
+    def setup_method(self):
+        """Set up a headless renderer over a mocked vpython module."""
+        self.available_patcher = patch('engraf.visualizer.renderers.vpython_renderer.VPYTHON_AVAILABLE', True)
+        self.vp_patcher = patch('engraf.visualizer.renderers.vpython_renderer.vp')
+        self.available_patcher.start()
+        self.mock_vp = self.vp_patcher.start()
+        self.mock_vp.vector = FakeVector
+        self.mock_vp.box = Mock(side_effect=lambda **kwargs: Mock())
+        self.mock_vp.sphere = Mock(side_effect=lambda **kwargs: Mock())
+        self.mock_vp.cylinder = Mock(side_effect=lambda **kwargs: Mock())
+        self.mock_vp.compound = Mock(side_effect=lambda parts: Mock(clone=Mock(side_effect=lambda **kwargs: Mock())))
+        self.renderer = VPythonRenderer(headless=True)
+    
+    def teardown_method(self):
+        self.vp_patcher.stop()
+        self.available_patcher.stop()
+    
+    def test_move_updates_existing_primitive(self, make_object):
+        """Test that moving an object updates its primitive in place."""
+        obj = make_object("cube-1")
+        self.renderer.render_object(obj)
+        primitive = self.renderer.rendered_objects["cube-1"]
+        
+        obj.vector['locX'] = 3.0
+        self.renderer.update_object(obj)
+        
+        assert self.mock_vp.box.call_count == 1
+        assert self.renderer.rendered_objects["cube-1"] is primitive
+        assert primitive.pos.x == 3.0
+        primitive.rotate.assert_not_called()
+    
+    def test_orientation_is_absolute(self, make_object):
+        """Test that rotations set the orientation rather than adding to it."""
+        obj = make_object("cube-1", rotZ=90.0)
+        self.renderer.render_object(obj)
+        primitive = self.renderer.rendered_objects["cube-1"]
+        
+        assert (primitive.axis.x, primitive.axis.y) == pytest.approx((0.0, 1.0))
+        assert (primitive.up.x, primitive.up.y) == pytest.approx((-1.0, 0.0))
+        
+        obj.vector['rotZ'] = 0.0
+        self.renderer.update_object(obj)
+        
+        assert (primitive.axis.x, primitive.axis.y, primitive.axis.z) == pytest.approx((1.0, 0.0, 0.0))
+    
+    def test_shape_change_rebuilds_primitive(self, make_object):
+        """Test that changing the shape replaces the primitive."""
+        obj = make_object("cube-1")
+        self.renderer.render_object(obj)
+        old = self.renderer.rendered_objects["cube-1"]
+        
+        obj.name = "sphere"
+        self.renderer.update_object(obj)
+        
+        assert old.visible == False
+        self.mock_vp.sphere.assert_called_once()
+        assert self.renderer.rendered_objects["cube-1"] is not old
+    
+    def test_compounds_are_cloned_from_one_template(self):
+        """Test that compound objects are cloned from one built template."""
+        for i in range(3):
+            self.renderer.render_object(SceneObject("table", VectorSpace(), object_id=f"table-{i}"))
+        
+        assert self.mock_vp.compound.call_count == 1
+        assert self.mock_vp.box.call_count == 5
+        assert len({id(primitive) for primitive in self.renderer.rendered_objects.values()}) == 3
+    
+    def test_released_primitives_are_reused(self, make_object):
+        """Test that a removed primitive is reset and reused."""
+        obj = make_object("cube-1", rotZ=90.0)
+        self.renderer.render_object(obj)
+        released = self.renderer.rendered_objects["cube-1"]
+        self.renderer.remove_object("cube-1")
+        
+        self.renderer.render_object(SceneObject("cube", VectorSpace(), object_id="cube-2"))
+        
+        assert self.mock_vp.box.call_count == 1
+        assert self.renderer.rendered_objects["cube-2"] is released
+        assert released.visible == True
+        assert (released.axis.x, released.axis.y) == pytest.approx((1.0, 0.0))
+    
+    def test_clear_scene_hides_everything_in_one_pass(self):
+        """Test that clearing hides every primitive, including strays."""
+        cubes = [SceneObject("cube", VectorSpace(), object_id=f"cube-{i}") for i in range(2000)]
+        for cube in cubes:
+            self.renderer.render_object(cube)
+        primitives = list(self.renderer.rendered_objects.values())
+        stray = Mock(visible=True)
+        self.renderer.headless = False
+        self.renderer.scene = Mock(objects=primitives + [stray])
+        
+        assert self.renderer.entity_id_for(primitives[5]) == "cube-5"
+        
+        self.renderer.clear_scene()
+        
+        assert self.renderer.rendered_objects == {}
+        assert self.renderer.entity_id_for(primitives[5]) is None
+        assert stray.visible == False
+        assert all(primitive.visible == False for primitive in primitives)
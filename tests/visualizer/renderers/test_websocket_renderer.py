@@ -0,0 +1,128 @@
+"""
+Tests for the WebSocket delta-streaming renderer and its headless client.
+"""
+
+import asyncio
+import urllib.request
+
+import pytest
+from engraf.visualizer.renderers.websocket_renderer import (REMOVE, UPDATE, DeltaClient, WebSocketRenderer,
+                                                           _ClientState)
+from engraf.visualizer.scene.scene_diff import SceneDiff
+from engraf.visualizer.scene.scene_model import SceneModel
+
+RED = (1.0, 0.0, 0.0)
+
+
+@pytest.fixture
+def renderer():
+    """Serve on a free port and stop serving afterwards."""
+    renderer = WebSocketRenderer(port=0)
+    yield renderer
+    renderer.close()
+
+
+@pytest.fixture
+def scene(make_object):
+    """A row of five red cubes."""
+    scene = SceneModel()
+    scene.add_objects([make_object(f"cube-{i}", color=RED, locX=float(i)) for i in range(5)])
+    return scene
+
+
+def connect(renderer):
+    """Connect a headless client."""
+    # The server registers a client before answering its handshake
+    return DeltaClient("127.0.0.1", renderer.port)
+
+
+class TestWebSocketRenderer:
+    """Test streaming changes to a connected client."""
+
+    def test_late_joiner_gets_snapshot(self, renderer, scene):
+        """Test that a client connecting after edits receives the whole scene and camera."""
+        renderer.render_scene(scene)
+        renderer.set_camera((0.0, 5.0, 20.0), (0.0, 0.0, 0.0))
+
+        client = connect(renderer)
+        client.receive_until(lambda c: len(c.objects) == 5 and c.camera is not None)
+
+        assert client.objects["cube-3"] == {"shape": "cube", "row": [3.0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0]}
+        assert client.camera == {"position": [0.0, 5.0, 20.0], "target": [0.0, 0.0, 0.0]}
+        client.close()
+
+    def test_deltas_follow_edits(self, renderer, scene):
+        """Test that an edit sends only the changed objects."""
+        renderer.render_scene(scene)
+        client = connect(renderer)
+        client.receive_until(lambda c: len(c.objects) == 5)
+        before = client.bytes_received
+
+        cube = scene.find_object_by_id("cube-2")
+        cube.move_to(7.0, 1.0, 0.0)
+        renderer.apply_scene_diff(scene, SceneDiff(added=[], removed=["cube-0"], changed=["cube-2"]))
+
+        assert client.receive() == REMOVE
+        assert client.receive() == UPDATE
+        assert "cube-0" not in client.objects
+        assert client.objects["cube-2"]["row"][:3] == [7.0, 1.0, 0.0]
+        # One handle and one row, not the scene
+        assert client.bytes_received - before < 100
+        client.close()
+
+    def test_clear_scene(self, renderer, scene, make_object):
+        """Test that clearing empties the client before new objects arrive."""
+        renderer.render_scene(scene)
+        client = connect(renderer)
+        client.receive_until(lambda c: len(c.objects) == 5)
+
+        renderer.clear_scene()
+        renderer.render_object(make_object("cube-9", color=RED))
+
+        client.receive_until(lambda c: list(c.objects) == ["cube-9"])
+        assert renderer.get_object_info("cube-1") is None
+        client.close()
+
+    def test_serves_browser_client(self, renderer):
+        """Test that a plain GET returns the bundled page."""
+        with urllib.request.urlopen(f"http://127.0.0.1:{renderer.port}/") as response:
+            assert b"new WebSocket" in response.read()
+
+
+class TestClientState:
+    """Pending change sets merge while a client is backed up."""
+
+    def setup_method(self):
+        """Set up a client state on an idle event loop."""
+        self.loop = asyncio.new_event_loop()
+        self.client = _ClientState(self.loop)
+
+    def teardown_method(self):
+        """Close the event loop."""
+        self.loop.close()
+
+    def test_repeated_updates_send_once(self):
+        """Test that many updates to one object merge into one."""
+        for _ in range(100):
+            self.client.update(1)
+
+        assert self.client.take() == (False, [], [], [1], False)
+        assert not self.client.pending
+
+    def test_created_then_removed_is_never_sent(self):
+        """Test that an object created and removed between sends is dropped."""
+        self.client.create(1)
+        self.client.update(1)
+        self.client.remove(1)
+        self.client.update(2)
+        self.client.remove(2)
+
+        assert self.client.take() == (False, [2], [], [], False)
+
+    def test_reset_drops_pending_changes(self):
+        """Test that a clear replaces earlier pending changes."""
+        self.client.update(1)
+        self.client.reset()
+        self.client.create(2)
+
+        assert self.client.take() == (True, [], [2], [], False)
@@ -0,0 +1,105 @@
+"""
+Unit tests for the bitset attribute index kept by SceneModel.
+"""
+
+import pytest
+from engraf.visualizer.scene.attribute_index import AttributeIndex, size_category
+from engraf.visualizer.scene.scene_assembly import SceneAssembly
+from engraf.visualizer.scene.scene_model import SceneModel
+
+
+class TestAttributeIndex:
+    """Test selecting objects through the bitset index."""
+
+    @pytest.fixture
+    def index(self, make_object):
+        """Index a red cube, a large pale red cube and a small purple sphere."""
+        index = AttributeIndex()
+        index.add(make_object("cube-1", red=1.0))
+        index.add(make_object("cube-2", red=0.3, scale=2.0))
+        index.add(make_object("sphere-1", "sphere", red=1.0, blue=1.0, scale=0.5))
+        return index
+
+    def test_select_combines_predicates(self, index):
+        """Test that noun, color and size predicates intersect."""
+        assert index.ids(index.select(noun="cube")) == ["cube-1", "cube-2"]
+        assert index.ids(index.select(colors=["red"])) == ["cube-1", "sphere-1"]
+        assert index.ids(index.select(noun="cube", colors_present=["red"])) == ["cube-1", "cube-2"]
+        assert index.ids(index.select(colors=["red", "blue"])) == ["sphere-1"]
+        assert index.ids(index.select(size="large")) == ["cube-2"]
+
+    def test_count_is_popcount(self, index):
+        """Test counting the objects in a selection."""
+        assert index.count(index.select(noun="cube")) == 2
+        assert index.count(index.select(noun="cylinder")) == 0
+
+    def test_remove_clears_bits(self, index):
+        """Test that a removed object leaves every selection."""
+        index.remove("cube-1")
+
+        assert "cube-1" not in index
+        assert index.ids(index.select(colors=["red"])) == ["sphere-1"]
+        assert len(index) == 2
+
+    def test_compaction_keeps_selections(self, make_object):
+        """Test that compacting freed slots keeps selections intact."""
+        index = AttributeIndex()
+        for i in range(100):
+            index.add(make_object(f"cube-{i}", red=float(i % 2)))
+        for i in range(80):
+            index.remove(f"cube-{i}")
+
+        assert len(index) == 20
+        assert index.live.bit_length() <= 100 - 80 + 64
+        assert index.count(index.select(colors=["red"])) == 10
+
+    def test_size_category(self, make_object):
+        """Test the small, normal and large scale boundaries."""
+        assert size_category(make_object("a", scale=2.0)) == 'large'
+        assert size_category(make_object("b", scale=0.5)) == 'small'
+        assert size_category(make_object("c")) == 'normal'
+
+
+class TestSceneModelIndex:
+    """Test that SceneModel keeps its attribute index in step."""
+
+    def test_scene_keeps_index_current(self, make_object):
+        """Test that refreshes and removals update the index."""
+        scene = SceneModel()
+        cube = make_object("cube-1")
+        scene.add_object(cube)
+        scene.add_object(make_object("cube-2", red=1.0))
+        index = scene.attribute_index
+
+        cube.vector['red'] = 1.0
+        scene.refresh_attributes(cube)
+        assert index.count(index.select(noun="cube", colors=["red"])) == 2
+
+        scene.remove_object("cube-2")
+        assert index.ids(index.select(noun="cube")) == ["cube-1"]
+
+    def test_assembly_membership(self, make_object):
+        """Test tracking objects moved into and out of assemblies."""
+        scene = SceneModel()
+        scene.add_object(make_object("cube-1"))
+        assembly = SceneAssembly(name="group", assembly_id="group-1")
+        scene.add_assembly(assembly)
+        index = scene.attribute_index
+
+        scene.move_object_to_assembly("cube-1", "group-1")
+        assert index.count(index.select(noun="cube", in_assembly=False)) == 0
+        assert index.count(index.select(noun="cube", in_assembly=True)) == 1
+
+        scene.extract_object_from_assembly("cube-1")
+        assert index.count(index.select(noun="cube", in_assembly=False)) == 1
+
+    def test_copy_and_clear(self, make_object):
+        """Test that a scene copy keeps its own index after the original is cleared."""
+        scene = SceneModel()
+        scene.add_object(make_object("cube-1", red=1.0))
+
+        copied = scene.copy()
+        scene.clear()
+
+        assert len(scene.attribute_index) == 0
+        assert copied.attribute_index.ids(copied.attribute_index.select(colors=["red"])) == ["cube-1"]
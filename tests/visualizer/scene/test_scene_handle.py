@@ -0,0 +1,69 @@
+"""
+Tests for SceneHandle and scene diffs used by temporal navigation.
+"""
+
+import pytest
+from engraf.visualizer.scene.scene_model import SceneModel, resolve_pronoun
+from engraf.visualizer.scene.scene_handle import SceneHandle
+from engraf.visualizer.scene.scene_diff import diff_scenes
+
+
+class TestSceneHandle:
+    """Test the SceneHandle class functionality."""
+
+    def test_forwards_reads_to_current_scene(self, make_object):
+        """Test that the handle behaves like the scene it points to."""
+        scene = SceneModel()
+        obj = make_object("cube-1")
+        scene.add_object(obj)
+        handle = SceneHandle(scene)
+
+        assert handle.scene is scene
+        assert handle.objects == [obj]
+        assert handle.find_entity_by_id("cube-1") is obj
+        assert resolve_pronoun("it", handle) == [obj]
+
+    def test_swap_is_seen_through_the_handle(self, make_object):
+        """Test that swapping redirects every reader of the handle."""
+        first = SceneModel()
+        second = SceneModel()
+        second.add_object(make_object("sphere-1", name="sphere"))
+        handle = SceneHandle(first)
+
+        previous = handle.swap(second)
+
+        assert previous is first
+        assert handle.scene is second
+        assert [obj.object_id for obj in handle.objects] == ["sphere-1"]
+
+
+class TestSceneDiff:
+    """Test diffing two scenes."""
+
+    def test_identical_scenes(self, make_object):
+        """Test that a scene and its copy have an empty diff."""
+        scene = SceneModel()
+        scene.add_object(make_object("cube-1"))
+
+        diff = diff_scenes(scene, scene.copy())
+
+        assert diff.is_empty()
+        assert len(diff) == 0
+
+    def test_added_removed_and_changed(self, make_object):
+        """Test that each kind of difference is detected."""
+        old = SceneModel()
+        old.add_object(make_object("cube-1"))
+        old.add_object(make_object("cube-2"))
+
+        new = old.copy()
+        new.remove_object("cube-2")
+        new.add_object(make_object("cube-3"))
+        moved = new.find_object_by_id("cube-1")
+        moved.move_to(5.0, 0.0, 0.0)
+
+        diff = diff_scenes(old, new)
+
+        assert diff.added == ["cube-3"]
+        assert diff.removed == ["cube-2"]
+        assert diff.changed == ["cube-1"]
@@ -0,0 +1,117 @@
+"""
+Unit tests for SceneModel transactions (undo log, commit/rollback, nesting).
+"""
+
+import pytest
+from engraf.visualizer.scene.scene_assembly import SceneAssembly
+from engraf.visualizer.scene.scene_model import SceneModel
+
+
+class TestSceneTransaction:
+    """Test the scene's undo log, commit and rollback."""
+
+    @pytest.fixture(autouse=True)
+    def setup_scene(self, make_object):
+        """Set up a scene with a cube and a sphere."""
+        self.make_object = make_object
+        self.scene = SceneModel()
+        self.cube = self.make_object("cube-1")
+        self.scene.add_object(self.cube)
+        self.scene.add_object(self.make_object("sphere-1", "sphere"))
+
+    def test_rollback_restores_touched_fields(self):
+        """Test that rollback restores a touched object's vector and transform."""
+        self.scene.begin_transaction()
+        self.scene.touch(self.cube)
+        self.cube.vector['red'] = 1.0
+        self.cube.move_to(1.0, 2.0, 3.0)
+        self.scene.refresh_attributes(self.cube)
+
+        transaction = self.scene.rollback_transaction()
+
+        assert self.cube.vector['red'] == 0.0
+        assert self.cube.get_position() == (0.0, 0.0, 0.0)
+        assert self.scene.attribute_index.count(self.scene.attribute_index.select(colors=["red"])) == 0
+        assert transaction.diff().changed == ["cube-1"]
+
+    def test_rollback_undoes_structural_changes(self):
+        """Test that rollback undoes additions and removals."""
+        recent = list(self.scene.recent)
+        self.scene.begin_transaction()
+        self.scene.add_object(self.make_object("cube-2"))
+        self.scene.remove_object("cube-1")
+
+        diff = self.scene.rollback_transaction().diff()
+
+        assert [obj.object_id for obj in self.scene.objects] == ["cube-1", "sphere-1"]
+        assert self.scene.recent == recent
+        assert "cube-2" not in self.scene.attribute_index
+        assert diff.removed == ["cube-2"] and diff.added == ["cube-1"]
+
+    def test_rollback_undoes_assembly_membership(self):
+        """Test that rollback moves an object back out of an assembly."""
+        self.scene.add_assembly(SceneAssembly(name="group", assembly_id="group-1"))
+
+        self.scene.begin_transaction()
+        self.scene.move_object_to_assembly("cube-1", "group-1")
+        self.scene.rollback_transaction()
+
+        assembly = self.scene.find_assembly_by_id("group-1")
+        assert assembly.objects == []
+        assert [obj.object_id for obj in self.scene.objects] == ["cube-1", "sphere-1"]
+        index = self.scene.attribute_index
+        assert index.count(index.select(noun="cube", in_assembly=False)) == 1
+
+    def test_rollback_undoes_clear(self):
+        """Test that rollback restores a cleared scene."""
+        self.scene.begin_transaction()
+        self.scene.clear()
+        self.scene.rollback_transaction()
+
+        assert len(self.scene.objects) == 2
+        assert len(self.scene.attribute_index) == 2
+
+    def test_commit_keeps_changes(self):
+        """Test that a committed transaction keeps its changes."""
+        with self.scene.transaction():
+            self.scene.add_object(self.make_object("cube-2"))
+
+        assert not self.scene.in_transaction
+        assert len(self.scene.objects) == 3
+
+    def test_context_manager_rolls_back_on_error(self):
+        """Test that an exception inside transaction() rolls it back."""
+        with pytest.raises(ValueError):
+            with self.scene.transaction():
+                self.scene.add_object(self.make_object("cube-2"))
+                raise ValueError("clause failed")
+
+        assert len(self.scene.objects) == 2
+
+    def test_nested_rollback_keeps_outer_changes(self):
+        """Test that rolling back an inner transaction keeps the outer one's changes."""
+        self.scene.begin_transaction()
+        self.scene.add_object(self.make_object("cube-2"))
+        self.scene.begin_transaction()
+        self.scene.add_object(self.make_object("cube-3"))
+        self.scene.rollback_transaction()
+        self.scene.commit_transaction()
+
+        assert [obj.object_id for obj in self.scene.objects] == ["cube-1", "sphere-1", "cube-2"]
+
+    def test_outer_rollback_undoes_committed_inner(self):
+        """Test that rolling back the outer transaction undoes a committed inner one."""
+        self.scene.begin_transaction()
+        with self.scene.transaction():
+            self.scene.touch(self.cube)
+            self.cube.vector['red'] = 1.0
+        self.scene.rollback_transaction()
+
+        assert self.cube.vector['red'] == 0.0
+
+    def test_touch_outside_transaction_is_noop(self):
+        """Test that touch outside a transaction records nothing."""
+        self.scene.touch(self.cube)
+
+        with pytest.raises(RuntimeError):
+            self.scene.rollback_transaction()
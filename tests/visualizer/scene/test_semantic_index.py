@@ -0,0 +1,119 @@
+"""
+Unit tests for approximate semantic search over scene entities.
+"""
+
+import random
+import pytest
+from types import SimpleNamespace
+from engraf.visualizer.scene.semantic_index import SemanticIndex
+from engraf.visualizer.scene.scene_model import SceneModel
+
+
+@pytest.fixture
+def random_scene(make_object):
+    """Factory for scenes of randomly colored and sized cubes and spheres."""
+    def build(count, seed=0):
+        rng = random.Random(seed)
+        scene = SceneModel()
+        for i in range(count):
+            name = rng.choice(["cube", "sphere"])
+            color = (rng.random(), rng.random(), rng.random())
+            scene.add_object(make_object(f"{name}-{i}", name, scale=rng.uniform(0.5, 2.5), color=color))
+        return scene
+    return build
+
+
+class TestSemanticIndex:
+    """Test the locality-sensitive hash index itself."""
+
+    def test_identical_vector_is_always_found(self, make_object):
+        """Test that an object's own vector always finds it."""
+        index = SemanticIndex(num_tables=4, num_bits=16, probe_radius=0)
+        objects = [make_object(f"cube-{i}", red=i / 10, blue=1 - i / 10) for i in range(10)]
+        index.build(objects)
+
+        for obj in objects:
+            assert obj in index.query(obj.vector)
+
+    def test_incremental_updates(self, make_object):
+        """Test adding, updating and removing single objects."""
+        index = SemanticIndex(num_tables=4, num_bits=8)
+        obj = make_object("cube-1", red=1.0)
+        index.add(obj)
+        assert "cube-1" in index
+
+        obj.vector['blue'] = 1.0
+        index.update(obj)
+        assert obj in index.query(obj.vector)
+
+        index.remove("cube-1")
+        assert "cube-1" not in index
+        assert index.query(obj.vector) == []
+        assert index.named("cube") == []
+
+    def test_named(self, make_object):
+        """Test listing indexed objects by noun."""
+        index = SemanticIndex()
+        index.add(make_object("cube-1"))
+        index.add(make_object("sphere-1", "sphere"))
+
+        assert [obj.object_id for obj in index.named("sphere")] == ["sphere-1"]
+
+    def test_rejects_unsupported_probe_radius(self):
+        """Test that only probe radius 0 or 1 is accepted."""
+        with pytest.raises(ValueError):
+            SemanticIndex(probe_radius=2)
+
+
+class TestApproximateFindNounPhrase:
+    """Test SceneModel.find_noun_phrase switching to the index on large scenes."""
+
+    def test_small_scenes_stay_exact(self, random_scene, make_object):
+        """Test that scenes under the threshold never build an index."""
+        scene = random_scene(50)
+        query = make_object("query", red=1.0).vector
+
+        scene.find_noun_phrase(SimpleNamespace(noun="object", vector=query))
+
+        assert scene.semantic_index is None
+
+    def test_approximate_results_are_exactly_scored(self, random_scene, make_object):
+        """Test that approximate candidates keep their exact similarity scores."""
+        scene = random_scene(400)
+        query = make_object("query", red=1.0, scale=2.0).vector
+        noun_phrase = SimpleNamespace(noun="object", vector=query)
+        exact = scene.find_noun_phrase(noun_phrase)
+
+        scene.ann_threshold = 100
+        approximate = scene.find_noun_phrase(noun_phrase)
+
+        assert scene.semantic_index is not None
+        assert 0 < len(approximate) <= len(exact)
+        exact_scores = {obj.object_id: sim for sim, obj in exact}
+        assert all(sim == exact_scores[obj.object_id] for sim, obj in approximate)
+        assert [sim for sim, _ in approximate] == sorted((sim for sim, _ in approximate), reverse=True)
+
+    def test_small_type_is_scored_exactly(self, random_scene, make_object):
+        """Test that a rare noun is scored exactly rather than through the index."""
+        scene = random_scene(400)
+        scene.add_object(make_object("cone-1", "cone", blue=1.0))
+        scene.ann_threshold = 100
+
+        matches = scene.find_noun_phrase(SimpleNamespace(noun="cone", vector=make_object("q", red=1.0).vector))
+
+        assert [obj.object_id for _, obj in matches] == ["cone-1"]
+
+    def test_index_follows_scene_changes(self, random_scene, make_object):
+        """Test that scene additions, removals and clears reach the index."""
+        scene = random_scene(200)
+        scene.enable_semantic_index()
+        added = make_object("cube-new", red=1.0)
+
+        scene.add_object(added)
+        assert "cube-new" in scene.semantic_index
+
+        scene.remove_object("cube-new")
+        assert "cube-new" not in scene.semantic_index
+
+        scene.clear()
+        assert len(scene.semantic_index) == 0